@@ -28,6 +28,13 @@ class ApplicationTracker:
         print(f"✓ Tracking: {job} at {company}")
         return app
     
+    def find_application(self, job, company):
+        """Most recent tracked application for this job title at this company, or None"""
+        for app in reversed(self.applications):
+            if app['job_title'] == job and app['company'] == company:
+                return app
+        return None
+    
     def update_status(self, app_id, new_status, notes=''):
         """Update application status"""
         app = self._get_app(app_id)
@@ -0,0 +1,237 @@
+import hashlib
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from job_fetcher import RETRY_STATUSES
+
+
+def idempotency_key(job):
+    """Stable key for an application, derived from the job URL (title/company if there is none)"""
+    basis = job.get('url') or f"{job.get('title', '')}|{job.get('company', '')}"
+    return hashlib.sha256(basis.strip().lower().encode('utf-8')).hexdigest()[:32]
+
+
+def retry_after(response):
+    """Seconds a response's Retry-After header asks to wait (delta-seconds or HTTP date), or None"""
+    value = (response.headers.get('Retry-After') or '').strip() if response is not None else ''
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second, bursts of up to ``capacity``"""
+
+    def __init__(self, rate, capacity=1, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        while True:
+            with self._lock:
+                now = self.clock()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            self.sleep(wait)
+
+
+class ATSAdapter:
+    """Applicant-tracking-system target. ``submit`` must be idempotent per key."""
+
+    def submit(self, job, key, applicant):
+        raise NotImplementedError
+
+
+class DryRunATSAdapter(ATSAdapter):
+    """Records submissions locally without contacting anything (the default)"""
+
+    def __init__(self):
+        self.submissions = []
+        self._lock = threading.Lock()
+
+    def submit(self, job, key, applicant):
+        with self._lock:
+            self.submissions.append(key)
+        return {'status': 'Applied'}
+
+
+class HttpATSAdapter(ATSAdapter):
+    """POSTs applications as JSON to ``{base_url}/applications`` with an Idempotency-Key header"""
+
+    def __init__(self, base_url, timeout=10.0, pool_size=8):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.session = requests.Session()
+        pool = HTTPAdapter(pool_maxsize=pool_size)
+        self.session.mount('http://', pool)
+        self.session.mount('https://', pool)
+
+    def submit(self, job, key, applicant):
+        payload = {
+            'job_url': job.get('url', ''),
+            'title': job.get('title', ''),
+            'company': job.get('company', ''),
+            'applicant': applicant or {}
+        }
+        response = self.session.post(f"{self.base_url}/applications", json=payload,
+                                     headers={'Idempotency-Key': key}, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+
+class BatchApplyExecutor:
+    """Submit applications through an ATS adapter from a worker pool.
+
+    - Every job gets an idempotency key from its URL. Retries reuse the key,
+      and jobs already applied to by this executor, or already being
+      submitted (e.g. the same URL twice in one batch), are skipped, so a
+      job is never applied to twice.
+    - Each target domain (the job URL's host) has its own token bucket
+      (``rate_per_domain`` per second, bursts of ``burst``).
+    - At most ``max_in_flight`` submissions are queued or running at once,
+      so a long job list does not pile up in the pool's queue.
+    - Failed submissions (errors other than non-retryable HTTP statuses)
+      are retried ``retries`` times with exponential backoff; a 429/5xx
+      response's Retry-After header, when present, sets the wait instead.
+
+    ``report`` holds throughput, latency percentiles and counts for the
+    last ``run``.
+    """
+
+    def __init__(self, adapter=None, workers=4, max_in_flight=8, rate_per_domain=5.0, burst=2,
+                 retries=2, backoff=0.5, sleep=time.sleep):
+        self.adapter = adapter or DryRunATSAdapter()
+        self.workers = workers
+        self.max_in_flight = max_in_flight
+        self.rate_per_domain = rate_per_domain
+        self.burst = burst
+        self.retries = retries
+        self.backoff = backoff
+        self.sleep = sleep
+        self.completed = {}  # idempotency key -> application record
+        self._in_flight = set()  # keys submitted and not yet completed or failed
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self.report = {}
+
+    def _bucket(self, job):
+        domain = urlsplit(job.get('url', '')).netloc
+        with self._lock:
+            bucket = self._buckets.get(domain)
+            if bucket is None:
+                bucket = self._buckets[domain] = TokenBucket(self.rate_per_domain, self.burst)
+        return bucket
+
+    def _apply(self, job, key, applicant):
+        bucket = self._bucket(job)
+        start = time.perf_counter()
+        for attempt in range(self.retries + 1):
+            bucket.acquire()
+            try:
+                response = self.adapter.submit(job, key, applicant)
+                break
+            except requests.HTTPError as e:
+                if e.response is None or e.response.status_code not in RETRY_STATUSES or attempt == self.retries:
+                    raise
+                wait = retry_after(e.response)
+                self.sleep(self.backoff * 2 ** attempt if wait is None else wait)
+            except Exception:
+                if attempt == self.retries:
+                    raise
+                self.sleep(self.backoff * 2 ** attempt)
+        latency = time.perf_counter() - start
+        record = {
+            'title': job['title'],
+            'company': job['company'],
+            'match_score': job.get('match_score'),
+            'applied_at': datetime.now().isoformat(),
+            'status': (response or {}).get('status', 'Applied'),
+            'url': job.get('url', ''),
+            'idempotency_key': key
+        }
+        return record, latency
+
+    def run(self, jobs, applicant=None):
+        """Apply to every job; returns [(job, record or None, error or None)] in input order"""
+        in_flight = threading.BoundedSemaphore(self.max_in_flight)
+        results = []
+        skipped = 0
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            pending = []
+            for job in jobs:
+                key = idempotency_key(job)
+                with self._lock:  # reserve the key before submitting, so a duplicate is never sent
+                    if key in self.completed or key in self._in_flight:
+                        skipped += 1
+                        continue
+                    self._in_flight.add(key)
+                in_flight.acquire()
+                future = pool.submit(self._apply, job, key, applicant)
+                future.add_done_callback(lambda _: in_flight.release())
+                pending.append((job, key, future))
+
+            latencies = []
+            for job, key, future in pending:
+                try:
+                    record, latency = future.result()
+                except Exception as e:
+                    with self._lock:
+                        self._in_flight.discard(key)  # a later run may try again
+                    results.append((job, None, e))
+                    continue
+                with self._lock:
+                    self.completed[key] = record
+                    self._in_flight.discard(key)
+                latencies.append(latency)
+                results.append((job, record, None))
+
+        elapsed = time.perf_counter() - start
+        self.report = self._report(latencies, len(pending), skipped, elapsed)
+        return results
+
+    @staticmethod
+    def _report(latencies, submitted, skipped, elapsed):
+        def percentile(p):
+            if not latencies:
+                return 0.0
+            if len(latencies) == 1:
+                return latencies[0]
+            return statistics.quantiles(latencies, n=100, method='inclusive')[p - 1]
+
+        return {
+            'submitted': submitted,
+            'succeeded': len(latencies),
+            'failed': submitted - len(latencies),
+            'skipped': skipped,
+            'elapsed_s': round(elapsed, 3),
+            'throughput_per_s': round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+            'latency_ms': {f'p{p}': round(percentile(p) * 1000, 1) for p in (50, 95, 99)}
+        }
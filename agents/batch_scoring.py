@@ -0,0 +1,246 @@
+import re
+import time
+
+import numpy as np
+
+from job_analysis import attached_analysis
+from locations import normalize_location, within_distance
+from posted_date import freshness_points, freshness_term, parse_posted
+from salary import annual_range
+
+SEPARATOR = '\0'
+
+
+class JobFeatures:
+    """Columnar view of a job collection used for batch scoring.
+
+    Title + description of every job is lowercased once and joined into a
+    single text buffer, so a skill column is one regex scan over the buffer
+    plus a ``searchsorted`` to map hit offsets back to jobs. Company, location
+    and salary strings repeat heavily across postings, so they are stored as
+    integer codes into a table of distinct values and evaluated once per
+    distinct value. Preference-dependent columns (one per skill, one per
+    company list) are built on first use and cached, so scoring the same jobs
+    against another preference set only pays for what it has not seen.
+
+    Relative posted dates ('3 days ago') are resolved against ``now``
+    (timestamp, default the current time); scorers pass their own ``now``.
+    """
+
+    def __init__(self, jobs, now=None):
+        self.jobs = jobs if isinstance(jobs, list) else list(jobs)
+        self.size = len(self.jobs)
+
+        texts = [self._text(job) for job in self.jobs]
+        lengths = np.fromiter((len(t) + 1 for t in texts), dtype=np.int64, count=self.size)
+        self.starts = np.concatenate(([0], np.cumsum(lengths)[:-1])) if self.size else lengths
+        self.text = SEPARATOR.join(texts)
+
+        self.companies, self.company_codes = self._encode(job.get('company', '').lower() for job in self.jobs)
+        self.locations, self.location_codes = self._encode(job.get('location', '').lower() for job in self.jobs)
+        salaries, salary_codes = self._encode(str(job.get('salary', '')).lower() for job in self.jobs)
+
+        self.remote = self._lookup([normalize_location(loc).remote for loc in self.locations], self.location_codes)
+        self.salary_present = self._lookup([bool(s) and 'not specified' not in s for s in salaries], salary_codes)
+        # Yearly salary range, parsed once per distinct salary string (NaN when unparsable)
+        ranges = np.array([annual_range(s) for s in salaries], dtype=np.float64).reshape(-1, 2)
+        self.salary_min = ranges[salary_codes, 0]
+        self.salary_max = ranges[salary_codes, 1]
+        # Posted timestamp, parsed once per distinct date string (NaN when undated)
+        self.posted_dates, self.posted_codes = self._encode(str(job.get('posted') or '') for job in self.jobs)
+        self._posted_times = [parse_posted(p, now) for p in self.posted_dates]
+        self.posted_at = np.array([np.nan if t is None else t for t in self._posted_times],
+                                  dtype=np.float64)[self.posted_codes]
+        self._skill_columns = {}
+        self._company_columns = {}
+
+    @staticmethod
+    def _text(job):
+        """Lowercased title + description, reusing the job's JobAnalysis when it already has one"""
+        analysis = attached_analysis(job)
+        if analysis is not None:
+            return analysis.text
+        return (job.get('title', '') + ' ' + job.get('description', '')).lower()
+
+    def _encode(self, values):
+        """Dictionary-encode strings: (distinct values, int code per job)"""
+        table = {}
+        codes = np.fromiter((table.setdefault(v, len(table)) for v in values), dtype=np.int64, count=self.size)
+        return list(table), codes
+
+    @staticmethod
+    def _lookup(flags, codes):
+        return np.array(flags, dtype=bool)[codes] if len(flags) else np.zeros(len(codes), dtype=bool)
+
+    def skill_column(self, skill):
+        """Boolean column: skill occurs in title + description"""
+        skill = skill.lower()
+        column = self._skill_columns.get(skill)
+        if column is None:
+            column = np.zeros(self.size, dtype=bool)
+            if skill:
+                hits = np.fromiter((m.start() for m in re.finditer(re.escape(skill), self.text)), dtype=np.int64)
+                column[np.searchsorted(self.starts, hits, side='right') - 1] = True
+            else:
+                column[:] = True  # '' in text is always True
+            self._skill_columns[skill] = column
+        return column
+
+    def skill_hits(self, skills):
+        """Jobs x skills boolean hit matrix, one column per listed skill"""
+        if not skills:
+            return np.zeros((self.size, 0), dtype=bool)
+        return np.column_stack([self.skill_column(s) for s in skills])
+
+    def salary_in_range(self, min_salary=None, max_salary=None):
+        """Boolean column: parsed yearly salary range overlaps [min_salary, max_salary]"""
+        mask = ~np.isnan(self.salary_min)
+        if min_salary is not None:
+            mask &= self.salary_max >= min_salary
+        if max_salary is not None:
+            mask &= self.salary_min <= max_salary
+        return mask
+
+    def salary_bonus(self, min_salary=None, max_salary=None):
+        """Boolean column for the salary bonus: listed, and within range when one is set"""
+        if min_salary is None and max_salary is None:
+            return self.salary_present
+        return self.salary_present & self.salary_in_range(min_salary, max_salary)
+
+    def posted_within(self, since=None, until=None):
+        """Boolean column: posted within [since, until] (timestamps)"""
+        mask = ~np.isnan(self.posted_at)
+        if since is not None:
+            mask &= self.posted_at >= since
+        if until is not None:
+            mask &= self.posted_at <= until
+        return mask
+
+    def within_distance(self, origin, max_distance_km, include_remote=True):
+        """Boolean column: located within max_distance_km of origin (remote postings pass unless excluded)"""
+        return self._lookup([within_distance(loc, origin, max_distance_km, include_remote) for loc in self.locations],
+                            self.location_codes)
+
+    def freshness(self, now, weight, half_life_days):
+        """Int column of freshness points, evaluated once per distinct posted date"""
+        points = [freshness_points(t, now, weight, half_life_days) for t in self._posted_times]
+        return np.array(points, dtype=np.int64)[self.posted_codes] if points else np.zeros(0, dtype=np.int64)
+
+    def company_column(self, companies):
+        """Boolean column: any of the companies occurs in the job's company name"""
+        key = tuple(c.lower() for c in companies)
+        column = self._company_columns.get(key)
+        if column is None:
+            column = self._lookup([any(c in name for c in key) for name in self.companies], self.company_codes)
+            self._company_columns[key] = column
+        return column
+
+
+class BatchScorer:
+    """Vectorized equivalent of JobSearchAgent._calculate_match_score.
+
+    Rules (identical to the per-job method): +20 per required skill found in
+    title/description, +30 for remote when remote_only is set, +10 when a
+    salary is listed (and within min_salary/max_salary when either is set),
+    +20 once for a preferred company, plus up to ``freshness_weight`` points
+    halving every ``freshness_half_life_days`` of posting age, capped at
+    100. ``now`` (timestamp, default the current time) is the reference for
+    posting age.
+    """
+
+    SKILL_POINTS = 20
+    REMOTE_POINTS = 30
+    SALARY_POINTS = 10
+    COMPANY_POINTS = 20
+    MAX_SCORE = 100
+
+    def __init__(self, preferences, now=None):
+        self.skills = [s.lower() for s in preferences.get('required_skills', [])]
+        self.remote_only = bool(preferences.get('remote_only', False))
+        self.companies = tuple(c.lower() for c in preferences.get('preferred_companies', []))
+        self.salary_range = (preferences.get('min_salary'), preferences.get('max_salary'))
+        self.freshness_term = freshness_term(preferences)
+        self.now = time.time() if now is None else now
+
+    def score(self, features):
+        """Scores for every job in a JobFeatures, as an int array"""
+        if not isinstance(features, JobFeatures):
+            features = JobFeatures(features, self.now)
+
+        scores = self.SKILL_POINTS * features.skill_hits(self.skills).sum(axis=1, dtype=np.int64)
+        if self.remote_only:
+            scores += self.REMOTE_POINTS * features.remote
+        scores += self.SALARY_POINTS * features.salary_bonus(*self.salary_range)
+        if self.companies:
+            scores += self.COMPANY_POINTS * features.company_column(self.companies)
+        if self.freshness_term:
+            scores += features.freshness(self.now, *self.freshness_term)
+
+        return np.minimum(scores, self.MAX_SCORE)
+
+
+class IncrementalScorer:
+    """BatchScorer that re-scores a fixed job collection incrementally.
+
+    The uncapped score is kept as a sum of per-job component arrays, each
+    keyed by the preference element that produced it: one per required
+    skill, one for remote_only, one for the salary bonus, one for the
+    preferred-company list and one for the freshness term. When preferences
+    change, only components whose key appeared or disappeared are
+    subtracted or added. Adding a skill costs one column, and toggling
+    ``remote_only`` costs one add, instead of a full re-score.
+    """
+
+    def __init__(self, features, now=None):
+        self.features = features if isinstance(features, JobFeatures) else JobFeatures(features, now)
+        self.components = {}
+        self.recomputed = []  # component keys built by the last score() call
+        self._total = np.zeros(self.features.size, dtype=np.int64)
+
+    @staticmethod
+    def component_keys(preferences, now=None):
+        keys = []
+        seen = {}
+        for skill in preferences.get('required_skills', []):
+            skill = skill.lower()
+            seen[skill] = seen.get(skill, 0) + 1
+            keys.append(('skill', skill, seen[skill]))  # repeated skills score once per listing
+        if preferences.get('remote_only', False):
+            keys.append(('remote',))
+        keys.append(('salary', preferences.get('min_salary'), preferences.get('max_salary')))
+        companies = tuple(c.lower() for c in preferences.get('preferred_companies', []))
+        if companies:
+            keys.append(('companies', companies))
+        freshness = freshness_term(preferences)
+        if freshness:
+            keys.append(('freshness', now) + freshness)
+        return keys
+
+    def _component(self, key):
+        features = self.features
+        if key[0] == 'skill':
+            return BatchScorer.SKILL_POINTS * features.skill_column(key[1]).astype(np.int64)
+        if key[0] == 'remote':
+            return BatchScorer.REMOTE_POINTS * features.remote.astype(np.int64)
+        if key[0] == 'salary':
+            return BatchScorer.SALARY_POINTS * features.salary_bonus(*key[1:]).astype(np.int64)
+        if key[0] == 'freshness':
+            return features.freshness(*key[1:])
+        return BatchScorer.COMPANY_POINTS * features.company_column(key[1]).astype(np.int64)
+
+    def score(self, preferences, now=None):
+        """Scores for the current preferences, recomputing only changed components
+
+        The freshness component is keyed on ``now`` (default the current
+        time), so it is rebuilt whenever the reference time moves.
+        """
+        now = time.time() if now is None else now
+        wanted = set(self.component_keys(preferences, now))
+        for key in [k for k in self.components if k not in wanted]:
+            self._total -= self.components.pop(key)
+        self.recomputed = [k for k in wanted if k not in self.components]
+        for key in self.recomputed:
+            component = self._component(key)
+            self.components[key] = component
+            self._total += component
+        return np.minimum(self._total, BatchScorer.MAX_SCORE)
@@ -0,0 +1,93 @@
+import re
+import zlib
+
+import numpy as np
+
+WORD_RE = re.compile(r'\w+')
+MERSENNE_PRIME = (1 << 31) - 1
+
+
+class NearDuplicateDetector:
+    """MinHash + LSH banding detector for reposted jobs.
+
+    Each posting is fingerprinted from the word shingles of its title,
+    company and description. Signatures are split into ``bands`` bands of
+    ``num_perm // bands`` rows, and postings that share any band bucket
+    become candidates. A candidate counts as a duplicate when the estimated
+    Jaccard similarity (fraction of equal signature slots) is at least
+    ``threshold``. A posting is compared only with the few clusters sharing
+    a bucket with it, never with the whole corpus.
+
+    The first posting of a cluster is canonical. It gets a ``sources``
+    provenance list with a ``{'source', 'url'}`` entry for every copy seen.
+    """
+
+    def __init__(self, num_perm=64, bands=16, threshold=0.8, shingle_size=3, seed=1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self._a = rng.randint(1, MERSENNE_PRIME, size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, MERSENNE_PRIME, size=num_perm).astype(np.uint64)
+        self._buckets = {}      # (band, band bytes) -> [cluster ids]
+        self._signatures = []   # cluster id -> signature
+        self.canonical = []     # cluster id -> canonical job
+        self.duplicates = 0
+
+    def shingles(self, job):
+        text = ' '.join((job.get('title', ''), job.get('company', ''), job.get('description', ''))).lower()
+        words = WORD_RE.findall(text)
+        k = self.shingle_size
+        if len(words) <= k:
+            return {' '.join(words)}
+        return {' '.join(words[i:i + k]) for i in range(len(words) - k + 1)}
+
+    def signature(self, job):
+        hashes = np.fromiter((zlib.crc32(s.encode('utf-8')) for s in self.shingles(job)), dtype=np.uint64)
+        hashes %= np.uint64(MERSENNE_PRIME)
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % np.uint64(MERSENNE_PRIME)
+        return permuted.min(axis=1)
+
+    def _band_keys(self, signature):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def add(self, job):
+        """Register a posting; returns (canonical job, is_duplicate)"""
+        signature = self.signature(job)
+        keys = list(self._band_keys(signature))
+
+        seen = set()
+        for key in keys:
+            for cluster in self._buckets.get(key, ()):
+                if cluster in seen:
+                    continue
+                seen.add(cluster)
+                if np.mean(self._signatures[cluster] == signature) >= self.threshold:
+                    canonical = self.canonical[cluster]
+                    canonical['sources'].append(self._provenance(job))
+                    self.duplicates += 1
+                    return canonical, True
+
+        cluster = len(self.canonical)
+        job['sources'] = [self._provenance(job)]
+        self.canonical.append(job)
+        self._signatures.append(signature)
+        for key in keys:
+            self._buckets.setdefault(key, []).append(cluster)
+        return job, False
+
+    @staticmethod
+    def _provenance(job):
+        return {'source': job.get('source', ''), 'url': job.get('url', '')}
+
+    def deduplicate(self, jobs):
+        """Yield each distinct posting once, folding near-duplicates into its provenance"""
+        for job in jobs:
+            canonical, is_duplicate = self.add(job)
+            if not is_duplicate:
+                yield canonical
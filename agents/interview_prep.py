@@ -1,6 +1,11 @@
 import json
 from datetime import datetime
 
+from job_analysis import analyze_job
+
+# Topics that trigger technical question sets; all are TECH_KEYWORDS, so read from the analysis skills
+TOPICS = frozenset(('python', 'machine learning', 'ai', 'aws'))
+
 class InterviewPrepAgent:
     def __init__(self, user_profile, job):
         self.profile = user_profile
@@ -71,11 +76,12 @@ class InterviewPrepAgent:
         """Generate likely technical interview questions"""
         print("💻 Generating technical questions...\n")
         
-        description = self.job.get('description', '').lower()
+        analysis = analyze_job(self.job)
+        topics = {skill.lower() for skill in analysis.skills} & TOPICS
         questions = []
         
         # Python questions
-        if 'python' in description:
+        if 'python' in topics:
             questions.extend([
                 {
                     'question': 'Explain Python decorators and provide a use case',
@@ -99,7 +105,7 @@ class InterviewPrepAgent:
             ])
         
         # ML/AI questions
-        if 'machine learning' in description or 'ai' in description:
+        if 'machine learning' in topics or 'ai' in topics:
             questions.extend([
                 {
                     'question': 'Explain the bias-variance tradeoff',
@@ -123,7 +129,7 @@ class InterviewPrepAgent:
             ])
         
         # AWS questions
-        if 'aws' in description:
+        if 'aws' in topics:
             questions.extend([
                 {
                     'question': 'Explain the difference between S3 and EBS',
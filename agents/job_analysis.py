@@ -0,0 +1,106 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+from job_record import Job
+from keyword_matcher import KeywordMatcher
+from locations import normalize_location
+
+# Technologies looked for in job descriptions (resume keywords)
+TECH_KEYWORDS = ['Python', 'AWS', 'Machine Learning', 'AI', 'TensorFlow',
+                 'Docker', 'Kubernetes', 'SQL', 'React', 'Node.js', 'Java',
+                 'Django', 'Flask', 'PostgreSQL', 'MongoDB', 'Git']
+TECH_KEYWORD_MATCHER = KeywordMatcher(TECH_KEYWORDS)
+TECH_KEYWORD_IDS = {keyword.lower(): index for index, keyword in enumerate(TECH_KEYWORDS)}
+
+_analyses = OrderedDict()  # content hash -> JobAnalysis, least recently used first
+_analyses_lock = threading.Lock()
+MAX_ANALYSES = 65536
+
+
+def content_hash(fields):
+    """sha256 of a posting's (title, description, location)"""
+    return hashlib.sha256('\0'.join(map(str, fields)).encode('utf-8')).hexdigest()
+
+
+class JobAnalysis:
+    """What the agents read from a posting's text, parsed once.
+
+    ``fields`` are the posting's (title, description, location),
+    ``content_hash`` their sha256 (a stable id for the content across
+    processes) and ``text`` the lowercased title and description joined by
+    a space (the description starts at ``description_start``). One
+    TECH_KEYWORD_MATCHER pass over the text finds ``keyword_ids``, the
+    positions in TECH_KEYWORDS of every keyword anywhere in the text, and
+    ``skill_ids``, those named in the description; ``skills`` are the
+    latter keywords, in list order.
+    """
+
+    def __init__(self, fields, content_hash):
+        title, description, location = fields
+        self.fields = fields
+        self.content_hash = content_hash
+        title = str(title).lower()
+        self.text = title + ' ' + str(description).lower()
+        self.description_start = start = len(title) + 1
+        # Occurrences come in end order, so for each keyword the last one also starts last
+        last_starts = {index: begin for begin, _, index in TECH_KEYWORD_MATCHER.finditer(self.text)}
+        self.keyword_ids = frozenset(last_starts)
+        self.skill_ids = tuple(sorted(index for index, begin in last_starts.items() if begin >= start))
+        self.skills = tuple(TECH_KEYWORDS[i] for i in self.skill_ids)
+
+    @property
+    def remote(self):
+        return normalize_location(self.fields[2]).remote
+
+
+def _fields(job):
+    return job.get('title', ''), job.get('description', ''), job.get('location', '')
+
+
+def analyze_job(job):
+    """JobAnalysis of a posting, parsed only the first time its content is seen
+
+    Analyses are memoized by content hash in a process-wide LRU of
+    MAX_ANALYSES entries, so copies of a posting share one. Job records
+    also keep theirs in the ``analysis`` slot (cleared when the text is
+    edited), which skips the hash on later calls; plain dicts are never
+    modified.
+    """
+    if isinstance(job, Job) and job.analysis is not None:
+        return job.analysis
+    fields = _fields(job)
+    key = content_hash(fields)
+    with _analyses_lock:
+        analysis = _analyses.get(key)
+        if analysis is not None:
+            _analyses.move_to_end(key)
+    if analysis is None:
+        analysis = JobAnalysis(fields, key)
+        remember_analysis(analysis)
+    if isinstance(job, Job):
+        job.analysis = analysis
+    return analysis
+
+
+def attached_analysis(job):
+    """The analysis a Job record carries, or None (always for plain dicts); never parses or hashes"""
+    return job.analysis if isinstance(job, Job) else None
+
+
+def memoized_analysis(job):
+    """The analysis already made for a posting's content, or None; never parses"""
+    analysis = attached_analysis(job)
+    if analysis is not None:
+        return analysis
+    with _analyses_lock:
+        return _analyses.get(content_hash(_fields(job)))
+
+
+def remember_analysis(analysis):
+    """Add an analysis made elsewhere (e.g. in the parent of a worker process) to the memo"""
+    with _analyses_lock:
+        _analyses[analysis.content_hash] = analysis
+        _analyses.move_to_end(analysis.content_hash)
+        while len(_analyses) > MAX_ANALYSES:
+            _analyses.popitem(last=False)
@@ -0,0 +1,187 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Statuses worth retrying; other 4xx responses fail immediately
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def iter_json_array(chunks):
+    """Incrementally decode the objects of a top-level JSON array from text chunks
+
+    Raises ValueError if the body is not an array, has undecodable text
+    left when it ends, or ends before the closing ``]``.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    started = False
+    for chunk in chunks:
+        buffer += chunk
+        pos = 0
+        while True:
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+                pos += 1
+            if pos >= len(buffer):
+                break
+            if not started:
+                if buffer[pos] != '[':
+                    raise ValueError("Expected a JSON array")
+                started = True
+                pos += 1
+                continue
+            if buffer[pos] == ']':
+                return
+            try:
+                item, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break  # the item continues in the next chunk
+            yield item
+        buffer = buffer[pos:]
+    if buffer:
+        raise ValueError(f"Malformed or truncated JSON array at {buffer[:40]!r}")
+    raise ValueError("Truncated JSON array: missing closing ']'")
+
+
+class JobBoardAdapter:
+    """One job-board endpoint: how to query it and how to parse its response.
+
+    ``response_format`` is 'jsonl' (one posting per line) or 'json' (a
+    top-level array). Either way the body is parsed as it streams in, so a
+    large response is never held as one string. Subclass and override
+    ``params`` / ``normalize`` for boards with their own query or field
+    names.
+    """
+
+    def __init__(self, name, url, response_format='jsonl', headers=None):
+        self.name = name
+        self.url = url
+        self.response_format = response_format
+        self.headers = headers or {}
+
+    @property
+    def host(self):
+        return urlsplit(self.url).netloc
+
+    def params(self, keywords, location):
+        return {'q': keywords, 'location': location}
+
+    def parse(self, response):
+        """Yield normalized postings from a streamed response"""
+        if response.encoding is None:
+            response.encoding = 'utf-8'
+        if self.response_format == 'json':
+            items = iter_json_array(response.iter_content(chunk_size=65536, decode_unicode=True))
+        else:
+            items = (json.loads(line) for line in response.iter_lines(decode_unicode=True) if line)
+        for item in items:
+            yield self.normalize(item)
+
+    def normalize(self, item):
+        item.setdefault('source', self.name)
+        return item
+
+
+class AsyncJobFetcher:
+    """Query several job boards concurrently.
+
+    Each host gets its own ``requests.Session`` with a connection pool of
+    ``per_host_limit`` connections, and an asyncio semaphore of the same
+    size caps in-flight requests per host. ``max_concurrency`` caps the
+    total. Blocking requests run on a thread pool driven from asyncio.
+    Failed requests (connection errors, timeouts, 429/5xx) are retried up
+    to ``retries`` times with exponential backoff starting at ``backoff``
+    seconds.
+
+    ``stats`` records per-request latency (seconds), retries and failures
+    for the last ``fetch`` call.
+    """
+
+    def __init__(self, adapters, max_concurrency=16, per_host_limit=4, timeout=10.0, retries=3, backoff=0.5):
+        self.adapters = list(adapters)
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self._sessions = {}
+        self._sessions_lock = threading.Lock()  # _session runs on the pool threads
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        self.stats = {}
+
+    def _session(self, host):
+        with self._sessions_lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                pool = HTTPAdapter(pool_connections=1, pool_maxsize=self.per_host_limit)
+                session.mount('http://', pool)
+                session.mount('https://', pool)
+                self._sessions[host] = session
+            return session
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        with self._sessions_lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _request(self, adapter, keywords, location):
+        """Blocking GET + streaming parse, run on the thread pool"""
+        session = self._session(adapter.host)
+        with session.get(adapter.url, params=adapter.params(keywords, location), headers=adapter.headers,
+                         timeout=self.timeout, stream=True) as response:
+            response.raise_for_status()
+            return list(adapter.parse(response))
+
+    async def _fetch(self, adapter, keywords, location, limit, host_limits):
+        loop = asyncio.get_running_loop()
+        async with limit, host_limits[adapter.host]:
+            for attempt in range(self.retries + 1):
+                start = time.perf_counter()
+                try:
+                    jobs = await loop.run_in_executor(self._executor, self._request, adapter, keywords, location)
+                    self.stats['latencies'].append(time.perf_counter() - start)
+                    return jobs
+                except requests.HTTPError as e:
+                    if e.response is None or e.response.status_code not in RETRY_STATUSES or attempt == self.retries:
+                        raise
+                except (requests.ConnectionError, requests.Timeout):
+                    if attempt == self.retries:
+                        raise
+                self.stats['retries'] += 1
+                await asyncio.sleep(self.backoff * 2 ** attempt)
+
+    async def fetch_all(self, keywords, location='Remote'):
+        """Fetch every adapter concurrently; returns (jobs, {adapter name: error})"""
+        self.stats = {'latencies': [], 'retries': 0, 'failures': 0}
+        limit = asyncio.Semaphore(self.max_concurrency)
+        host_limits = {a.host: asyncio.Semaphore(self.per_host_limit) for a in self.adapters}
+        results = await asyncio.gather(
+            *(self._fetch(a, keywords, location, limit, host_limits) for a in self.adapters),
+            return_exceptions=True)
+
+        jobs, errors = [], {}
+        for adapter, result in zip(self.adapters, results):
+            if isinstance(result, Exception):
+                errors[adapter.name] = result
+                self.stats['failures'] += 1
+            else:
+                jobs.extend(result)
+        return jobs, errors
+
+    def fetch(self, keywords, location='Remote'):
+        """Synchronous wrapper around fetch_all"""
+        return asyncio.run(self.fetch_all(keywords, location))
@@ -0,0 +1,128 @@
+import hashlib
+import math
+import time
+from collections import OrderedDict
+
+
+class DistinctCounter:
+    """HyperLogLog estimate of the number of distinct keys seen.
+
+    Memory is fixed at ``2 ** precision`` one-byte registers (4 KiB by
+    default) however many keys are added. The standard error is about
+    ``1.04 / sqrt(2 ** precision)`` (1.6% by default); small counts use
+    linear counting, which is exact for a few dozen keys. Keys are hashed with
+    blake2b, so estimates do not depend on PYTHONHASHSEED.
+    """
+
+    def __init__(self, precision=12):
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, key):
+        value = int.from_bytes(hashlib.blake2b(repr(key).encode('utf-8'), digest_size=8).digest(), 'big')
+        bits = 64 - self.precision
+        register = value >> bits
+        rank = bits - (value & ((1 << bits) - 1)).bit_length() + 1
+        if rank > self.registers[register]:
+            self.registers[register] = rank
+
+    def __len__(self):
+        m = len(self.registers)
+        estimate = 0.7213 / (1 + 1.079 / m) * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return round(estimate)
+
+
+class JobHistory:
+    """Bounded, URL-keyed history of jobs an agent has found.
+
+    Entries are kept in recency order in an OrderedDict. Seeing a job again
+    refreshes it instead of storing a second copy, and membership checks
+    are O(1). Two eviction policies can be combined: ``max_size`` evicts the
+    least recently seen job (LRU), and ``ttl`` (seconds) drops jobs not seen
+    within the time window. Memory therefore stays flat for an agent that
+    searches continuously.
+
+    Counters: ``total_seen`` counts every add, ``duplicates`` counts adds of
+    jobs already present and ``evicted`` counts jobs dropped by either
+    policy. ``unique_seen`` is the number of distinct keys ever added,
+    evicted ones included, so a job found again after eviction is not
+    counted twice. To keep memory flat it is a DistinctCounter
+    (HyperLogLog) estimate: exact for a few dozen jobs, within a few
+    percent beyond that.
+    """
+
+    def __init__(self, max_size=10000, ttl=None, clock=time.monotonic):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self._jobs = OrderedDict()  # key -> (job, last seen)
+        self._distinct = DistinctCounter()
+        self.total_seen = 0
+        self.duplicates = 0
+        self.evicted = 0
+
+    @property
+    def unique_seen(self):
+        return len(self._distinct)
+
+    @staticmethod
+    def key(job):
+        return job.get('url') or (job.get('title', ''), job.get('company', ''))
+
+    def add(self, job):
+        """Record a job; returns True if it was not already in the history"""
+        now = self.clock()
+        self._expire(now)
+        key = self.key(job)
+        self.total_seen += 1
+        self._distinct.add(key)
+        if key in self._jobs:
+            self._jobs.move_to_end(key)
+            self._jobs[key] = (job, now)
+            self.duplicates += 1
+            return False
+        self._jobs[key] = (job, now)
+        if self.max_size is not None:
+            while len(self._jobs) > self.max_size:
+                self._jobs.popitem(last=False)
+                self.evicted += 1
+        return True
+
+    def extend(self, jobs):
+        for job in jobs:
+            self.add(job)
+
+    def _expire(self, now):
+        if self.ttl is None:
+            return
+        while self._jobs:
+            _, seen_at = next(iter(self._jobs.values()))
+            if now - seen_at <= self.ttl:
+                break
+            self._jobs.popitem(last=False)
+            self.evicted += 1
+
+    def __contains__(self, job):
+        key = job if isinstance(job, (str, tuple)) else self.key(job)
+        self._expire(self.clock())
+        return key in self._jobs
+
+    def __len__(self):
+        self._expire(self.clock())
+        return len(self._jobs)
+
+    def __iter__(self):
+        self._expire(self.clock())
+        return (job for job, _ in list(self._jobs.values()))
+
+    def stats(self):
+        return {
+            'retained': len(self),
+            'total_seen': self.total_seen,
+            'unique_seen': self.unique_seen,
+            'duplicates': self.duplicates,
+            'evicted': self.evicted
+        }
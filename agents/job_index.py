@@ -0,0 +1,161 @@
+import re
+
+from locations import GeoGridIndex, normalize_location
+from posted_date import PostedIndex
+from salary import SalaryIndex
+
+WORD_RE = re.compile(r'\w+')
+
+
+def match_job(job, keywords, mode='substring'):
+    """Whether a single posting matches any keyword, with JobIndex semantics (no index needed)"""
+    title = job.get('title', '').lower()
+    description = job.get('description', '').lower()
+    if mode == 'substring':
+        return any(k.lower() in title or k.lower() in description for k in keywords)
+    if mode == 'word':
+        words = set(WORD_RE.findall(title)) | set(WORD_RE.findall(description))
+        return any(kw_words and all(w in words for w in kw_words)
+                   for kw_words in (WORD_RE.findall(k.lower()) for k in keywords))
+    raise ValueError(f"Unknown match mode: {mode!r} (expected one of {JobIndex.MODES})")
+
+
+class JobIndex:
+    """Inverted keyword index over job titles and descriptions.
+
+    Two matching modes are supported:
+
+    - ``substring`` (default) gives exactly the same results as the original
+      ``k.lower() in text.lower()`` scan. Terms are the whitespace-separated
+      tokens of the lowercased title and description, and a keyword matches
+      every term that contains it. Since a keyword has no whitespace, it can
+      only ever occur inside a single term.
+    - ``word`` matches whole words only: the keyword is split on non-word
+      characters and every resulting word must appear in the posting
+      (``'Node.js'`` needs both ``node`` and ``js``).
+    """
+
+    MODES = ('substring', 'word')
+
+    def __init__(self, jobs=None):
+        self.jobs = []
+        self._postings = {}       # whitespace term -> [doc ids]
+        self._word_postings = {}  # \w+ word -> [doc ids]
+        self._terms = []          # vocabulary in insertion order
+        self._term_cache = {}     # keyword -> (terms scanned, matching terms)
+        self._salaries = None     # SalaryIndex, built on the first salary query
+        self._posted = None       # PostedIndex, built on the first posted-date query
+        self._geo = None          # (GeoGridIndex, [remote doc ids]), built on the first distance query
+        if jobs:
+            self.add_jobs(jobs)
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def add_jobs(self, jobs):
+        """Index a batch of postings"""
+        for job in jobs:
+            self.add(job)
+
+    def add(self, job):
+        """Index a single posting and return its doc id"""
+        doc_id = len(self.jobs)
+        self.jobs.append(job)
+        if self._salaries is not None:
+            self._salaries.add(doc_id, job.get('salary'))
+        if self._posted is not None:
+            self._posted.add(doc_id, job.get('posted'))
+        if self._geo is not None:
+            self._add_location(doc_id, job)
+        for field in ('title', 'description'):
+            text = job.get(field, '').lower()
+            for term in text.split():
+                self._post(self._postings, term, doc_id, new_terms=self._terms)
+            for word in WORD_RE.findall(text):
+                self._post(self._word_postings, word, doc_id)
+        return doc_id
+
+    @staticmethod
+    def _post(postings, term, doc_id, new_terms=None):
+        docs = postings.get(term)
+        if docs is None:
+            postings[term] = [doc_id]
+            if new_terms is not None:
+                new_terms.append(term)
+        elif docs[-1] != doc_id:
+            docs.append(doc_id)
+
+    def _matching_terms(self, keyword):
+        """Vocabulary terms containing keyword, scanning only terms added since the last lookup"""
+        scanned, terms = self._term_cache.get(keyword, (0, []))
+        if scanned < len(self._terms):
+            terms = terms + [t for t in self._terms[scanned:] if keyword in t]
+            self._term_cache[keyword] = (len(self._terms), terms)
+        return terms
+
+    def doc_ids(self, keyword, mode='substring'):
+        """Set of doc ids whose title or description matches a single keyword"""
+        keyword = keyword.lower()
+        if mode == 'substring':
+            docs = set()
+            for term in self._matching_terms(keyword):
+                docs.update(self._postings[term])
+            return docs
+        if mode == 'word':
+            words = WORD_RE.findall(keyword)
+            if not words:
+                return set()
+            docs = set(self._word_postings.get(words[0], ()))
+            for word in words[1:]:
+                docs.intersection_update(self._word_postings.get(word, ()))
+            return docs
+        raise ValueError(f"Unknown match mode: {mode!r} (expected one of {self.MODES})")
+
+    def search_ids(self, keywords, mode='substring', match='any'):
+        """Sorted doc ids matching any (union) or all (intersection) of the keywords"""
+        result = None
+        for keyword in keywords:
+            docs = self.doc_ids(keyword, mode)
+            if result is None:
+                result = docs
+            elif match == 'all':
+                result &= docs
+            else:
+                result |= docs
+        return sorted(result or ())
+
+    def salary_ids(self, min_salary=None, max_salary=None):
+        """Sorted doc ids whose yearly salary range overlaps [min_salary, max_salary]"""
+        if self._salaries is None:
+            self._salaries = SalaryIndex()
+            for doc_id, job in enumerate(self.jobs):
+                self._salaries.add(doc_id, job.get('salary'))
+        return self._salaries.range_ids(min_salary, max_salary)
+
+    def posted_ids(self, since=None, until=None, now=None):
+        """Sorted doc ids posted within [since, until] (POSIX timestamps); relative dates are resolved against ``now``"""
+        if self._posted is None:
+            self._posted = PostedIndex()
+            for doc_id, job in enumerate(self.jobs):
+                self._posted.add(doc_id, job.get('posted'))
+        return self._posted.window_ids(since, until, now)
+
+    def _add_location(self, doc_id, job):
+        grid, remote = self._geo
+        grid.add(doc_id, job.get('location'))
+        if normalize_location(job.get('location')).remote:
+            remote.append(doc_id)
+
+    def near_ids(self, lat, lon, radius_km, include_remote=True):
+        """Sorted doc ids located within radius_km of (lat, lon), plus remote postings if asked"""
+        if self._geo is None:
+            self._geo = (GeoGridIndex(), [])
+            for doc_id, job in enumerate(self.jobs):
+                self._add_location(doc_id, job)
+        grid, remote = self._geo
+        ids = grid.within_ids(lat, lon, radius_km)
+        return sorted(set(ids).union(remote)) if include_remote else ids
+
+    def search(self, keywords, mode='substring', match='any'):
+        """Jobs matching the keywords, in the order they were indexed"""
+        return [self.jobs[i] for i in self.search_ids(keywords, mode, match)]
@@ -1,146 +1,404 @@
-from datetime import datetime
+from itertools import islice
+import time
+import heapq
 import json
 import re
 
+from apply_executor import BatchApplyExecutor
+from job_history import JobHistory
+from job_analysis import TECH_KEYWORD_IDS, analyze_job
+from job_index import JobIndex, match_job
+from job_record import Job
+from keyword_matcher import KeywordMatcher
+from semantic_matching import SemanticMatcher
+from job_sources import SampleJobSource, iter_sources
+from locations import location_matches, normalize_location, within_distance
+from posted_date import DAY, freshness_points, freshness_term, parse_posted, posted_after
+from salary import salary_in_range
+
+try:
+    import numpy as np
+    from batch_scoring import BatchScorer, IncrementalScorer, JobFeatures
+    from dedup import NearDuplicateDetector
+except ImportError:  # numpy not installed: fall back to per-job scoring and filtering
+    np = BatchScorer = IncrementalScorer = JobFeatures = NearDuplicateDetector = None
+
+def _intersect_ids(ids, other):
+    """Sorted doc ids present in both sorted, duplicate-free id sequences"""
+    if np is not None:
+        return np.intersect1d(ids, other, assume_unique=True).tolist()
+    other = set(other)
+    return [i for i in ids if i in other]
+
 class JobSearchAgent:
-    def __init__(self, preferences):
+    # Jobs scored per batch when filter_jobs streams an iterator
+    SCORE_CHUNK_SIZE = 4096
+    
+    def __init__(self, preferences, jobs=None, sources=None, store=None):
         self.preferences = preferences
-        self.jobs_found = []
+        # Optional persistent JobStore; when set, searches run in SQL instead of the in-memory index
+        self.store = store
+        # Bounded, URL-keyed record of jobs returned by searches
+        self.jobs_found = JobHistory(max_size=preferences.get('history_size', 10000),
+                                     ttl=preferences.get('history_ttl'))
         self.applied_jobs = []
+        self.apply_executor = None
+        # Where postings come from: JobSource objects (or any iterables of dicts)
+        if sources is None:
+            if jobs is not None:
+                sources = [jobs]
+            else:
+                sources = [store if store is not None else SampleJobSource()]
+        self.sources = list(sources)
+        self._index = None
+        self._skill_matcher = None  # (required skills, TECH_KEYWORDS positions, KeywordMatcher)
+        self._semantic = None
+        self.deduplicator = None
+        # IncrementalScorer from the last batch filter, reused by update_preferences
+        self._last_scorer = None
+        
+    @property
+    def index(self):
+        """Inverted index over title/description, built once on first use
+        
+        Postings are held as compact Job records (see job_record.Job).
+        """
+        if self._index is None:
+            self._index = JobIndex(Job.from_mapping(job) for job in self.iter_jobs())
+        return self._index
+        
+    def iter_jobs(self):
+        """Lazily yield every posting from every source"""
+        return iter_sources(self.sources)
+        
+    def add_jobs(self, jobs):
+        """Add newly arrived postings to the store or search index"""
+        if self.store is not None:
+            self.store.add_jobs(jobs)
+        else:
+            jobs = [Job.from_mapping(job) for job in jobs]
+            self.index.add_jobs(jobs)
+        if self._semantic is not None:
+            self._semantic.add_jobs(jobs)
         
-    def search_jobs(self, keywords, location="Remote"):
-        """Search for jobs - demo with sample data"""
-        print(f"🔍 Searching for: {keywords} in {location}\n")
+    @property
+    def semantic(self):
+        """TF-IDF model over the corpus, fitted once on first use and then updated incrementally"""
+        if self._semantic is None:
+            self._semantic = SemanticMatcher(self.index.jobs if self.store is None else self.store.iter_jobs())
+        return self._semantic
         
-        # Sample job data
-        jobs = self._get_sample_jobs()
+    def search_jobs(self, keywords, location=None, keyword_mode=None, stream=False, limit=None):
+        """Search for jobs - demo with sample data
         
-        # Filter by keywords
-        filtered = [j for j in jobs if any(k.lower() in j['title'].lower() or k.lower() in j['description'].lower() 
-                                           for k in keywords.split())]
+        keyword_mode is 'substring' (default, same results as a plain
+        ``keyword in text`` scan) or 'word' for whole-word matching.
+        An explicit ``location`` keeps only postings matching it
+        (locations.location_matches); by default any location matches.
+        At most ``limit`` postings are returned, in ingest order, as plain
+        dicts owned by the caller (never the index's shared records).
+        
+        With ``stream=True`` no index is built: a generator over the
+        sources is returned instead, to be fed into ``filter_jobs(...,
+        limit=K)`` so a large dump is processed in constant memory.
+        
+        With a ``store`` the keyword, location, salary, posted-date and
+        distance filters and the limit are pushed down into the store's SQL
+        query, with the same results as the in-memory index.
+        """
+        print(f"🔍 Searching for: {keywords} in {location or 'any location'}\n")
+        
+        mode = keyword_mode or self.preferences.get('keyword_mode', 'substring')
+        
+        if stream:
+            return islice(self._stream_search(keywords.split(), mode, location), limit)
+        
+        salary_range = self._salary_range() or (None, None)
+        now = time.time()
+        posted_since = self._posted_since(now)
+        distance = self._distance_filter()
+        if self.store is not None:
+            filtered = self.store.search(keywords.split(), location=location, mode=mode, limit=limit,
+                                         min_salary=salary_range[0], max_salary=salary_range[1],
+                                         posted_since=posted_since, distance=distance, now=now)
+        else:
+            # Any keyword may match: union of the posting lists
+            ids = self.index.search_ids(keywords.split(), mode=mode)
+            if np is not None:
+                if salary_range != (None, None):
+                    # Binary search on the sorted salary index, then intersect
+                    ids = _intersect_ids(ids, self.index.salary_ids(*salary_range))
+                if posted_since is not None:
+                    # Only the time window is touched, not the full history
+                    ids = _intersect_ids(ids, self.index.posted_ids(posted_since, now=now))
+            if distance is not None:
+                # Only grid cells around the user's location are visited
+                origin, max_km, include_remote = distance
+                ids = _intersect_ids(ids, self.index.near_ids(origin.lat, origin.lon, max_km, include_remote))
+            filtered = (self.index.jobs[i] for i in ids)
+            if np is None:
+                # The sorted salary and date indexes need numpy: test each keyword hit instead
+                if salary_range != (None, None):
+                    filtered = (job for job in filtered if salary_in_range(job.get('salary'), *salary_range))
+                if posted_since is not None:
+                    filtered = (job for job in filtered if posted_after(job.get('posted'), posted_since, now))
+            if location:
+                filtered = (job for job in filtered if location_matches(job.get('location'), location))
+            # Per-call copies: filter_jobs and dedupe write into what they are given
+            filtered = [job.to_dict() for job in islice(filtered, limit)]
         
         self.jobs_found.extend(filtered)
         print(f"✓ Found {len(filtered)} jobs\n")
         return filtered
     
+    def fetch_jobs(self, fetcher, keywords, location="Remote"):
+        """Fetch postings from live job boards concurrently and add them to the index
+        
+        ``fetcher`` is a job_fetcher.AsyncJobFetcher over the board adapters.
+        Boards that fail after retries are reported and skipped.
+        """
+        print(f"🌐 Fetching from {len(fetcher.adapters)} job boards...\n")
+        jobs, errors = fetcher.fetch(keywords, location)
+        for board, error in errors.items():
+            print(f"⚠️  {board}: {error}")
+        self.add_jobs(jobs)
+        print(f"✓ Fetched {len(jobs)} jobs\n")
+        return jobs
+    
+    def _stream_search(self, keywords, mode, location=None):
+        """Generator stage: postings from the sources that match any keyword (and the location, if given)"""
+        for job in self.iter_jobs():
+            if match_job(job, keywords, mode) and (not location or location_matches(job.get('location'), location)):
+                self.jobs_found.add(job)
+                yield job
+    
     def _get_sample_jobs(self):
         """Sample job listings"""
-        return [
-            {
-                'title': 'Senior Python AI Engineer',
-                'company': 'Amazon Web Services',
-                'location': 'Remote',
-                'description': 'Build AI/ML solutions using Python, AWS, and machine learning frameworks',
-                'url': 'https://amazon.jobs/example1',
-                'salary': '$150k-$200k',
-                'source': 'LinkedIn',
-                'posted': '2024-01-10'
-            },
-            {
-                'title': 'Machine Learning Engineer',
-                'company': 'Google',
-                'location': 'Remote',
-                'description': 'Develop ML models with Python, TensorFlow, and cloud infrastructure',
-                'url': 'https://careers.google.com/example2',
-                'salary': '$160k-$210k',
-                'source': 'Indeed',
-                'posted': '2024-01-12'
-            },
-            {
-                'title': 'AI Research Scientist',
-                'company': 'Microsoft',
-                'location': 'Remote',
-                'description': 'Research and implement cutting-edge AI algorithms using Python and Azure',
-                'url': 'https://careers.microsoft.com/example3',
-                'salary': '$170k-$220k',
-                'source': 'Glassdoor',
-                'posted': '2024-01-11'
-            },
-            {
-                'title': 'Full Stack Developer',
-                'company': 'Startup Inc',
-                'location': 'San Francisco, CA',
-                'description': 'Build web applications with React and Node.js',
-                'url': 'https://startup.com/jobs/example4',
-                'salary': '$120k-$150k',
-                'source': 'AngelList',
-                'posted': '2024-01-13'
-            },
-            {
-                'title': 'Python Backend Engineer',
-                'company': 'TechCorp',
-                'location': 'Remote',
-                'description': 'Develop scalable backend services with Python, Django, and PostgreSQL',
-                'url': 'https://techcorp.com/careers/example5',
-                'salary': '$130k-$170k',
-                'source': 'LinkedIn',
-                'posted': '2024-01-09'
-            },
-            {
-                'title': 'Data Scientist - AI/ML',
-                'company': 'DataCo',
-                'location': 'Remote',
-                'description': 'Apply machine learning and AI to solve business problems with Python',
-                'url': 'https://dataco.com/jobs/example6',
-                'salary': '$140k-$180k',
-                'source': 'Indeed',
-                'posted': '2024-01-14'
-            },
-            {
-                'title': 'DevOps Engineer',
-                'company': 'CloudTech',
-                'location': 'New York, NY',
-                'description': 'Manage AWS infrastructure and CI/CD pipelines',
-                'url': 'https://cloudtech.com/careers/example7',
-                'salary': '$135k-$175k',
-                'source': 'LinkedIn',
-                'posted': '2024-01-08'
-            },
-            {
-                'title': 'AI Engineer - NLP',
-                'company': 'Amazon',
-                'location': 'Remote',
-                'description': 'Build NLP models using Python, transformers, and AWS services',
-                'url': 'https://amazon.jobs/example8',
-                'salary': '$155k-$195k',
-                'source': 'Amazon Jobs',
-                'posted': '2024-01-15'
-            }
-        ]
-    
-    def filter_jobs(self, jobs):
-        """Filter jobs based on preferences"""
+        return list(SampleJobSource())
+    
+    def filter_jobs(self, jobs, limit=None, scoring=None, dedupe=None):
+        """Filter jobs based on preferences
+        
+        With ``limit`` only the top ``limit`` jobs are kept: ``jobs`` may be
+        any iterable (including a generator over a feed that does not fit in
+        memory) and is scored in chunks against a bounded heap, so memory is
+        O(limit) and selection O(n log limit). Ties keep input order.
+        
+        ``scoring`` (or the 'scoring' preference) selects 'additive', the
+        rule-based match score, or 'semantic', TF-IDF cosine similarity
+        (0-100) between each posting and the preference text, thresholded
+        by 'min_semantic_score'.
+        
+        ``dedupe`` (or the 'dedupe' preference) collapses near-duplicate
+        reposts before scoring; each surviving job lists every copy in
+        ``job['sources']``.
+        
+        'min_salary' / 'max_salary' preferences (yearly amounts) drop jobs
+        whose parsed salary range does not overlap them, and
+        'posted_within_days' drops jobs posted longer ago (or undated).
+        'max_distance_km' drops jobs located further than that from the
+        user's 'location' (remote jobs pass unless 'include_remote' is False).
+        """
+        scoring = scoring or self.preferences.get('scoring', 'additive')
+        min_score = self.preferences.get('min_match_score', 50)
+        salary_range = self._salary_range()
+        now = time.time()
+        posted_since = self._posted_since(now)
+        distance = self._distance_filter()
+        
+        self.deduplicator = None
+        if dedupe if dedupe is not None else self.preferences.get('dedupe', False):
+            if NearDuplicateDetector is None:
+                raise ImportError("Near-duplicate detection requires numpy: pip install numpy")
+            self.deduplicator = NearDuplicateDetector()
+            jobs = self.deduplicator.deduplicate(jobs)
+        
+        # The batch path applies the salary range, time window and distance as vectorized masks instead
+        batch = scoring == 'additive' and limit is None and BatchScorer is not None
+        if salary_range and not batch:
+            jobs = (job for job in jobs if salary_in_range(job.get('salary'), *salary_range))
+        if posted_since is not None and not batch:
+            jobs = (job for job in jobs if posted_after(job.get('posted'), posted_since, now))
+        if distance is not None and not batch:
+            jobs = (job for job in jobs if within_distance(job.get('location'), *distance))
+        
+        if scoring == 'semantic':
+            filtered = self._filter_semantic(jobs, limit)
+        elif scoring != 'additive':
+            raise ValueError(f"Unknown scoring mode: {scoring!r} (expected 'additive' or 'semantic')")
+        elif limit is not None:
+            filtered = self._filter_top_k(jobs, min_score, limit, now)
+        elif BatchScorer is None:
+            filtered = []
+            for job in jobs:
+                score = self._calculate_match_score(job, now)
+                if score >= min_score:
+                    job['match_score'] = score
+                    filtered.append(job)
+            filtered.sort(key=lambda x: x['match_score'], reverse=True)
+        else:
+            filtered = self._filter_batch(jobs, min_score, now)
+        
+        if self.deduplicator is not None:
+            print(f"✓ Collapsed {self.deduplicator.duplicates} duplicate postings")
+        print(f"✓ Filtered to {len(filtered)} matching jobs\n")
+        return filtered
+    
+    def _semantic_query(self):
+        """Free text describing what the user wants: 'profile_text', else keywords + required skills"""
+        if self.preferences.get('profile_text'):
+            return self.preferences['profile_text']
+        return ' '.join([self.preferences.get('keywords', '')] + list(self.preferences.get('required_skills', [])))
+    
+    def _filter_semantic(self, jobs, limit):
+        """Rank by TF-IDF cosine similarity using the cached corpus model"""
+        jobs = jobs if isinstance(jobs, list) else list(jobs)
+        scores = np.rint(self.semantic.scores_for(jobs, self._semantic_query()) * 100).astype(int)
+        
+        keep = np.flatnonzero(scores >= self.preferences.get('min_semantic_score', 1))
+        order = keep[np.argsort(-scores[keep], kind='stable')][:limit]
+        
         filtered = []
+        for i in order:
+            job = jobs[i]
+            job['match_score'] = int(scores[i])
+            filtered.append(job)
+        return filtered
+    
+    def _score_chunks(self, jobs, now=None):
+        """Yield (job, score) pairs, scoring SCORE_CHUNK_SIZE jobs at a time"""
+        jobs = iter(jobs)
+        now = time.time() if now is None else now
+        scorer = BatchScorer(self.preferences, now) if BatchScorer is not None else None
+        while True:
+            chunk = list(islice(jobs, self.SCORE_CHUNK_SIZE))
+            if not chunk:
+                return
+            if scorer is not None:
+                scores = scorer.score(JobFeatures(chunk, now)).tolist()
+            else:
+                scores = [self._calculate_match_score(job, now) for job in chunk]
+            yield from zip(chunk, scores)
+    
+    def _filter_top_k(self, jobs, min_score, limit, now=None):
+        """Bounded min-heap of (score, -position, job); the root is the current worst"""
+        heap = []
+        if limit <= 0:
+            return heap
+        for position, (job, score) in enumerate(self._score_chunks(jobs, now)):
+            if score < min_score:
+                continue
+            entry = (score, -position, job)
+            if len(heap) < limit:
+                heapq.heappush(heap, entry)
+            elif entry[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, entry)
+        
+        filtered = []
+        for score, _, job in sorted(heap, key=lambda e: e[:2], reverse=True):
+            job['match_score'] = score
+            filtered.append(job)
+        return filtered
+    
+    def _filter_batch(self, jobs, min_score, now=None, scorer=None):
+        """Score all jobs in one NumPy pass, keeping the stable descending order
+        
+        Features are rebuilt from ``jobs`` unless ``scorer`` (the cached
+        IncrementalScorer of the same jobs, see update_preferences) is given,
+        in which case only the score components that changed are recomputed.
+        """
+        now = time.time() if now is None else now
+        if scorer is None:
+            scorer = IncrementalScorer(JobFeatures(jobs, now))
+            self._last_scorer = scorer
+        scores = scorer.score(self.preferences, now)
         
-        for job in jobs:
-            score = self._calculate_match_score(job)
-            if score >= self.preferences.get('min_match_score', 50):
-                job['match_score'] = score
-                filtered.append(job)
+        mask = scores >= min_score
+        salary_range = self._salary_range()
+        if salary_range:
+            mask &= scorer.features.salary_in_range(*salary_range)
+        posted_since = self._posted_since(now)
+        if posted_since is not None:
+            mask &= scorer.features.posted_within(posted_since)
+        distance = self._distance_filter()
+        if distance is not None:
+            mask &= scorer.features.within_distance(*distance)
+        keep = np.flatnonzero(mask)
+        order = keep[np.argsort(-scores[keep], kind='stable')]
         
-        filtered.sort(key=lambda x: x['match_score'], reverse=True)
+        filtered = []
+        for i in order:
+            job = scorer.features.jobs[i]
+            job['match_score'] = int(scores[i])
+            filtered.append(job)
+        return filtered
+    
+    def _salary_range(self):
+        """(min_salary, max_salary) from preferences, or None when neither is set"""
+        salary_range = (self.preferences.get('min_salary'), self.preferences.get('max_salary'))
+        return salary_range if salary_range != (None, None) else None
+    
+    def _posted_since(self, now):
+        """Start of the 'posted_within_days' window as a timestamp, or None when unset"""
+        days = self.preferences.get('posted_within_days')
+        return None if days is None else now - days * DAY
+    
+    def _distance_filter(self):
+        """(user Location, max_distance_km, include_remote) from preferences, or None when unset"""
+        max_km = self.preferences.get('max_distance_km')
+        if max_km is None:
+            return None
+        origin = normalize_location(self.preferences.get('location', ''))
+        if origin.place_id is None:
+            raise ValueError(f"max_distance_km needs a known 'location' preference, got "
+                             f"{self.preferences.get('location')!r}")
+        return origin, max_km, self.preferences.get('include_remote', True)
+    
+    def update_preferences(self, **changes):
+        """Apply preference changes and return the updated ranking of the last filtered jobs
         
+        Only the score components affected by the change are recomputed: the
+        postings scored last time are re-ranked through the cached scorer,
+        without deduplicating or re-reading the original input. The postings
+        are assumed unchanged since then; after editing them, call
+        filter_jobs again.
+        """
+        self.preferences.update(changes)
+        scorer = self._last_scorer
+        if scorer is None:
+            return []
+        filtered = self._filter_batch(scorer.features.jobs, self.preferences.get('min_match_score', 50),
+                                      time.time(), scorer)
         print(f"✓ Filtered to {len(filtered)} matching jobs\n")
         return filtered
     
-    def _calculate_match_score(self, job):
-        """Calculate how well job matches preferences"""
+    def _calculate_match_score(self, job, now=None):
+        """Calculate how well job matches preferences
+        
+        ``now`` (timestamp, default the current time) is the reference for
+        the optional freshness term.
+        """
         score = 0
+        analysis = analyze_job(job)  # the posting's text, lowercased and parsed once for every agent
         
         required_skills = self.preferences.get('required_skills', [])
-        description = (job.get('title', '') + ' ' + job.get('description', '')).lower()
-        
-        for skill in required_skills:
-            if skill.lower() in description:
-                score += 20
+        # Required skills that are TECH_KEYWORDS were found by the analysis' own automaton pass;
+        # one more pass over its text (title + description) finds all the others at once
+        tech_ids, matcher = self._get_skill_matcher(required_skills)
+        score += 20 * sum(1 for index in tech_ids if index in analysis.keyword_ids)
+        if matcher is not None:
+            score += 20 * len(matcher.matched_indices(analysis.text))
         
         if self.preferences.get('remote_only', False):
-            if 'remote' in job.get('location', '').lower():
+            if analysis.remote:
                 score += 30
         
         salary_str = str(job.get('salary', '')).lower()
+        salary_range = self._salary_range()
         if 'not specified' not in salary_str and salary_str:
-            score += 10
+            # With a salary range preference only in-range salaries earn the bonus
+            if salary_range is None or salary_in_range(job.get('salary'), *salary_range):
+                score += 10
         
         preferred_companies = self.preferences.get('preferred_companies', [])
         for company in preferred_companies:
@@ -148,8 +406,26 @@ class JobSearchAgent:
                 score += 20
                 break
         
+        freshness = freshness_term(self.preferences)
+        if freshness:
+            now = time.time() if now is None else now
+            score += freshness_points(parse_posted(job.get('posted'), now), now, *freshness)
+        
         return min(score, 100)
     
+    def _get_skill_matcher(self, required_skills):
+        """(TECH_KEYWORDS positions, compiled matcher or None) for the current required skills
+        
+        Skills that are TECH_KEYWORDS map to their position; the matcher
+        covers the rest. Rebuilt when the required skills change.
+        """
+        required_skills = list(required_skills)
+        if self._skill_matcher is None or self._skill_matcher[0] != required_skills:
+            tech_ids = [TECH_KEYWORD_IDS[s.lower()] for s in required_skills if s.lower() in TECH_KEYWORD_IDS]
+            others = [s for s in required_skills if s.lower() not in TECH_KEYWORD_IDS]
+            self._skill_matcher = (required_skills, tech_ids, KeywordMatcher(others) if others else None)
+        return self._skill_matcher[1:]
+    
     def rank_jobs(self, jobs):
         """Rank and display jobs by relevance"""
         for i, job in enumerate(jobs[:10], 1):
@@ -162,19 +438,26 @@ class JobSearchAgent:
         
         return jobs
     
-    def auto_apply(self, jobs, max_applications=5):
-        """Auto-apply to top matching jobs"""
+    def auto_apply(self, jobs, max_applications=5, executor=None):
+        """Auto-apply to top matching jobs
+        
+        Submissions go through an apply_executor.BatchApplyExecutor (a dry-run
+        one unless ``executor`` is given), which rate-limits per domain and
+        never applies to the same posting twice. Its ``report`` has
+        throughput, latency percentiles and failure counts.
+        """
+        if executor is not None:
+            self.apply_executor = executor
+        elif self.apply_executor is None:
+            self.apply_executor = BatchApplyExecutor()
         print(f"🤖 Auto-applying to top {max_applications} jobs...\n")
         
-        for job in jobs[:max_applications]:
+        for job, record, error in self.apply_executor.run(jobs[:max_applications]):
+            if error is not None:
+                print(f"✗ Failed: {job['title']} at {job['company']} ({error})")
+                continue
             print(f"✓ Applied to: {job['title']} at {job['company']}")
-            self.applied_jobs.append({
-                'title': job['title'],
-                'company': job['company'],
-                'match_score': job['match_score'],
-                'applied_at': datetime.now().isoformat(),
-                'status': 'Applied'
-            })
+            self.applied_jobs.append(record)
         
         print(f"\n✓ Successfully applied to {len(self.applied_jobs)} jobs")
     
@@ -188,11 +471,13 @@ class JobSearchAgent:
     
     def get_report(self):
         """Generate comprehensive search report"""
+        found = self.jobs_found.unique_seen
         return {
             'search_summary': {
-                'total_found': len(self.jobs_found),
+                'total_found': found,
+                'duplicates_skipped': self.jobs_found.duplicates,
                 'total_applied': len(self.applied_jobs),
-                'success_rate': f"{(len(self.applied_jobs)/len(self.jobs_found)*100):.1f}%" if self.jobs_found else "0%"
+                'success_rate': f"{(len(self.applied_jobs)/found*100):.1f}%" if found else "0%"
             },
             'applications': self.applied_jobs
         }
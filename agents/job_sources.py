@@ -0,0 +1,195 @@
+import gzip
+import json
+import mmap
+import os
+
+
+SAMPLE_JOBS = [
+    {
+        'title': 'Senior Python AI Engineer',
+        'company': 'Amazon Web Services',
+        'location': 'Remote',
+        'description': 'Build AI/ML solutions using Python, AWS, and machine learning frameworks',
+        'url': 'https://amazon.jobs/example1',
+        'salary': '$150k-$200k',
+        'source': 'LinkedIn',
+        'posted': '2024-01-10'
+    },
+    {
+        'title': 'Machine Learning Engineer',
+        'company': 'Google',
+        'location': 'Remote',
+        'description': 'Develop ML models with Python, TensorFlow, and cloud infrastructure',
+        'url': 'https://careers.google.com/example2',
+        'salary': '$160k-$210k',
+        'source': 'Indeed',
+        'posted': '2024-01-12'
+    },
+    {
+        'title': 'AI Research Scientist',
+        'company': 'Microsoft',
+        'location': 'Remote',
+        'description': 'Research and implement cutting-edge AI algorithms using Python and Azure',
+        'url': 'https://careers.microsoft.com/example3',
+        'salary': '$170k-$220k',
+        'source': 'Glassdoor',
+        'posted': '2024-01-11'
+    },
+    {
+        'title': 'Full Stack Developer',
+        'company': 'Startup Inc',
+        'location': 'San Francisco, CA',
+        'description': 'Build web applications with React and Node.js',
+        'url': 'https://startup.com/jobs/example4',
+        'salary': '$120k-$150k',
+        'source': 'AngelList',
+        'posted': '2024-01-13'
+    },
+    {
+        'title': 'Python Backend Engineer',
+        'company': 'TechCorp',
+        'location': 'Remote',
+        'description': 'Develop scalable backend services with Python, Django, and PostgreSQL',
+        'url': 'https://techcorp.com/careers/example5',
+        'salary': '$130k-$170k',
+        'source': 'LinkedIn',
+        'posted': '2024-01-09'
+    },
+    {
+        'title': 'Data Scientist - AI/ML',
+        'company': 'DataCo',
+        'location': 'Remote',
+        'description': 'Apply machine learning and AI to solve business problems with Python',
+        'url': 'https://dataco.com/jobs/example6',
+        'salary': '$140k-$180k',
+        'source': 'Indeed',
+        'posted': '2024-01-14'
+    },
+    {
+        'title': 'DevOps Engineer',
+        'company': 'CloudTech',
+        'location': 'New York, NY',
+        'description': 'Manage AWS infrastructure and CI/CD pipelines',
+        'url': 'https://cloudtech.com/careers/example7',
+        'salary': '$135k-$175k',
+        'source': 'LinkedIn',
+        'posted': '2024-01-08'
+    },
+    {
+        'title': 'AI Engineer - NLP',
+        'company': 'Amazon',
+        'location': 'Remote',
+        'description': 'Build NLP models using Python, transformers, and AWS services',
+        'url': 'https://amazon.jobs/example8',
+        'salary': '$155k-$195k',
+        'source': 'Amazon Jobs',
+        'posted': '2024-01-15'
+    }
+]
+
+
+class JobSource:
+    """Base class for job sources.
+
+    A source is an iterable of posting dicts. Sources yield postings lazily,
+    so a pipeline of ``search_jobs(..., stream=True)`` into
+    ``filter_jobs(..., limit=K)`` holds only the current chunk and the top K
+    in memory, whatever the size of the dump behind the source.
+    """
+
+    def __iter__(self):
+        return self.iter_jobs()
+
+    def iter_jobs(self):
+        raise NotImplementedError
+
+
+class StaticJobSource(JobSource):
+    """Jobs from an in-memory list; each iteration yields fresh copies"""
+
+    def __init__(self, jobs):
+        self.jobs = jobs
+
+    def iter_jobs(self):
+        for job in self.jobs:
+            yield dict(job)
+
+
+class SampleJobSource(StaticJobSource):
+    """Built-in demo listings"""
+
+    def __init__(self):
+        super().__init__(SAMPLE_JOBS)
+
+
+class JsonlJobSource(JobSource):
+    """One JSON posting per line; blank lines are skipped"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def _open(self):
+        return open(self.path, encoding='utf-8')
+
+    def iter_jobs(self):
+        with self._open() as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+
+class GzipJsonlJobSource(JsonlJobSource):
+    """Gzip-compressed JSONL, decompressed as it is read"""
+
+    def _open(self):
+        return gzip.open(self.path, 'rt', encoding='utf-8')
+
+
+class MmapJsonlJobSource(JsonlJobSource):
+    """JSONL read through a read-only memory map
+
+    Processes reading the same file share its pages through the OS page
+    cache instead of each buffering its own copy of the file. The decoded
+    postings are still ordinary per-process objects.
+    """
+
+    def iter_jobs(self):
+        with open(self.path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for line in iter(mapped.readline, b''):
+                    line = line.strip()
+                    if line:
+                        yield json.loads(line)
+
+
+class DirectoryJobSource(JobSource):
+    """Every ``*.jsonl`` and ``*.jsonl.gz`` dump in a directory, in name order"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def files(self):
+        return sorted(os.path.join(self.path, name) for name in os.listdir(self.path)
+                      if name.endswith(('.jsonl', '.jsonl.gz')))
+
+    def iter_jobs(self):
+        for path in self.files():
+            yield from open_source(path)
+
+
+def open_source(path):
+    """Pick the right source for a JSONL file, gzip'd JSONL file or directory of dumps"""
+    if os.path.isdir(path):
+        return DirectoryJobSource(path)
+    if path.endswith('.gz'):
+        return GzipJsonlJobSource(path)
+    return JsonlJobSource(path)
+
+
+def iter_sources(sources):
+    """Chain several sources into one lazy stream of postings"""
+    for source in sources:
+        yield from source
@@ -0,0 +1,305 @@
+import json
+import math
+import re
+import sqlite3
+import time
+
+from job_index import WORD_RE
+from job_sources import JobSource
+from locations import EARTH_RADIUS_KM, haversine_km, normalize_location
+from posted_date import parse_absolute_posted, posted_after
+from salary import annual_range
+
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    url TEXT UNIQUE,
+    title TEXT NOT NULL DEFAULT '',
+    description TEXT NOT NULL DEFAULT '',
+    company TEXT NOT NULL DEFAULT '' COLLATE NOCASE,
+    location TEXT NOT NULL DEFAULT '' COLLATE NOCASE,
+    source TEXT NOT NULL DEFAULT '' COLLATE NOCASE,
+    place_id TEXT,
+    remote INTEGER NOT NULL DEFAULT 0,
+    hybrid INTEGER NOT NULL DEFAULT 0,
+    lat REAL,
+    lon REAL,
+    posted TEXT,
+    posted_at REAL,
+    salary TEXT,
+    salary_min REAL,
+    salary_max REAL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs(location);
+CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company);
+CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs(source);
+CREATE INDEX IF NOT EXISTS idx_jobs_place ON jobs(place_id);
+CREATE INDEX IF NOT EXISTS idx_jobs_remote ON jobs(remote);
+CREATE INDEX IF NOT EXISTS idx_jobs_geo ON jobs(lat);
+CREATE INDEX IF NOT EXISTS idx_jobs_posted ON jobs(posted_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_salary ON jobs(salary_max, salary_min);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, description, content='jobs', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS jobs_ai AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_ad AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_au AFTER UPDATE ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+    INSERT INTO jobs_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+END;
+
+-- Trigram index for substring keywords (JobIndex's default 'substring' mode)
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_trigram USING fts5(
+    title, description, content='jobs', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS jobs_trigram_ai AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_trigram(rowid, title, description) VALUES (new.id, new.title, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_trigram_ad AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_trigram(jobs_trigram, rowid, title, description)
+    VALUES ('delete', old.id, old.title, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_trigram_au AFTER UPDATE ON jobs BEGIN
+    INSERT INTO jobs_trigram(jobs_trigram, rowid, title, description)
+    VALUES ('delete', old.id, old.title, old.description);
+    INSERT INTO jobs_trigram(rowid, title, description) VALUES (new.id, new.title, new.description);
+END;
+"""
+
+# Columns added in schema version 2, derived from location and posted
+DERIVED_COLUMNS = (('place_id', 'TEXT'), ('remote', 'INTEGER NOT NULL DEFAULT 0'),
+                   ('hybrid', 'INTEGER NOT NULL DEFAULT 0'), ('lat', 'REAL'), ('lon', 'REAL'))
+
+UPSERT = """
+INSERT INTO jobs (url, title, description, company, location, source, place_id, remote, hybrid, lat, lon,
+                  posted, posted_at, salary, salary_min, salary_max, data)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(url) DO UPDATE SET
+    title = excluded.title, description = excluded.description, company = excluded.company,
+    location = excluded.location, source = excluded.source, place_id = excluded.place_id,
+    remote = excluded.remote, hybrid = excluded.hybrid, lat = excluded.lat, lon = excluded.lon,
+    posted = excluded.posted, posted_at = excluded.posted_at,
+    salary = excluded.salary, salary_min = excluded.salary_min, salary_max = excluded.salary_max,
+    data = excluded.data
+"""
+
+
+class JobStore(JobSource):
+    """Persistent on-disk job store backed by SQLite.
+
+    Title and description are indexed by two FTS5 tables, one with word
+    tokens and one with trigrams; location (also as normalized place,
+    coordinates and remote/hybrid flags), company, source, parsed posted
+    date and parsed salary are plain indexed columns. Opening a store does
+    not read the corpus, and searches push the keyword, location, salary,
+    posted-date and distance filters and the limit down into SQL, with the
+    same semantics as JobIndex and JobSearchAgent's in-memory filters.
+    Postings are keyed by URL, so re-ingesting a dump updates rows in
+    place. Stores written by an older schema are migrated when opened.
+    """
+
+    def __init__(self, path=':memory:'):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.create_function('haversine_km', 4, haversine_km, deterministic=True)
+        self.conn.create_function('posted_after', 3, posted_after)
+        migrated = self._migrate()
+        self.conn.executescript(SCHEMA)
+        if migrated:
+            self.conn.execute("INSERT INTO jobs_trigram(jobs_trigram) VALUES ('rebuild')")
+            self.conn.commit()
+        self.conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    def close(self):
+        self.conn.close()
+
+    def __len__(self):
+        return self.conn.execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
+
+    def _migrate(self):
+        """Bring a store written by an older schema up to SCHEMA_VERSION; True if it was one
+
+        Adds the derived location columns and fills them, and drops posted_at
+        for relative dates, which are now resolved per query. This runs
+        before the trigram table and its triggers exist; the caller rebuilds
+        that index afterwards.
+        """
+        columns = {row[1] for row in self.conn.execute('PRAGMA table_info(jobs)')}
+        if not columns or 'place_id' in columns:
+            return False
+        rows = self.conn.execute('SELECT id, location, posted FROM jobs').fetchall()
+        with self.conn:
+            for name, declaration in DERIVED_COLUMNS:
+                self.conn.execute(f'ALTER TABLE jobs ADD COLUMN {name} {declaration}')
+            self.conn.executemany(
+                'UPDATE jobs SET place_id = ?, remote = ?, hybrid = ?, lat = ?, lon = ?, posted_at = ? WHERE id = ?',
+                [self._location_columns(location) + (parse_absolute_posted(posted), doc_id)
+                 for doc_id, location, posted in rows])
+        return True
+
+    def add_jobs(self, jobs, batch_size=10000):
+        """Insert or update postings, committing every batch_size rows; returns the count"""
+        count = 0
+        batch = []
+        for job in jobs:
+            batch.append(self._row(job))
+            if len(batch) >= batch_size:
+                count += self._write(batch)
+                batch = []
+        if batch:
+            count += self._write(batch)
+        return count
+
+    def _write(self, rows):
+        with self.conn:
+            self.conn.executemany(UPSERT, rows)
+        return len(rows)
+
+    @staticmethod
+    def _location_columns(location):
+        """(place_id, remote, hybrid, lat, lon) for a raw location string"""
+        place = normalize_location(location)
+        return place.place_id, int(place.remote), int(place.hybrid), place.lat, place.lon
+
+    @classmethod
+    def _row(cls, job):
+        salary_min, salary_max = annual_range(job.get('salary'))
+        # Relative dates ('3 days ago') are stored as text only and resolved per query
+        return (
+            job.get('url'), job.get('title', ''), job.get('description', ''),
+            job.get('company', ''), job.get('location', ''), job.get('source', '')
+        ) + cls._location_columns(job.get('location', '')) + (
+            job.get('posted'), parse_absolute_posted(job.get('posted')), job.get('salary'), salary_min, salary_max,
+            json.dumps(job)
+        )
+
+    @staticmethod
+    def _like(text):
+        return '%' + re.sub(r'([%_\\])', r'\\\1', text) + '%'
+
+    @classmethod
+    def _keyword_filter(cls, keywords, mode, match):
+        """(SQL condition, params) for the keywords with JobIndex semantics, or None if none can match
+
+        'word' mode needs every word of a keyword (FTS5 word tokens);
+        'substring' mode looks keywords up in the trigram index, except those
+        shorter than a trigram, which fall back to LIKE. Every keyword is
+        quoted as an FTS5 string, so punctuation is never parsed as syntax.
+        """
+        joiner = ' AND ' if match == 'all' else ' OR '
+        conditions, params = [], []
+        if mode == 'word':
+            keyword_words = [WORD_RE.findall(k.lower()) for k in keywords]
+            if match == 'all' and not all(keyword_words):
+                return None
+            terms = ['(' + ' AND '.join('"' + w + '"' for w in words) + ')' for words in keyword_words if words]
+            if terms:
+                conditions.append('jobs.id IN (SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ?)')
+                params.append(joiner.join(terms))
+        elif mode == 'substring':
+            terms = ['"' + k.replace('"', '""') + '"' for k in keywords if len(k) >= 3]
+            if terms:
+                conditions.append('jobs.id IN (SELECT rowid FROM jobs_trigram WHERE jobs_trigram MATCH ?)')
+                params.append(joiner.join(terms))
+            for keyword in (k for k in keywords if 0 < len(k) < 3):
+                conditions.append("(jobs.title LIKE ? ESCAPE '\\' OR jobs.description LIKE ? ESCAPE '\\')")
+                params.extend([cls._like(keyword)] * 2)
+        else:
+            raise ValueError(f"Unknown match mode: {mode!r} (expected 'substring' or 'word')")
+        if not conditions:
+            return None
+        return '(' + joiner.join(conditions) + ')', params
+
+    @classmethod
+    def _location_filter(cls, location):
+        """(SQL condition, params) with locations.location_matches semantics"""
+        target = normalize_location(location)
+        if target.place_id is None and not target.remote and not target.hybrid:
+            return "jobs.location LIKE ? ESCAPE '\\'", [cls._like(location)]
+        conditions, params = [], []
+        if target.place_id is not None:
+            conditions.append('jobs.place_id = ?')
+            params.append(target.place_id)
+        if target.remote:
+            conditions.append('jobs.remote = 1')
+        if target.hybrid:
+            conditions.append('jobs.hybrid = 1')
+        return '(' + ' OR '.join(conditions) + ')', params
+
+    @staticmethod
+    def _distance_filter(origin, max_km, include_remote=True):
+        """(SQL condition, params) with locations.within_distance semantics
+
+        A latitude band around ``origin`` narrows the rows through
+        idx_jobs_geo before the exact haversine test.
+        """
+        band = math.degrees(max_km / EARTH_RADIUS_KM)
+        condition = 'jobs.lat BETWEEN ? AND ? AND haversine_km(?, ?, jobs.lat, jobs.lon) <= ?'
+        params = [origin.lat - band, origin.lat + band, origin.lat, origin.lon, max_km]
+        if include_remote:
+            condition = f'(jobs.remote = 1 OR ({condition}))'
+        return condition, params
+
+    def search(self, keywords, location=None, match='any', limit=None, min_salary=None, max_salary=None,
+               posted_since=None, distance=None, mode='substring', now=None):
+        """Postings matching the keywords, in ingest order
+        
+        ``mode`` is JobIndex's keyword mode ('substring' or 'word'). An
+        explicit ``location`` keeps postings matching it as
+        locations.location_matches does. min_salary / max_salary keep
+        postings whose yearly salary range overlaps them. posted_since
+        (POSIX timestamp) keeps postings dated at or after it, resolving
+        relative dates against ``now`` (default the current time).
+        ``distance`` is (origin Location, max_km, include_remote), as
+        within_distance takes it. At most ``limit`` postings are decoded.
+        """
+        sql = ['SELECT jobs.data FROM jobs']
+        where, params = [], []
+
+        if keywords:
+            keyword_filter = self._keyword_filter(keywords, mode, match)
+            if keyword_filter is None:
+                return []
+            where.append(keyword_filter[0])
+            params.extend(keyword_filter[1])
+        if location:
+            condition, location_params = self._location_filter(location)
+            where.append(condition)
+            params.extend(location_params)
+        if distance is not None:
+            condition, distance_params = self._distance_filter(*distance)
+            where.append(condition)
+            params.extend(distance_params)
+        if min_salary is not None:
+            where.append('jobs.salary_max >= ?')
+            params.append(min_salary)
+        if max_salary is not None:
+            where.append('jobs.salary_min <= ?')
+            params.append(max_salary)
+        if posted_since is not None:
+            where.append('(jobs.posted_at >= ? OR (jobs.posted_at IS NULL AND jobs.posted IS NOT NULL'
+                         ' AND posted_after(jobs.posted, ?, ?)))')
+            params.extend([posted_since, posted_since, time.time() if now is None else now])
+
+        if where:
+            sql.append('WHERE ' + ' AND '.join(where))
+        sql.append('ORDER BY jobs.id')
+        if limit is not None:
+            sql.append('LIMIT ?')
+            params.append(limit)
+
+        return [json.loads(data) for (data,) in self.conn.execute(' '.join(sql), params)]
+
+    def iter_jobs(self):
+        for (data,) in self.conn.execute('SELECT data FROM jobs ORDER BY id'):
+            yield json.loads(data)
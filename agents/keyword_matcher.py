@@ -0,0 +1,94 @@
+from collections import deque
+
+
+class KeywordMatcher:
+    """Multi-pattern keyword matcher (Aho-Corasick automaton).
+
+    The automaton is compiled once from a keyword list; each text is then
+    scanned in a single linear pass that reports every occurrence of every
+    keyword, so the cost per document does not grow with the vocabulary.
+
+    Semantics are those of a plain substring test: with the default
+    ``ignore_case=True``, keyword ``k`` is found in ``text`` exactly when
+    ``k.lower() in text.lower()``, and with ``ignore_case=False`` when
+    ``k in text``. Keywords keep their list position, so duplicate entries
+    are reported separately.
+    """
+
+    def __init__(self, keywords, ignore_case=True):
+        self.keywords = list(keywords)
+        self.ignore_case = ignore_case
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        self._always = []  # empty keywords match every text
+        for index, keyword in enumerate(self.keywords):
+            self._insert(self._normalize(keyword), index)
+        self._build_failure_links()
+
+    def _normalize(self, text):
+        return text.lower() if self.ignore_case else text
+
+    def _insert(self, pattern, index):
+        if not pattern:
+            self._always.append(index)
+            return
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append((index, len(pattern)))
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                # Inherit the outputs of the longest proper suffix
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def finditer(self, text):
+        """Yield (start, end, keyword index) for every occurrence, in order of end position
+
+        Positions refer to the normalized (lowercased) text.
+        """
+        for index in self._always:
+            yield 0, 0, index
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for pos, ch in enumerate(self._normalize(text)):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                end = pos + 1
+                for index, length in out[node]:
+                    yield end - length, end, index
+
+    def find_all(self, text):
+        """List of (start, end, keyword) for every occurrence"""
+        return [(start, end, self.keywords[index]) for start, end, index in self.finditer(text)]
+
+    def matched_indices(self, text):
+        """Set of positions in the keyword list whose keyword occurs in text"""
+        return {index for _, _, index in self.finditer(text)}
+
+    def matches(self, text):
+        """Keywords occurring in text, in keyword-list order"""
+        found = self.matched_indices(text)
+        return [kw for index, kw in enumerate(self.keywords) if index in found]
+
+    def found(self, text):
+        """Set of keywords occurring in text"""
+        return {self.keywords[index] for index in self.matched_indices(text)}
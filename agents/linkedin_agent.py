@@ -2,6 +2,13 @@ from datetime import datetime
 import json
 import re
 
+from keyword_matcher import KeywordMatcher
+
+TECH_SKILL_KEYWORDS = ['Python', 'Java', 'JavaScript', 'Machine Learning', 'AI', 'SQL']
+LEADERSHIP_SKILL_KEYWORDS = ['Leadership', 'Management', 'Mentoring', 'Agile']
+# Case-sensitive, like the original ``k in skill`` checks
+SKILL_CATEGORY_MATCHER = KeywordMatcher(TECH_SKILL_KEYWORDS + LEADERSHIP_SKILL_KEYWORDS, ignore_case=False)
+
 class LinkedInAgent:
     def __init__(self, user_profile):
         self.profile = user_profile
@@ -72,13 +79,11 @@ class LinkedInAgent:
             'Tools': []
         }
         
-        tech_keywords = ['Python', 'Java', 'JavaScript', 'Machine Learning', 'AI', 'SQL']
-        leadership_keywords = ['Leadership', 'Management', 'Mentoring', 'Agile']
-        
         for skill in skills:
-            if any(k in skill for k in tech_keywords):
+            found = SKILL_CATEGORY_MATCHER.matched_indices(skill)
+            if any(i < len(TECH_SKILL_KEYWORDS) for i in found):
                 categorized['Technical'].append(skill)
-            elif any(k in skill for k in leadership_keywords):
+            elif found:
                 categorized['Leadership'].append(skill)
             else:
                 categorized['Tools'].append(skill)
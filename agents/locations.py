@@ -0,0 +1,139 @@
+import math
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+Location = namedtuple('Location', ['place_id', 'lat', 'lon', 'remote', 'hybrid'])
+
+# Canonical places: id -> (latitude, longitude, aliases). Aliases are matched as whole words.
+PLACES = {
+    'us-ca-san-francisco': (37.7749, -122.4194, ('san francisco', 'sf', 'bay area')),
+    'us-ca-san-jose': (37.3382, -121.8863, ('san jose',)),
+    'us-ca-palo-alto': (37.4419, -122.1430, ('palo alto',)),
+    'us-ca-mountain-view': (37.3861, -122.0839, ('mountain view',)),
+    'us-ca-los-angeles': (34.0522, -118.2437, ('los angeles',)),
+    'us-ca-san-diego': (32.7157, -117.1611, ('san diego',)),
+    'us-wa-seattle': (47.6062, -122.3321, ('seattle',)),
+    'us-wa-redmond': (47.6740, -122.1215, ('redmond',)),
+    'us-or-portland': (45.5152, -122.6784, ('portland',)),
+    'us-co-denver': (39.7392, -104.9903, ('denver',)),
+    'us-tx-austin': (30.2672, -97.7431, ('austin',)),
+    'us-tx-dallas': (32.7767, -96.7970, ('dallas',)),
+    'us-il-chicago': (41.8781, -87.6298, ('chicago',)),
+    'us-ny-new-york': (40.7128, -74.0060, ('new york', 'nyc', 'manhattan', 'brooklyn')),
+    'us-ma-boston': (42.3601, -71.0589, ('boston', 'cambridge, ma')),
+    'us-dc-washington': (38.9072, -77.0369, ('washington, dc', 'washington dc')),
+    'us-ga-atlanta': (33.7490, -84.3880, ('atlanta',)),
+    'ca-on-toronto': (43.6532, -79.3832, ('toronto',)),
+    'ca-bc-vancouver': (49.2827, -123.1207, ('vancouver',)),
+    'gb-london': (51.5074, -0.1278, ('london',)),
+    'de-berlin': (52.5200, 13.4050, ('berlin',)),
+    'nl-amsterdam': (52.3676, 4.9041, ('amsterdam',)),
+    'ie-dublin': (53.3498, -6.2603, ('dublin',)),
+    'fr-paris': (48.8566, 2.3522, ('paris',)),
+    'in-bengaluru': (12.9716, 77.5946, ('bengaluru', 'bangalore')),
+    'sg-singapore': (1.3521, 103.8198, ('singapore',)),
+}
+
+_ALIASES = {alias: place_id for place_id, (_, _, aliases) in PLACES.items() for alias in aliases}
+# Longest alias first, so 'san francisco' wins over 'sf'-style short forms in the same string
+_ALIAS_RE = re.compile(r'\b(' + '|'.join(re.escape(a) for a in sorted(_ALIASES, key=len, reverse=True)) + r')\b')
+
+EARTH_RADIUS_KM = 6371.0
+
+
+@lru_cache(maxsize=65536)
+def normalize_location(raw):
+    """Map a raw location string to a Location: canonical place id and coordinates
+    (None when no known place is named) plus remote / hybrid flags
+
+    ``remote`` keeps the original rule, 'remote' anywhere in the string, so
+    'Remote - US' and 'Remote (EU)' are remote. Results are cached by raw
+    string, since postings repeat a small set of locations.
+    """
+    text = (raw or '').lower()
+    match = _ALIAS_RE.search(text)
+    place_id = _ALIASES[match.group(1)] if match else None
+    lat, lon = PLACES[place_id][:2] if place_id else (None, None)
+    return Location(place_id, lat, lon, 'remote' in text, 'hybrid' in text)
+
+
+def location_matches(raw, wanted):
+    """Whether a posting location matches a requested location string
+
+    Both sides go through normalize_location: a requested place matches
+    postings at that place, and 'remote' / 'hybrid' match remote / hybrid
+    postings ('Remote or SF' matches either). A request naming none of
+    these falls back to a case-insensitive substring test.
+    """
+    target = normalize_location(wanted)
+    location = normalize_location(raw)
+    if target.place_id is None and not target.remote and not target.hybrid:
+        return wanted.lower() in (raw or '').lower()
+    return (target.place_id is not None and location.place_id == target.place_id) or \
+        (target.remote and location.remote) or (target.hybrid and location.hybrid)
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Great-circle distance in kilometres"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = (math.sin((phi2 - phi1) / 2) ** 2
+         + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def within_distance(raw, origin, max_distance_km, include_remote=True):
+    """Whether a posting location is within ``max_distance_km`` of ``origin`` (a Location)
+
+    Remote postings count as within any distance unless ``include_remote`` is False.
+    """
+    location = normalize_location(raw)
+    if include_remote and location.remote:
+        return True
+    return location.place_id is not None and \
+        haversine_km(origin.lat, origin.lon, location.lat, location.lon) <= max_distance_km
+
+
+class GeoGridIndex:
+    """Posting ids bucketed into a lat/lon grid of ``cell_degrees`` cells.
+
+    A radius query visits only the cells overlapping the circle's bounding
+    box and checks exact haversine distance for the postings in them.
+    Postings without a known place are not indexed.
+    """
+
+    def __init__(self, cell_degrees=1.0):
+        self.cell_degrees = cell_degrees
+        self._cells = {}  # (row, col) -> [(doc id, lat, lon)]
+
+    def __len__(self):
+        return sum(len(docs) for docs in self._cells.values())
+
+    def _cell(self, lat, lon):
+        return math.floor(lat / self.cell_degrees), math.floor(lon / self.cell_degrees)
+
+    def add(self, doc_id, raw_location):
+        location = normalize_location(raw_location)
+        if location.place_id is not None:
+            self._cells.setdefault(self._cell(location.lat, location.lon), []).append(
+                (doc_id, location.lat, location.lon))
+
+    def within_ids(self, lat, lon, radius_km):
+        """Sorted doc ids within ``radius_km`` of (lat, lon)"""
+        angle = radius_km / EARTH_RADIUS_KM
+        lat_lo, lat_hi = lat - math.degrees(angle), lat + math.degrees(angle)
+        if lat_lo <= -90.0 or lat_hi >= 90.0 or angle >= math.pi / 2:
+            dlon = 180.0  # the circle contains a pole: every longitude
+        else:
+            dlon = math.degrees(math.asin(math.sin(angle) / math.cos(math.radians(lat))))
+        row_lo, col_lo = self._cell(max(lat_lo, -90.0), lon - dlon)
+        row_hi, col_hi = self._cell(min(lat_hi, 90.0), lon + dlon)
+        cols = self._cell(0.0, 180.0)[1]  # columns per hemisphere, for wrapping at the antimeridian
+        ids = []
+        for row in range(row_lo, row_hi + 1):
+            for col in range(col_lo, col_hi + 1):
+                wrapped = (col + cols) % (2 * cols) - cols
+                for doc_id, doc_lat, doc_lon in self._cells.get((row, wrapped), ()):
+                    if haversine_km(lat, lon, doc_lat, doc_lon) <= radius_km:
+                        ids.append(doc_id)
+        return sorted(set(ids))
@@ -0,0 +1,145 @@
+import io
+import json
+import os
+import re
+import shutil
+import tarfile
+import tempfile
+import zipfile
+
+# Archive suffix -> tarfile write mode, or None for zip
+ARCHIVE_MODES = {'.zip': None, '.tar': 'w', '.tar.gz': 'w:gz', '.tgz': 'w:gz'}
+MANIFEST_NAME = 'manifest.jsonl'
+
+
+def package_slug(job, max_length=60):
+    """File-name-safe company_title for a job"""
+    slug = re.sub(r'[^A-Za-z0-9]+', '_', f"{job.get('company', '')}_{job.get('title', '')}").strip('_')
+    return slug[:max_length] or 'job'
+
+
+class _StreamWriter:
+    """Write-only view of a file, so zipfile streams members (with data descriptors)
+    instead of seeking back to patch each header, which would flush the buffer"""
+
+    def __init__(self, file):
+        self.write = file.write
+        self.flush = file.flush
+
+    def tell(self):
+        raise OSError("not seekable")
+
+
+class PackageArchive:
+    """Stream many application packages into one zip or tar archive.
+
+    Package n is stored as ``{n:06d}-{company}_{title}/resume.txt`` and
+    ``cover_letter.txt``; the sequence number keeps names unique when jobs
+    share a title. On close, ``manifest.jsonl`` is appended, one line per
+    package (its directory, job title, company and URL, match score and
+    generation time), for finding a package without reading the archive.
+
+    The archive file is written through a ``buffer_size`` buffer and synced
+    to disk once, on close. Packages are written one at a time and nothing
+    is kept per package but its manifest line, which waits in a temporary
+    file: zip members are rendered straight into the archive, and tar
+    members (whose size must be known up front) are rendered to memory one
+    file at a time.
+
+    Zip members are stored uncompressed by default: a fresh deflate stream
+    per small member costs more time than it saves space. Pass
+    ``compression=zipfile.ZIP_DEFLATED`` to compress them anyway, or use
+    .tar.gz, which compresses across packages and comes out far smaller.
+    ``compresslevel`` applies to either.
+    """
+
+    def __init__(self, path, generator, buffer_size=1 << 20, compression=zipfile.ZIP_STORED, compresslevel=6):
+        mode = next((m for suffix, m in ARCHIVE_MODES.items() if path.endswith(suffix)), False)
+        if mode is False:
+            raise ValueError(f"Unknown archive type: {path!r} (expected {', '.join(ARCHIVE_MODES)})")
+        self.path = path
+        self.generator = generator
+        self.count = 0
+        self._file = open(path, 'wb', buffering=buffer_size)
+        if mode is None:
+            self._zip = zipfile.ZipFile(_StreamWriter(self._file), 'w', compression=compression,
+                                        compresslevel=compresslevel)
+            self._tar = None
+        else:
+            self._zip = None
+            options = {'compresslevel': compresslevel} if mode.endswith('gz') else {}
+            self._tar = tarfile.open(fileobj=self._file, mode=mode, **options)
+        self._manifest = tempfile.TemporaryFile()
+
+    def add(self, package):
+        """Write one package; returns its manifest entry"""
+        directory = f"{self.count:06d}-{package_slug(package['job'])}"
+        self._write(f"{directory}/resume.txt",
+                    lambda out: self.generator.resume_gen.write_resume_text(package['resume'], out))
+        self._write(f"{directory}/cover_letter.txt",
+                    lambda out: self.generator.cover_letter_gen.write_cover_letter_text(package['cover_letter'], out))
+
+        job = package['job']
+        entry = {
+            'directory': directory,
+            'title': job.get('title', ''),
+            'company': job.get('company', ''),
+            'url': job.get('url', ''),
+            'match_score': package['resume'].get('match_score'),
+            'generated_at': package.get('generated_at')
+        }
+        self._manifest.write(json.dumps(entry).encode('utf-8') + b'\n')
+        self.count += 1
+        return entry
+
+    def _write(self, name, render):
+        if self._zip is not None:
+            with self._zip.open(name, 'w') as member, io.TextIOWrapper(member, encoding='utf-8') as out:
+                render(out)
+            return
+        out = io.StringIO()
+        render(out)
+        data = out.getvalue().encode('utf-8')
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        self._tar.addfile(info, io.BytesIO(data))
+
+    def _write_manifest(self):
+        size = self._manifest.tell()
+        self._manifest.seek(0)
+        if self._zip is not None:
+            with self._zip.open(MANIFEST_NAME, 'w') as member:
+                shutil.copyfileobj(self._manifest, member)
+        else:
+            info = tarfile.TarInfo(MANIFEST_NAME)
+            info.size = size
+            self._tar.addfile(info, self._manifest)
+
+    def close(self):
+        if self._file.closed:
+            return
+        try:
+            self._write_manifest()
+            (self._zip or self._tar).close()
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        finally:
+            self._manifest.close()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_manifest(path):
+    """Manifest entries of an archive written by PackageArchive"""
+    if path.endswith('.zip'):
+        with zipfile.ZipFile(path) as archive:
+            data = archive.read(MANIFEST_NAME)
+    else:
+        with tarfile.open(path) as archive:
+            data = archive.extractfile(MANIFEST_NAME).read()
+    return [json.loads(line) for line in data.decode('utf-8').splitlines()]
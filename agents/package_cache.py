@@ -0,0 +1,129 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+# Job fields the resume and cover letter read; nothing else affects a package
+PACKAGE_JOB_FIELDS = ('title', 'company', 'description')
+# Package fields kept in the cache; 'job' is supplied again by the caller on every hit
+CACHED_FIELDS = ('resume', 'cover_letter', 'generated_at')
+
+
+def package_key(profile_fingerprint, job, version):
+    """Content address of a package: hash of (profile fingerprint, job fields used, generator version)"""
+    payload = json.dumps([profile_fingerprint, [job.get(f) for f in PACKAGE_JOB_FIELDS], version],
+                         default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class PackageCache:
+    """Two-tier cache of generated packages, keyed by package_key.
+
+    Entries are a package's resume, cover letter and generation time as
+    JSON text, so every hit decodes a fresh copy that callers may modify
+    freely. The memory tier is an LRU of ``max_items`` entries. With a
+    ``directory`` there is also a disk tier of one file per key, kept under
+    ``max_disk_bytes`` by evicting the least recently used files. A disk hit
+    is promoted to memory.
+    Writes go to a temporary file that is then renamed into place, so
+    concurrent readers never see partial entries.
+    """
+
+    def __init__(self, directory=None, max_items=256, max_disk_bytes=64 * 1024 * 1024):
+        self.directory = directory
+        self.max_items = max_items
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()  # key -> JSON text
+        self._disk = OrderedDict()    # key -> file size, least recently used first
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            entries = sorted((e for e in os.scandir(directory) if e.name.endswith('.json')),
+                             key=lambda e: e.stat().st_mtime)
+            for entry in entries:
+                size = entry.stat().st_size
+                self._disk[entry.name[:-5]] = size
+                self._disk_bytes += size
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.json')
+
+    def get(self, key):
+        """Cached {'resume', 'cover_letter', 'generated_at'} for key, or None"""
+        with self._lock:
+            text = self._memory.get(key)
+            if text is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return json.loads(text)
+            if key in self._disk:
+                try:
+                    with open(self._path(key), encoding='utf-8') as f:
+                        text = f.read()
+                except FileNotFoundError:  # removed behind our back
+                    self._disk_bytes -= self._disk.pop(key)
+                else:
+                    self._disk.move_to_end(key)
+                    os.utime(self._path(key))
+                    self._remember(key, text)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return json.loads(text)
+            self.misses += 1
+            return None
+
+    def put(self, key, package):
+        text = json.dumps({field: package[field] for field in CACHED_FIELDS})
+        with self._lock:
+            self._remember(key, text)
+            if self.directory:
+                self._write(key, text)
+
+    def _remember(self, key, text):
+        self._memory[key] = text
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+
+    def _write(self, key, text):
+        data = text.encode('utf-8')
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, self._path(key))
+        self._disk_bytes += len(data) - self._disk.pop(key, 0)
+        self._disk[key] = len(data)
+        while self._disk_bytes > self.max_disk_bytes and len(self._disk) > 1:
+            old_key, size = self._disk.popitem(last=False)
+            self._disk_bytes -= size
+            try:
+                os.remove(self._path(old_key))
+            except FileNotFoundError:
+                pass
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            for key in self._disk:
+                try:
+                    os.remove(self._path(key))
+                except FileNotFoundError:
+                    pass
+            self._disk.clear()
+            self._disk_bytes = 0
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'memory_entries': len(self._memory),
+            'disk_entries': len(self._disk),
+            'disk_bytes': self._disk_bytes
+        }
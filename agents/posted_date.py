@@ -0,0 +1,139 @@
+import re
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:  # only PostedIndex needs numpy
+    np = None
+
+DAY = 86400.0
+RELATIVE_RE = re.compile(r'(\d+)\+?\s*(minute|min|hour|hr|day|week|month)s?\s+ago', re.IGNORECASE)
+UNIT_SECONDS = {'minute': 60, 'min': 60, 'hour': 3600, 'hr': 3600, 'day': DAY, 'week': 7 * DAY, 'month': 30 * DAY}
+RELATIVE_DAYS = {'just posted': 0, 'today': 0, 'yesterday': 1}
+FRESHNESS_HALF_LIFE_DAYS = 7
+
+
+@lru_cache(maxsize=65536)
+def _parse_absolute(text):
+    try:
+        posted = datetime.fromisoformat(text.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if posted.tzinfo is None:
+        posted = posted.replace(tzinfo=timezone.utc)
+    return posted.timestamp()
+
+
+def parse_absolute_posted(text):
+    """Timestamp of an absolute (ISO) posted date; None for relative, unparsable or missing ones"""
+    if not text:
+        return None
+    return _parse_absolute(str(text).strip())
+
+
+def parse_posted(text, now=None):
+    """Parse a posted date into a POSIX timestamp, or None if it cannot be parsed
+
+    Accepts ISO dates and datetimes ('2024-01-15', naive ones are taken as
+    UTC) and relative forms ('3 days ago', 'yesterday'), which are resolved
+    against ``now`` (default: the current time). Absolute dates are cached
+    by string.
+    """
+    if not text:
+        return None
+    text = str(text).strip()
+    timestamp = _parse_absolute(text)
+    if timestamp is not None:
+        return timestamp
+    now = time.time() if now is None else now
+    lowered = text.lower()
+    if lowered in RELATIVE_DAYS:
+        return now - RELATIVE_DAYS[lowered] * DAY
+    match = RELATIVE_RE.search(lowered)
+    if match:
+        return now - int(match.group(1)) * UNIT_SECONDS[match.group(2)]
+    return None
+
+
+def posted_after(text, since, now=None):
+    """Whether a posted date parses and is at or after ``since`` (timestamp)"""
+    timestamp = parse_posted(text, now)
+    return timestamp is not None and timestamp >= since
+
+
+def freshness_term(preferences):
+    """(weight, half life in days) from the 'freshness_weight' / 'freshness_half_life_days'
+    preferences, or None when the freshness term is off"""
+    weight = preferences.get('freshness_weight')
+    if not weight:
+        return None
+    return weight, preferences.get('freshness_half_life_days', FRESHNESS_HALF_LIFE_DAYS)
+
+
+def freshness_points(posted_at, now, weight, half_life_days):
+    """Freshness term: ``weight`` points halving every ``half_life_days`` of age (0 when undated)
+
+    Postings dated in the future count as brand new.
+    """
+    if posted_at is None:
+        return 0
+    age = max(now - posted_at, 0.0) / DAY
+    return round(weight * 0.5 ** (age / half_life_days))
+
+
+class PostedIndex:
+    """Posting ids ordered by posted timestamp, for time-window queries.
+
+    Absolute dates are parsed once when a posting is added. A window query
+    is two binary searches over the sorted timestamps, so "posted in the
+    last N days" costs the size of the window, not the corpus. Relative
+    dates ('3 days ago') are kept as text and resolved against each query's
+    ``now``, as the per-job filters do. The sorted arrays are rebuilt
+    lazily after additions.
+    """
+
+    def __init__(self):
+        if np is None:
+            raise ImportError("PostedIndex requires numpy: pip install numpy")
+        self._ids = []
+        self._times = []
+        self._relative = []  # (doc id, posted text)
+        self._sorted = None
+
+    def __len__(self):
+        return len(self._ids) + len(self._relative)
+
+    def add(self, doc_id, posted):
+        """Index a posting's date; undated postings are skipped"""
+        timestamp = parse_absolute_posted(posted)
+        if timestamp is not None:
+            self._ids.append(doc_id)
+            self._times.append(timestamp)
+            self._sorted = None
+        elif parse_posted(posted) is not None:
+            self._relative.append((doc_id, posted))
+
+    def _arrays(self):
+        if self._sorted is None:
+            times = np.asarray(self._times, dtype=np.float64)
+            order = np.argsort(times, kind='stable')
+            self._sorted = (times[order], np.asarray(self._ids, dtype=np.int64)[order])
+        return self._sorted
+
+    def window_ids(self, since=None, until=None, now=None):
+        """Sorted doc ids posted within [since, until] (timestamps); relative dates are resolved against ``now``"""
+        times, ids = self._arrays()
+        start = 0 if since is None else np.searchsorted(times, since, side='left')
+        end = len(times) if until is None else np.searchsorted(times, until, side='right')
+        ids = ids[start:end]
+        if self._relative:
+            now = time.time() if now is None else now
+            relative = []
+            for doc_id, posted in self._relative:
+                timestamp = parse_posted(posted, now)
+                if (since is None or timestamp >= since) and (until is None or timestamp <= until):
+                    relative.append(doc_id)
+            ids = np.concatenate((ids, np.asarray(relative, dtype=np.int64)))
+        return np.sort(ids)
@@ -1,17 +1,242 @@
+from collections import namedtuple
+from concurrent.futures import Executor, FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from datetime import datetime
+from functools import cached_property
+from itertools import chain, islice
+import contextlib
+import copy
+import hashlib
+import io
 import json
+import marshal
+import os
 import re
+import threading
+
+from job_analysis import TECH_KEYWORDS, analyze_job, memoized_analysis, remember_analysis
+from package_archive import PackageArchive
+from package_cache import package_key
+from templates import COVER_LETTER_TEMPLATE, RESUME_TEMPLATE, load_layout
+
+try:
+    import numpy as np
+except ImportError:  # generate_resumes falls back to per-job bullet ranking
+    np = None
+
+# Bump whenever generated resume or cover letter content changes, so cached packages are not reused
+GENERATOR_VERSION = 1
+
+# Inputs each section reads: regenerate_resume / regenerate_cover_letter rebuild a section
+# only when one of these changed. 'profile' is the profile fingerprint and 'keywords' the
+# TECH_KEYWORDS found in the description, so a description edit that names the same
+# technologies rebuilds nothing.
+RESUME_SECTION_INPUTS = {
+    'header': ('profile',),
+    'summary': ('profile', 'title', 'keywords'),
+    'skills': ('profile', 'keywords'),
+    'experience': ('profile', 'keywords'),
+    'education': ('profile',),
+    'match_score': ('profile', 'keywords')
+}
+COVER_LETTER_SECTION_INPUTS = {
+    'date': ('date',),
+    'greeting': ('company',),
+    'opening': ('profile', 'title', 'company'),
+    'body': ('profile', 'company'),
+    'closing': ('company',),
+    'signature': ('profile',)
+}
+
+
+def resume_inputs(job, fingerprint):
+    """Values of the RESUME_SECTION_INPUTS for a job and profile fingerprint"""
+    return {
+        'profile': fingerprint,
+        'title': job['title'],
+        'keywords': list(analyze_job(job).skills)
+    }
+
+
+def cover_letter_inputs(job, fingerprint, date=None):
+    """Values of the COVER_LETTER_SECTION_INPUTS; ``date`` defaults to today"""
+    return {
+        'profile': fingerprint,
+        'title': job['title'],
+        'company': job['company'],
+        'date': date or datetime.now().strftime("%B %d, %Y")
+    }
+
+
+def _stale_sections(section_inputs, old, new):
+    """Sections reading an input whose value differs between the ``old`` and ``new`` inputs"""
+    changed = {name for name, value in new.items() if old.get(name) != value}
+    return [section for section, names in section_inputs.items() if changed.intersection(names)]
+
+
+# One generate_packages outcome: package is None and error is set when generation failed
+PackageResult = namedtuple('PackageResult', ['index', 'job', 'package', 'error'])
+
+
+def profile_fingerprint(profile):
+    """Stable hash of a profile's contents (independent of key order and process)"""
+    return hashlib.sha256(json.dumps(profile, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def _profile_snapshot(profile):
+    """Cheap exact serialization of a profile, used as the compiled-profile cache key"""
+    try:
+        return marshal.dumps(profile, 2)  # version 2: no object references, so equal contents give equal bytes
+    except ValueError:  # values marshal cannot encode, e.g. datetimes
+        return repr(profile).encode('utf-8')
+
+
+class CompiledProfile:
+    """Everything the generators derive from a profile alone, computed once per profile version.
+
+    Holds the normalized skill set, the lowercased bullets of every role and
+    the frozen header/education sections, so generating a package only pays
+    for the per-job work. The header and cover-letter sentences are built on
+    first use, so a profile that cannot produce them (no email, no skills)
+    fails only where it did before.
+    """
+
+    def __init__(self, profile):
+        # A private copy, so later edits to the caller's dict cannot leak into this version
+        profile = self.profile = copy.deepcopy(profile)
+        self.years = profile.get('years_experience', 5)
+        self.education = profile.get('education', [])
+        self.skills = profile.get('skills', [])
+        self.skill_set = frozenset(s.lower() for s in self.skills)
+        # (title, company, duration, bullets, lowercased bullets) per role
+        self.experience = [
+            (exp['title'], exp['company'], exp['duration'], exp.get('bullets', []),
+             [b.lower() for b in exp.get('bullets', [])])
+            for exp in profile.get('experience', [])
+        ]
+
+    @cached_property
+    def bullet_matrix(self):
+        """(bullets x TECH_KEYWORDS incidence matrix, [(start, end)] row span per role)
+
+        Entry [b, k] is 1 when keyword k occurs (case-insensitively, as a
+        substring) in bullet b, the test _build_experience applies.
+        """
+        spans, rows = [], []
+        for _, _, _, _, bullets_lower in self.experience:
+            spans.append((len(rows), len(rows) + len(bullets_lower)))
+            rows.extend([kw.lower() in bullet for kw in TECH_KEYWORDS] for bullet in bullets_lower)
+        matrix = np.array(rows, dtype=np.int32).reshape(len(rows), len(TECH_KEYWORDS))
+        return matrix, spans
+
+    @cached_property
+    def header(self):
+        return {
+            'name': self.profile['name'],
+            'email': self.profile['email'],
+            'phone': self.profile['phone'],
+            'location': self.profile['location'],
+            'linkedin': self.profile.get('linkedin', '')
+        }
+
+    @cached_property
+    def fingerprint(self):
+        return profile_fingerprint(self.profile)
+
+    @cached_property
+    def skills_sentence(self):
+        skills = self.skills[:5]
+        return f"My technical expertise includes {', '.join(skills[:-1])}, and {skills[-1]}. " \
+               f"I have successfully applied these technologies to build scalable, high-performance systems " \
+               f"that drive business value and enhance user experiences."
+
+    @cached_property
+    def recent_role(self):
+        """Opening of the recent-experience paragraph, or None without experience"""
+        if not self.profile.get('experience'):
+            return None
+        recent = self.profile['experience'][0]
+        return f"In my recent role as {recent['title']} at {recent['company']}, " \
+               f"I {recent['bullets'][0].lower()} This experience has prepared me to make immediate "
+
+
+_compiled_profiles = {}  # profile snapshot -> CompiledProfile, shared by every generator in the process
+_compiled_profiles_lock = threading.Lock()  # generate_packages threads compile concurrently
+MAX_COMPILED_PROFILES = 64
+
+
+def compile_profile(profile):
+    """CompiledProfile for the profile's current contents, reused while they are unchanged
+
+    The cache key is a snapshot of the contents, so editing the profile in
+    place (adding a skill, rewording a bullet) compiles a new version.
+    """
+    snapshot = _profile_snapshot(profile)
+    with _compiled_profiles_lock:
+        compiled = _compiled_profiles.get(snapshot)
+    if compiled is None:
+        compiled = CompiledProfile(profile)
+        with _compiled_profiles_lock:
+            if snapshot not in _compiled_profiles and len(_compiled_profiles) >= MAX_COMPILED_PROFILES:
+                del _compiled_profiles[next(iter(_compiled_profiles))]
+            # A thread that compiled the same snapshot first wins, so every caller shares one
+            compiled = _compiled_profiles.setdefault(snapshot, compiled)
+    return compiled
+
+
+def _changed_sections(before, after, sections):
+    """{section: {'before', 'after'}} for the given sections whose value differs"""
+    return {section: {'before': before.get(section), 'after': after[section]}
+            for section in sections if before.get(section) != after[section]}
+
+
+def _generate_chunk(generator, jobs, compiled=None):
+    """Pool task: (package, None) or (None, error) for each job, so one failure spares the rest"""
+    compiled = compiled or compile_profile(generator.profile)
+    resumes = [None] * len(jobs)
+    if len(jobs) > 1:
+        try:
+            resumes = generator.resume_gen.generate_resumes(jobs, compiled)
+        except Exception:
+            pass  # a bad job fails again on its own below, without taking the others with it
+    results = []
+    for job, resume in zip(jobs, resumes):
+        try:
+            results.append((generator.generate_package(job, compiled, resume), None))
+        except Exception as e:
+            results.append((None, e))
+    return results
+
+
+def _generate_chunk_quietly(profile, jobs, analyses=()):
+    """Process-pool task: _generate_chunk with the per-job progress output suppressed
+    
+    ``analyses`` are JobAnalysis objects the parent already made for these
+    jobs, so the worker does not parse them again.
+    """
+    for analysis in analyses:
+        remember_analysis(analysis)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return _generate_chunk(ApplicationPackageGenerator(profile), jobs)
+
 
 class ResumeGenerator:
-    def __init__(self, user_profile):
+    def __init__(self, user_profile, layout=None):
         self.profile = user_profile
+        self.compiled = None
+        self.layout = load_layout(layout, RESUME_TEMPLATE)  # a Template or a layout file path
+        
+    def generate_resume(self, job, compiled=None):
+        """Generate tailored resume for specific job
         
-    def generate_resume(self, job):
-        """Generate tailored resume for specific job"""
+        Profile-derived sections come from ``compiled`` (a CompiledProfile),
+        looked up by the profile's current fingerprint when not given.
+        """
         print(f"📄 Generating resume for: {job['title']} at {job['company']}\n")
         
+        self.compiled = compiled or compile_profile(self.profile)
+        
         # Extract keywords from job description
-        keywords = self._extract_keywords(job['description'])
+        keywords = self._extract_keywords(job)
         
         # Build tailored resume
         resume = {
@@ -25,27 +250,105 @@ class ResumeGenerator:
         
         return resume
     
-    def _extract_keywords(self, description):
-        """Extract important keywords from job description"""
-        tech_keywords = ['Python', 'AWS', 'Machine Learning', 'AI', 'TensorFlow', 
-                        'Docker', 'Kubernetes', 'SQL', 'React', 'Node.js', 'Java',
-                        'Django', 'Flask', 'PostgreSQL', 'MongoDB', 'Git']
-        
-        found = [kw for kw in tech_keywords if kw.lower() in description.lower()]
-        return found
+    def generate_resumes(self, jobs, compiled=None):
+        """Tailored resumes for many jobs at once, identical to calling generate_resume per job
+        
+        Bullet relevance for the whole batch is one matrix product: a jobs x
+        keywords incidence matrix times the profile's keywords x bullets
+        matrix (built once per profile version). Each role's top 4 bullets
+        then come from a stable descending argsort per row, which keeps the
+        per-job method's tie order (profile order).
+        """
+        jobs = list(jobs)
+        self.compiled = compiled or compile_profile(self.profile)
+        print(f"📄 Generating {len(jobs)} resumes\n")
+        
+        keyword_ids = [analyze_job(job).skill_ids for job in jobs]
+        keyword_lists = [[TECH_KEYWORDS[i] for i in ids] for ids in keyword_ids]
+        if np is None:
+            experiences = [self._build_experience(job, keywords) for job, keywords in zip(jobs, keyword_lists)]
+        else:
+            experiences = self._build_experiences(keyword_ids)
+        
+        return [{
+            'header': self._build_header(),
+            'summary': self._build_summary(job, keywords),
+            'skills': self._build_skills(keywords),
+            'experience': experience,
+            'education': self._build_education(),
+            'match_score': self._calculate_keyword_match(keywords)
+        } for job, keywords, experience in zip(jobs, keyword_lists, experiences)]
+    
+    def regenerate_resume(self, job, resume, inputs, compiled=None):
+        """Bring ``resume`` up to date with ``job``, rebuilding only the sections whose inputs changed
+        
+        ``inputs`` are the resume_inputs the resume was built from. Returns
+        (resume, inputs, rebuilt): an updated copy, the inputs it now
+        reflects and the names of the rebuilt sections, in section order.
+        """
+        self.compiled = compiled or compile_profile(self.profile)
+        new_inputs = resume_inputs(job, self.compiled.fingerprint)
+        rebuilt = _stale_sections(RESUME_SECTION_INPUTS, inputs, new_inputs)
+        resume = dict(resume)
+        for section in rebuilt:
+            resume[section] = self._build_section(section, job, new_inputs['keywords'])
+        return resume, new_inputs, rebuilt
+    
+    def _build_section(self, section, job, keywords):
+        """One resume section, as generate_resume builds it"""
+        if section == 'header':
+            return self._build_header()
+        if section == 'summary':
+            return self._build_summary(job, keywords)
+        if section == 'skills':
+            return self._build_skills(keywords)
+        if section == 'experience':
+            return self._build_experience(job, keywords)
+        if section == 'education':
+            return self._build_education()
+        if section == 'match_score':
+            return self._calculate_keyword_match(keywords)
+        raise ValueError(f"Unknown resume section: {section!r}")
+    
+    def _build_experiences(self, keyword_ids):
+        """Experience sections for a batch of jobs, given each job's TECH_KEYWORDS indices"""
+        bullet_matrix, spans = self._profile().bullet_matrix
+        job_matrix = np.zeros((len(keyword_ids), len(TECH_KEYWORDS)), dtype=np.int32)
+        rows = np.repeat(np.arange(len(keyword_ids)), [len(ids) for ids in keyword_ids])
+        job_matrix[rows, np.fromiter(chain.from_iterable(keyword_ids), dtype=np.intp, count=len(rows))] = 1
+        relevance = job_matrix @ bullet_matrix.T  # jobs x bullets
+        
+        experiences = [[] for _ in keyword_ids]
+        for (title, company, duration, bullets, _), (start, end) in zip(self._profile().experience, spans):
+            top = np.argsort(-relevance[:, start:end], axis=1, kind='stable')[:, :4]
+            selections = {}  # few distinct orderings recur across jobs: pick their bullets once
+            for experience, order in zip(experiences, map(tuple, top.tolist())):
+                selected = selections.get(order)
+                if selected is None:
+                    selected = selections[order] = [bullets[i] for i in order]
+                experience.append({
+                    'title': title,
+                    'company': company,
+                    'duration': duration,
+                    'bullets': list(selected)
+                })
+        return experiences
+    
+    def _extract_keywords(self, job):
+        """Important keywords of the job description, from the job's shared JobAnalysis"""
+        return list(analyze_job(job).skills)
+    
+    def _profile(self):
+        if self.compiled is None:
+            self.compiled = compile_profile(self.profile)
+        return self.compiled
     
     def _build_header(self):
-        return {
-            'name': self.profile['name'],
-            'email': self.profile['email'],
-            'phone': self.profile['phone'],
-            'location': self.profile['location'],
-            'linkedin': self.profile.get('linkedin', '')
-        }
+        return dict(self._profile().header)
     
     def _build_summary(self, job, keywords):
         """Generate tailored professional summary"""
-        years = self.profile.get('years_experience', 5)
+        years = self._profile().years
         top_skills = ', '.join(keywords[:3]) if keywords else 'software development'
         
         return f"{years}+ years experienced {job['title']} specializing in {top_skills}. " \
@@ -53,7 +356,8 @@ class ResumeGenerator:
     
     def _build_skills(self, keywords):
         """Build skills section prioritizing job keywords"""
-        all_skills = self.profile.get('skills', [])
+        all_skills = self._profile().skills
+        keywords = set(keywords)
         
         # Prioritize matching keywords
         matched = [s for s in all_skills if s in keywords]
@@ -64,36 +368,30 @@ class ResumeGenerator:
     def _build_experience(self, job, keywords):
         """Tailor experience section to highlight relevant work"""
         experiences = []
+        keywords_lower = [kw.lower() for kw in keywords]
         
-        for exp in self.profile.get('experience', []):
-            # Enhance bullet points with matching keywords
-            enhanced_bullets = []
-            for bullet in exp.get('bullets', []):
-                # Check if bullet mentions relevant keywords
-                relevance = sum(1 for kw in keywords if kw.lower() in bullet.lower())
-                enhanced_bullets.append({
-                    'text': bullet,
-                    'relevance': relevance
-                })
+        for title, company, duration, bullets, bullets_lower in self._profile().experience:
+            # Check if each bullet mentions relevant keywords
+            relevance = [sum(1 for kw in keywords_lower if kw in bullet) for bullet in bullets_lower]
             
-            # Sort by relevance
-            enhanced_bullets.sort(key=lambda x: x['relevance'], reverse=True)
+            # Sort by relevance (stable, so ties keep profile order)
+            order = sorted(range(len(bullets)), key=relevance.__getitem__, reverse=True)
             
             experiences.append({
-                'title': exp['title'],
-                'company': exp['company'],
-                'duration': exp['duration'],
-                'bullets': [b['text'] for b in enhanced_bullets[:4]]  # Top 4 most relevant
+                'title': title,
+                'company': company,
+                'duration': duration,
+                'bullets': [bullets[i] for i in order[:4]]  # Top 4 most relevant
             })
         
         return experiences
     
     def _build_education(self):
-        return self.profile.get('education', [])
+        return self._profile().education
     
     def _calculate_keyword_match(self, keywords):
         """Calculate how well resume matches job"""
-        user_skills = set(s.lower() for s in self.profile.get('skills', []))
+        user_skills = self._profile().skill_set
         job_keywords = set(k.lower() for k in keywords)
         
         if not job_keywords:
@@ -104,90 +402,86 @@ class ResumeGenerator:
     
     def format_resume_text(self, resume):
         """Format resume as text"""
-        text = []
-        
-        # Header
-        h = resume['header']
-        text.append(f"{h['name'].upper()}")
-        text.append(f"{h['email']} | {h['phone']} | {h['location']}")
-        if h.get('linkedin'):
-            text.append(f"LinkedIn: {h['linkedin']}")
-        text.append("")
-        
-        # Summary
-        text.append("PROFESSIONAL SUMMARY")
-        text.append("-" * 50)
-        text.append(resume['summary'])
-        text.append("")
-        
-        # Skills
-        text.append("TECHNICAL SKILLS")
-        text.append("-" * 50)
-        text.append(", ".join(resume['skills']))
-        text.append("")
-        
-        # Experience
-        text.append("PROFESSIONAL EXPERIENCE")
-        text.append("-" * 50)
-        for exp in resume['experience']:
-            text.append(f"\n{exp['title']} | {exp['company']}")
-            text.append(exp['duration'])
-            for bullet in exp['bullets']:
-                text.append(f"  • {bullet}")
-        text.append("")
-        
-        # Education
-        text.append("EDUCATION")
-        text.append("-" * 50)
-        for edu in resume['education']:
-            text.append(f"{edu['degree']} - {edu['school']} ({edu['year']})")
-        
-        return "\n".join(text)
+        return self.layout.render_text(resume)
+    
+    def write_resume_text(self, resume, out):
+        """Write the formatted resume to a file-like object"""
+        self.layout.render(resume, out)
 
 
 class CoverLetterGenerator:
-    def __init__(self, user_profile):
+    def __init__(self, user_profile, layout=None):
         self.profile = user_profile
+        self.compiled = None
+        self.layout = load_layout(layout, COVER_LETTER_TEMPLATE)
         
-    def generate_cover_letter(self, job):
-        """Generate tailored cover letter"""
+    def generate_cover_letter(self, job, compiled=None):
+        """Generate tailored cover letter (see ResumeGenerator.generate_resume for ``compiled``)"""
         print(f"✉️  Generating cover letter for: {job['title']} at {job['company']}\n")
         
+        self.compiled = compiled or compile_profile(self.profile)
         letter = {
             'date': datetime.now().strftime("%B %d, %Y"),
             'greeting': f"Dear {job['company']} Hiring Manager,",
             'opening': self._opening_paragraph(job),
             'body': self._body_paragraphs(job),
             'closing': self._closing_paragraph(job),
-            'signature': self.profile['name']
+            'signature': self.compiled.profile['name']
         }
         
         return letter
     
+    def _profile(self):
+        if self.compiled is None:
+            self.compiled = compile_profile(self.profile)
+        return self.compiled
+    
+    def regenerate_cover_letter(self, job, letter, inputs, compiled=None):
+        """Bring ``letter`` up to date with ``job`` and today's date, rebuilding only stale sections
+        
+        ``inputs`` are the cover_letter_inputs the letter was built from;
+        returns (letter, inputs, rebuilt) like ResumeGenerator.regenerate_resume.
+        """
+        self.compiled = compiled or compile_profile(self.profile)
+        new_inputs = cover_letter_inputs(job, self.compiled.fingerprint)
+        rebuilt = _stale_sections(COVER_LETTER_SECTION_INPUTS, inputs, new_inputs)
+        letter = dict(letter)
+        for section in rebuilt:
+            letter[section] = self._build_section(section, job, new_inputs['date'])
+        return letter, new_inputs, rebuilt
+    
+    def _build_section(self, section, job, date):
+        """One cover letter section, as generate_cover_letter builds it"""
+        if section == 'date':
+            return date
+        if section == 'greeting':
+            return f"Dear {job['company']} Hiring Manager,"
+        if section == 'opening':
+            return self._opening_paragraph(job)
+        if section == 'body':
+            return self._body_paragraphs(job)
+        if section == 'closing':
+            return self._closing_paragraph(job)
+        if section == 'signature':
+            return self._profile().profile['name']
+        raise ValueError(f"Unknown cover letter section: {section!r}")
+    
     def _opening_paragraph(self, job):
         """Generate opening paragraph"""
         return f"I am writing to express my strong interest in the {job['title']} position at {job['company']}. " \
-               f"With {self.profile.get('years_experience', 5)}+ years of experience in software engineering and a " \
+               f"With {self._profile().years}+ years of experience in software engineering and a " \
                f"proven track record of delivering innovative solutions, I am excited about the opportunity to contribute to your team."
     
     def _body_paragraphs(self, job):
         """Generate body paragraphs highlighting relevant experience"""
-        paragraphs = []
+        compiled = self._profile()
         
-        # Paragraph 1: Technical skills
-        skills = self.profile.get('skills', [])[:5]
-        para1 = f"My technical expertise includes {', '.join(skills[:-1])}, and {skills[-1]}. " \
-                f"I have successfully applied these technologies to build scalable, high-performance systems " \
-                f"that drive business value and enhance user experiences."
-        paragraphs.append(para1)
+        # Paragraph 1: Technical skills (profile-only, built once)
+        paragraphs = [compiled.skills_sentence]
         
         # Paragraph 2: Relevant experience
-        if self.profile.get('experience'):
-            recent = self.profile['experience'][0]
-            para2 = f"In my recent role as {recent['title']} at {recent['company']}, " \
-                    f"I {recent['bullets'][0].lower()} This experience has prepared me to make immediate " \
-                    f"contributions to {job['company']}'s mission."
-            paragraphs.append(para2)
+        if compiled.recent_role is not None:
+            paragraphs.append(f"{compiled.recent_role}contributions to {job['company']}'s mission.")
         
         return paragraphs
     
@@ -199,52 +493,59 @@ class CoverLetterGenerator:
     
     def format_cover_letter_text(self, letter):
         """Format cover letter as text"""
-        text = []
-        
-        text.append(self.profile['name'])
-        text.append(self.profile['email'])
-        text.append(self.profile['phone'])
-        text.append("")
-        text.append(letter['date'])
-        text.append("")
-        text.append(letter['greeting'])
-        text.append("")
-        text.append(letter['opening'])
-        text.append("")
-        for para in letter['body']:
-            text.append(para)
-            text.append("")
-        text.append(letter['closing'])
-        text.append("")
-        text.append("Sincerely,")
-        text.append(letter['signature'])
-        
-        return "\n".join(text)
+        return self.layout.render_text(letter, profile=self.profile)
+    
+    def write_cover_letter_text(self, letter, out):
+        """Write the formatted cover letter to a file-like object"""
+        self.layout.render(letter, out, profile=self.profile)
 
 
 class ApplicationPackageGenerator:
-    def __init__(self, user_profile):
-        self.resume_gen = ResumeGenerator(user_profile)
-        self.cover_letter_gen = CoverLetterGenerator(user_profile)
+    def __init__(self, user_profile, cache=None, resume_layout=None, cover_letter_layout=None):
+        self.profile = user_profile
+        self.resume_gen = ResumeGenerator(user_profile, resume_layout)
+        self.cover_letter_gen = CoverLetterGenerator(user_profile, cover_letter_layout)
+        self.cache = cache
+        
+    def generate_package(self, job, compiled=None, resume=None):
+        """Generate complete application package
+        
+        The profile is compiled (or found in the compiled-profile cache) once
+        and shared by both generators, unless ``compiled`` is passed in. A
+        ``resume`` already built for the job (e.g. by generate_resumes) is
+        used as is.
+        
+        With a PackageCache, a package generated before for the same profile
+        contents, job fields and GENERATOR_VERSION is returned from the cache.
+        """
+        compiled = compiled or compile_profile(self.profile)
+        if self.cache is not None:
+            key = self._cache_key(job, compiled)
+            package = self._cached_package(job, key, compiled)
+            if package is not None:
+                print(f"📦 Application package for {job['company']} loaded from cache\n")
+                return package
         
-    def generate_package(self, job):
-        """Generate complete application package"""
         print(f"📦 Generating application package for {job['company']}\n")
         print("=" * 70)
         
         # Generate resume
-        resume = self.resume_gen.generate_resume(job)
+        if resume is None:
+            resume = self.resume_gen.generate_resume(job, compiled)
         
         # Generate cover letter
-        cover_letter = self.cover_letter_gen.generate_cover_letter(job)
+        cover_letter = self.cover_letter_gen.generate_cover_letter(job, compiled)
         
         # Package
         package = {
             'job': job,
             'resume': resume,
             'cover_letter': cover_letter,
-            'generated_at': datetime.now().isoformat()
+            'generated_at': datetime.now().isoformat(),
+            'profile_fingerprint': compiled.fingerprint
         }
+        if self.cache is not None:
+            self.cache.put(key, package)
         
         print(f"✓ Resume generated (Match: {resume['match_score']}%)")
         print(f"✓ Cover letter generated")
@@ -252,6 +553,160 @@ class ApplicationPackageGenerator:
         
         return package
     
+    def _cache_key(self, job, compiled=None):
+        return package_key((compiled or compile_profile(self.profile)).fingerprint, job, GENERATOR_VERSION)
+    
+    def _cached_package(self, job, key, compiled):
+        """Package for job from the cache, or None
+        
+        ``generated_at`` keeps the time the content was generated; the cover
+        letter is re-dated to today, since that is when it will be sent.
+        """
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+        entry['cover_letter']['date'] = datetime.now().strftime("%B %d, %Y")
+        return {
+            'job': job,
+            'resume': entry['resume'],
+            'cover_letter': entry['cover_letter'],
+            'generated_at': entry['generated_at'],
+            'profile_fingerprint': compiled.fingerprint
+        }
+    
+    def regenerate_package(self, job, previous):
+        """Update ``previous`` (a generate_package result) for an edited ``job``
+        
+        Only sections that read an input that changed since ``previous`` was
+        generated are rebuilt (see RESUME_SECTION_INPUTS and
+        COVER_LETTER_SECTION_INPUTS); the inputs it was built from are
+        recomputed from its job, profile fingerprint and cover letter date.
+        Pass the edited posting as a new dict, not ``previous['job']``
+        changed in place. Returns (package, changes), where changes maps
+        'resume' and 'cover_letter' to {section: {'before', 'after'}} for
+        each section whose content changed.
+        """
+        compiled = compile_profile(self.profile)
+        old_job = previous['job']
+        fingerprint = previous.get('profile_fingerprint')  # None (rebuild all) for older packages
+        
+        resume, _, resume_rebuilt = self.resume_gen.regenerate_resume(
+            job, previous['resume'], resume_inputs(old_job, fingerprint), compiled)
+        cover_letter, _, letter_rebuilt = self.cover_letter_gen.regenerate_cover_letter(
+            job, previous['cover_letter'],
+            cover_letter_inputs(old_job, fingerprint, previous['cover_letter'].get('date')), compiled)
+        
+        package = {
+            'job': job,
+            'resume': resume,
+            'cover_letter': cover_letter,
+            'generated_at': datetime.now().isoformat(),
+            'profile_fingerprint': compiled.fingerprint
+        }
+        if self.cache is not None:
+            self.cache.put(self._cache_key(job, compiled), package)
+        
+        changes = {
+            'resume': _changed_sections(previous['resume'], resume, resume_rebuilt),
+            'cover_letter': _changed_sections(previous['cover_letter'], cover_letter, letter_rebuilt)
+        }
+        print(f"🔁 Regenerated application package for {job['company']}: "
+              f"{len(resume_rebuilt) + len(letter_rebuilt)} sections rebuilt, "
+              f"{len(changes['resume']) + len(changes['cover_letter'])} changed\n")
+        
+        return package, changes
+    
+    def _split_cached(self, chunk, compiled):
+        """Split [(index, job)] into the jobs still to generate and PackageResults for cached ones"""
+        misses, hits = [], []
+        for index, job in chunk:
+            package = self._cached_package(job, self._cache_key(job, compiled), compiled)
+            if package is None:
+                misses.append((index, job))
+            else:
+                hits.append(PackageResult(index, job, package, None))
+        return misses, hits
+    
+    def generate_packages(self, jobs, workers=None, ordered=True, executor='process', chunk_size=None):
+        """Generate packages for many jobs on a worker pool, yielding a PackageResult per job
+        
+        ``executor`` is 'process' (default, for large batches: generation is
+        CPU-bound), 'thread', or an existing concurrent.futures.Executor to
+        reuse. ``workers`` defaults to the CPU count. Process workers get
+        jobs in chunks of ``chunk_size`` (default 32) to amortize pickling,
+        and rank each chunk's resume bullets in one generate_resumes pass.
+        With ``ordered`` results come back in input order, otherwise as soon
+        as their chunk completes. A job whose generation raises yields a
+        result carrying the exception instead of aborting the batch. At most
+        ``4 * workers`` chunks are queued at a time, so ``jobs`` may be a
+        long generator. The profile is compiled once per chunk in process
+        workers and once per batch otherwise. With a cache, cached jobs are
+        answered without being sent to the pool, and packages generated by
+        process workers are stored in it.
+        """
+        workers = workers or os.cpu_count() or 1
+        if executor == 'process':
+            pool = ProcessPoolExecutor(max_workers=workers)
+        elif executor == 'thread':
+            pool = ThreadPoolExecutor(max_workers=workers)
+        elif isinstance(executor, Executor):
+            pool = contextlib.nullcontext(executor)
+        else:
+            raise ValueError(f"Unknown executor: {executor!r} (expected 'process', 'thread' or an Executor)")
+        
+        with pool as pool:
+            in_process = isinstance(pool, ProcessPoolExecutor)
+            chunk_size = chunk_size or (32 if in_process else 1)
+            compiled = compile_profile(self.profile) if not in_process or self.cache is not None else None
+            items = enumerate(jobs)
+            pending = {}     # future -> [(index, job)]
+            done_early = {}  # index -> result held back until its turn (ordered mode)
+            next_index = 0
+            while True:
+                while len(pending) < 4 * workers:
+                    chunk = list(islice(items, chunk_size))
+                    if not chunk:
+                        break
+                    if in_process and self.cache is not None:
+                        chunk, hits = self._split_cached(chunk, compiled)
+                        for result in hits:
+                            if ordered:
+                                done_early[result.index] = result
+                            else:
+                                yield result
+                        if not chunk:
+                            continue
+                    if in_process:
+                        analyses = [a for a in (memoized_analysis(job) for _, job in chunk) if a is not None]
+                        future = pool.submit(_generate_chunk_quietly, self.profile,
+                                             [dict(job) for _, job in chunk], analyses)
+                    else:
+                        future = pool.submit(_generate_chunk, self, [job for _, job in chunk], compiled)
+                    pending[future] = chunk
+                if not pending:
+                    for index in sorted(done_early):
+                        yield done_early[index]
+                    break
+                
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    chunk = pending.pop(future)
+                    error = future.exception()  # the task itself failed, e.g. a worker process died
+                    outcomes = future.result() if error is None else [(None, error)] * len(chunk)
+                    for (index, job), (package, job_error) in zip(chunk, outcomes):
+                        if package is not None:
+                            package['job'] = job
+                            if in_process and self.cache is not None:
+                                self.cache.put(self._cache_key(job, compiled), package)
+                        result = PackageResult(index, job, package, job_error)
+                        if ordered:
+                            done_early[index] = result
+                        else:
+                            yield result
+                while next_index in done_early:
+                    yield done_early.pop(next_index)
+                    next_index += 1
+    
     def save_package(self, package, output_dir='/tmp'):
         """Save resume and cover letter to files"""
         job_title = package['job']['title'].replace(' ', '_')
@@ -259,20 +714,33 @@ class ApplicationPackageGenerator:
         
         # Save resume
         resume_file = f"{output_dir}/resume_{company}_{job_title}.txt"
-        resume_text = self.resume_gen.format_resume_text(package['resume'])
         with open(resume_file, 'w') as f:
-            f.write(resume_text)
+            self.resume_gen.write_resume_text(package['resume'], f)
         
         # Save cover letter
         cover_file = f"{output_dir}/cover_letter_{company}_{job_title}.txt"
-        cover_text = self.cover_letter_gen.format_cover_letter_text(package['cover_letter'])
         with open(cover_file, 'w') as f:
-            f.write(cover_text)
+            self.cover_letter_gen.write_cover_letter_text(package['cover_letter'], f)
         
         print(f"💾 Saved: {resume_file}")
         print(f"💾 Saved: {cover_file}")
         
         return resume_file, cover_file
+    
+    def save_packages(self, packages, archive_path):
+        """Save many packages into one .zip / .tar / .tar.gz archive (see PackageArchive)
+        
+        ``packages`` may be any iterable, e.g. the packages of a
+        generate_packages run; each is written as it arrives. Returns the
+        number of packages saved.
+        """
+        with PackageArchive(archive_path, self) as archive:
+            for package in packages:
+                archive.add(package)
+        
+        print(f"💾 Saved {archive.count} packages to {archive_path}")
+        
+        return archive.count
 
 
 if __name__ == "__main__":
@@ -0,0 +1,154 @@
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:  # only SalaryIndex needs numpy
+    np = None
+
+SalaryRange = namedtuple('SalaryRange', ['min', 'max', 'currency', 'period'])
+
+CURRENCY_SYMBOLS = {'$': 'USD', '€': 'EUR', '£': 'GBP', '¥': 'JPY', '₹': 'INR'}
+CURRENCY_CODES = ('USD', 'EUR', 'GBP', 'CAD', 'AUD', 'JPY', 'INR', 'CHF')
+PERIOD_PATTERNS = [
+    ('hour', re.compile(r'/\s*h(?:ou)?r\b|\bper\s+hour\b|\bhourly\b', re.IGNORECASE)),
+    ('day', re.compile(r'/\s*day\b|\bper\s+day\b|\bdaily\b', re.IGNORECASE)),
+    ('week', re.compile(r'/\s*w(?:ee)?k\b|\bper\s+week\b|\bweekly\b', re.IGNORECASE)),
+    ('month', re.compile(r'/\s*mo(?:nth)?\b|\bper\s+month\b|\bmonthly\b', re.IGNORECASE)),
+]
+PERIODS_PER_YEAR = {'hour': 2080, 'day': 260, 'week': 52, 'month': 12, 'year': 1}
+_CODES = '|'.join(CURRENCY_CODES)
+# An amount, with the currency symbol or code written next to it and its k/m suffix if any
+AMOUNT_RE = re.compile(r'(?P<currency>[$€£¥₹]|\b(?:%s)\b)?\s*(?P<number>\d[\d,]*(?:\.\d+)?)\s*(?P<unit>[km])?\b'
+                       r'(?:\s*(?P<code>%s)\b)?' % (_CODES, _CODES), re.IGNORECASE)
+# A currency code as a word of its own ('USD 90k', '90k CAD', 'USD90k'), not inside one like 'ACADEMIC'
+CURRENCY_CODE_RE = re.compile(r'(?<![A-Z])(%s)(?![A-Z])' % _CODES)
+RANGE_SEPARATOR_RE = re.compile(r'\s*(?:-|–|—|to)\s*', re.IGNORECASE)
+MULTIPLIERS = {'k': 1_000, 'm': 1_000_000}
+
+
+@lru_cache(maxsize=65536)
+def parse_salary(text):
+    """Parse a free-text salary ('$150k-$200k', '£45/hr', 'USD 120,000') into a SalaryRange
+
+    Returns None when the text has no amount (e.g. 'Not specified'). Only
+    one amount or range is read, so trailing numbers ('+ 15% bonus', '401k
+    match', '4 weeks PTO') are ignored: the first amount written with a
+    currency symbol or code, else the first with a k/m suffix, else the
+    first amount, together with the amount after it when the two are
+    joined by '-' or 'to'. Period defaults to 'year' and currency to 'USD'.
+    Results are cached by string, since postings repeat the same salary
+    text heavily.
+    """
+    if not text:
+        return None
+    text = str(text)
+    amounts = _salary_amounts(text)
+    if not amounts:
+        return None
+
+    currency = 'USD'
+    written = CURRENCY_CODE_RE.search(text.upper())
+    if written:
+        currency = written.group(1)
+    else:
+        for symbol, code in CURRENCY_SYMBOLS.items():
+            if symbol in text:
+                currency = code
+                break
+
+    period = 'year'
+    for name, pattern in PERIOD_PATTERNS:
+        if pattern.search(text):
+            period = name
+            break
+
+    return SalaryRange(min(amounts), max(amounts), currency, period)
+
+
+def _salary_amounts(text):
+    """The salary amount, or low and high ends of the salary range, in text"""
+    found = list(AMOUNT_RE.finditer(text))
+    if not found:
+        return []
+    first = next((i for i, m in enumerate(found) if m.group('currency') or m.group('code')), None)
+    if first is None:
+        first = next((i for i, m in enumerate(found) if m.group('unit')), 0)
+    low = found[first]
+    amounts = [low]
+    if first + 1 < len(found):
+        high = found[first + 1]
+        if RANGE_SEPARATOR_RE.fullmatch(text, low.end(), high.start()):
+            amounts.append(high)
+    values = [float(m.group('number').replace(',', '')) for m in amounts]
+    units = [(m.group('unit') or '').lower() for m in amounts]
+    if len(amounts) == 2 and units[1] and not units[0] and values[0] <= values[1]:
+        units[0] = units[1]  # '$100-120k'
+    return [value * MULTIPLIERS.get(unit, 1) for value, unit in zip(values, units)]
+
+
+def annual_range(text):
+    """(min, max) yearly amount for a salary string, or (None, None) if it cannot be parsed"""
+    salary = parse_salary(text)
+    if salary is None:
+        return None, None
+    factor = PERIODS_PER_YEAR[salary.period]
+    return salary.min * factor, salary.max * factor
+
+
+def salary_in_range(text, min_salary=None, max_salary=None):
+    """Whether a salary string's yearly range overlaps [min_salary, max_salary]"""
+    low, high = annual_range(text)
+    if low is None:
+        return False
+    return (min_salary is None or high >= min_salary) and (max_salary is None or low <= max_salary)
+
+
+class SalaryIndex:
+    """Sorted numeric salary index answering range queries by binary search.
+
+    Salaries are parsed once when a posting is added and stored as yearly
+    min/max amounts (currencies are not converted). A query keeps postings
+    whose range overlaps ``[min_salary, max_salary]``: a binary search over
+    the max-sorted array finds every posting with ``max >= min_salary``, and
+    a vectorized mask applies ``min <= max_salary`` to that slice. The
+    sorted arrays are rebuilt lazily after additions.
+    """
+
+    def __init__(self):
+        if np is None:
+            raise ImportError("SalaryIndex requires numpy: pip install numpy")
+        self._ids = []
+        self._mins = []
+        self._maxs = []
+        self._sorted = None
+
+    def __len__(self):
+        return len(self._ids)
+
+    def add(self, doc_id, salary_text):
+        """Index a posting's salary; postings without a parsable salary are skipped"""
+        low, high = annual_range(salary_text)
+        if low is not None:
+            self._ids.append(doc_id)
+            self._mins.append(low)
+            self._maxs.append(high)
+            self._sorted = None
+
+    def _arrays(self):
+        if self._sorted is None:
+            maxs = np.asarray(self._maxs, dtype=np.float64)
+            order = np.argsort(maxs, kind='stable')
+            self._sorted = (maxs[order], np.asarray(self._mins, dtype=np.float64)[order],
+                            np.asarray(self._ids, dtype=np.int64)[order])
+        return self._sorted
+
+    def range_ids(self, min_salary=None, max_salary=None):
+        """Sorted doc ids whose yearly salary range overlaps [min_salary, max_salary]"""
+        maxs, mins, ids = self._arrays()
+        start = 0 if min_salary is None else np.searchsorted(maxs, min_salary, side='left')
+        ids, mins = ids[start:], mins[start:]
+        if max_salary is not None:
+            ids = ids[mins <= max_salary]
+        return np.sort(ids)
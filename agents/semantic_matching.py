@@ -0,0 +1,134 @@
+try:
+    import numpy as np
+    from scipy import sparse
+    from sklearn.feature_extraction.text import HashingVectorizer
+except ImportError:  # scikit-learn is optional (see requirements.txt)
+    HashingVectorizer = None
+
+from job_analysis import content_hash
+
+
+def job_text(job):
+    return job.get('title', '') + ' ' + job.get('description', '')
+
+
+class SemanticMatcher:
+    """TF-IDF cosine ranking of jobs against a free-text query.
+
+    Term counts come from a stateless HashingVectorizer, so the vocabulary
+    never has to be refitted. The corpus is kept as a sparse term-count
+    matrix plus a document-frequency vector, and IDF weights are derived
+    from the current document frequencies at query time. Adding postings
+    appends rows and updates the frequencies instead of refitting.
+
+    Scoring a query is a single sparse matrix-vector product
+    ``counts @ (idf**2 * q)``, divided by the cached row norms of the TF-IDF
+    matrix. The norms are recomputed (one more mat-vec) only after postings
+    are added. The IDF formula is scikit-learn's smoothed one, so scores
+    equal the cosine similarities ``TfidfVectorizer`` would give on the same
+    corpus (up to hash collisions).
+
+    Rows are keyed by posting URL, or by a hash of the title and description
+    for postings without one. Postings outside the corpus can still be
+    scored against its IDF (``scores_for``) without being added.
+    """
+
+    def __init__(self, jobs=(), n_features=2 ** 20):
+        if HashingVectorizer is None:
+            raise ImportError("SemanticMatcher requires scikit-learn: pip install scikit-learn")
+        self.vectorizer = HashingVectorizer(n_features=n_features, alternate_sign=False, norm=None,
+                                            stop_words='english')
+        self.jobs = []
+        self._rows = {}  # job key -> row number
+        self._counts = sparse.csr_matrix((0, n_features), dtype=np.float64)
+        self._pending = []
+        self._df = np.zeros(n_features, dtype=np.float64)
+        self._norms = None
+        self.add_jobs(jobs)
+
+    def __len__(self):
+        return len(self.jobs)
+
+    @staticmethod
+    def key(job):
+        return job.get('url') or content_hash((job.get('title', ''), job.get('description', '')))
+
+    def __contains__(self, job):
+        return self.key(job) in self._rows
+
+    def add_jobs(self, jobs):
+        """Append postings to the model (no refit); returns the number added"""
+        new = []
+        for job in jobs:
+            key = self.key(job)
+            if key not in self._rows:
+                self._rows[key] = len(self.jobs)
+                self.jobs.append(job)
+                new.append(job)
+        if new:
+            counts = self.vectorizer.transform(job_text(job) for job in new)
+            self._df += np.bincount(counts.indices, minlength=self._df.shape[0])
+            self._pending.append(counts)
+            self._norms = None
+        return len(new)
+
+    def _matrix(self):
+        if self._pending:
+            self._counts = sparse.vstack([self._counts] + self._pending, format='csr')
+            self._pending = []
+        return self._counts
+
+    def idf(self):
+        return np.log((1 + len(self.jobs)) / (1 + self._df)) + 1
+
+    def _query_weights(self, query, idf):
+        q = self.vectorizer.transform([query])
+        weights = np.zeros_like(idf)
+        weights[q.indices] = q.data * idf[q.indices]
+        return weights
+
+    @staticmethod
+    def _row_norms(counts, idf):
+        return np.sqrt(counts.multiply(counts) @ (idf ** 2))
+
+    @staticmethod
+    def _cosine(counts, norms, q_weights, idf):
+        q_norm = np.sqrt(q_weights @ q_weights)
+        if not q_norm or not counts.shape[0]:
+            return np.zeros(counts.shape[0])
+        dots = counts @ (q_weights * idf)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            sims = dots / (norms * q_norm)
+        return np.nan_to_num(sims)
+
+    def scores(self, query):
+        """Cosine similarity of every posting to the query, in insertion order"""
+        counts = self._matrix()
+        idf = self.idf()
+        if self._norms is None:
+            self._norms = self._row_norms(counts, idf)
+        return self._cosine(counts, self._norms, self._query_weights(query, idf), idf)
+
+    def scores_for(self, jobs, query):
+        """Similarities for specific postings, in the given order
+
+        Postings in the corpus use their rows. Others are weighted with the
+        corpus IDF but not added, so scoring never changes the model.
+        """
+        jobs = list(jobs)
+        rows = [self._rows.get(self.key(job)) for job in jobs]
+        known = [i for i, row in enumerate(rows) if row is not None]
+        ad_hoc = [i for i, row in enumerate(rows) if row is None]
+        idf = self.idf()
+        q_weights = self._query_weights(query, idf)
+        scores = np.zeros(len(jobs))
+        if known:
+            counts = self._matrix()
+            if self._norms is None:
+                self._norms = self._row_norms(counts, idf)
+            corpus_rows = [rows[i] for i in known]
+            scores[known] = self._cosine(counts[corpus_rows], self._norms[corpus_rows], q_weights, idf)
+        if ad_hoc:
+            counts = self.vectorizer.transform(job_text(jobs[i]) for i in ad_hoc)
+            scores[ad_hoc] = self._cosine(counts, self._row_norms(counts, idf), q_weights, idf)
+        return scores
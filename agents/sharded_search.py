@@ -0,0 +1,107 @@
+import heapq
+import json
+import os
+import sys
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from job_search import JobSearchAgent
+from job_sources import MmapJsonlJobSource
+
+# Per-process state of a shard worker, set by _load_shard
+_agent = None
+
+
+def shard_of(job, num_shards):
+    """Shard number for a posting: crc32 of its URL (title + company if there is none)"""
+    key = job.get('url') or f"{job.get('title', '')}|{job.get('company', '')}"
+    return zlib.crc32(key.encode('utf-8')) % num_shards
+
+
+def write_shards(jobs, directory, num_shards):
+    """Partition postings by hash into ``num_shards`` JSONL files; returns their paths"""
+    os.makedirs(directory, exist_ok=True)
+    paths = [os.path.join(directory, f'shard-{i:03d}.jsonl') for i in range(num_shards)]
+    files = [open(path, 'w', encoding='utf-8') for path in paths]
+    try:
+        for job in jobs:
+            files[shard_of(job, num_shards)].write(json.dumps(dict(job)) + '\n')
+    finally:
+        for f in files:
+            f.close()
+    return paths
+
+
+def _load_shard(path, preferences):
+    """Worker initializer: build this process's agent and index over one memory-mapped shard
+
+    Only the shard file's bytes are shared (through the page cache). The
+    worker decodes every posting into its own Job records and index, so
+    each process holds a private copy of its shard's postings.
+    """
+    global _agent
+    sys.stdout = open(os.devnull, 'w')  # the agent's progress output is the coordinator's business
+    _agent = JobSearchAgent(preferences, sources=[MmapJsonlJobSource(path)])
+    _agent.index  # build it now rather than on the first query
+
+
+def _shard_size():
+    return len(_agent.index.jobs)
+
+
+def _search_shard(keywords, location, limit, preferences):
+    """search_jobs + filter_jobs on this worker's shard, as plain dicts in score order"""
+    _agent.preferences = preferences
+    return _agent.filter_jobs(_agent.search_jobs(keywords, location), limit=limit)
+
+
+class ShardedJobSearch:
+    """Search a corpus partitioned across worker processes, one per shard.
+
+    Each worker memory-maps its shard file (see write_shards) and decodes
+    it into its own JobSearchAgent and index, so the coordinator never
+    pickles postings to workers, but each worker's postings are a private
+    in-memory copy of its shard. ``search_jobs`` sends the query to every
+    shard in parallel. Each shard runs ``search_jobs`` + ``filter_jobs``
+    and returns its top ``limit``, and the coordinator merges those sorted
+    lists. Results match a single agent over the whole corpus, except that
+    equal scores are ordered by shard instead of by corpus position.
+
+    Throughput can only grow with shards while there are idle cores for
+    the workers; benchmarks/bench_sharded.py measures it on a given machine.
+    """
+
+    def __init__(self, preferences, shard_paths):
+        self.preferences = preferences
+        self.shard_paths = list(shard_paths)
+        self._pools = [ProcessPoolExecutor(max_workers=1, initializer=_load_shard, initargs=(path, preferences))
+                       for path in self.shard_paths]
+
+    @classmethod
+    def from_jobs(cls, preferences, jobs, directory, num_shards=None):
+        """Write ``jobs`` into shard files under ``directory`` and start a worker per shard"""
+        return cls(preferences, write_shards(jobs, directory, num_shards or os.cpu_count() or 1))
+
+    def shard_sizes(self):
+        """Postings held by each shard (waits for workers to finish loading)"""
+        return [f.result() for f in [pool.submit(_shard_size) for pool in self._pools]]
+
+    def search_jobs(self, keywords, location=None, limit=50):
+        """Matching jobs across all shards, best first; at most ``limit`` (None for all)"""
+        futures = [pool.submit(_search_shard, keywords, location, limit, self.preferences) for pool in self._pools]
+        merged = heapq.merge(*(f.result() for f in futures), key=lambda job: -job['match_score'])
+        return list(islice(merged, limit))
+
+    def update_preferences(self, **changes):
+        self.preferences = {**self.preferences, **changes}
+
+    def close(self):
+        for pool in self._pools:
+            pool.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
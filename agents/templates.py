@@ -0,0 +1,269 @@
+import json
+import re
+
+# {{ path|filter }} outputs a value; {% for x in path %}, {% if path %}, {% else %},
+# {% endfor %} and {% endif %} are blocks
+TAG_RE = re.compile(r'\{\{(.*?)\}\}|\{%(.*?)%\}', re.DOTALL)
+PATH_RE = re.compile(r'[A-Za-z_]\w*(\.\w+)*$')
+FILTER_RE = re.compile(r'(\w+)(?::"([^"]*)")?$')
+
+RESUME_LAYOUT = '''\
+{{ header.name|upper }}
+{{ header.email }} | {{ header.phone }} | {{ header.location }}
+{% if header.linkedin %}
+LinkedIn: {{ header.linkedin }}
+{% endif %}
+
+PROFESSIONAL SUMMARY
+--------------------------------------------------
+{{ summary }}
+
+TECHNICAL SKILLS
+--------------------------------------------------
+{{ skills|join:", " }}
+
+PROFESSIONAL EXPERIENCE
+--------------------------------------------------
+{% for exp in experience %}
+
+{{ exp.title }} | {{ exp.company }}
+{{ exp.duration }}
+{% for bullet in exp.bullets %}
+  • {{ bullet }}
+{% endfor %}
+{% endfor %}
+
+EDUCATION
+--------------------------------------------------{% for edu in education %}
+{{ edu.degree }} - {{ edu.school }} ({{ edu.year }}){% endfor %}'''
+
+# Rendered with the letter's fields as context and the profile as the ``profile`` param
+COVER_LETTER_LAYOUT = '''\
+{{ profile.name }}
+{{ profile.email }}
+{{ profile.phone }}
+
+{{ date }}
+
+{{ greeting }}
+
+{{ opening }}
+
+{% for para in body %}
+{{ para }}
+
+{% endfor %}
+{{ closing }}
+
+Sincerely,
+{{ signature }}'''
+
+
+def _literal(text):
+    """Text escaped for the inside of a double-quoted f-string
+
+    JSON string escapes are valid Python ones, and generated expressions
+    only use single quotes.
+    """
+    return json.dumps(text, ensure_ascii=False)[1:-1].replace('{', '{{').replace('}', '}}')
+
+
+class TemplateError(ValueError):
+    """A layout that cannot be compiled; the message names the layout and line"""
+
+
+def _filter(code, spec, where, constants):
+    match = FILTER_RE.match(spec.strip())
+    if not match:
+        raise TemplateError(f"{where}: bad filter {spec.strip()!r}")
+    name, arg = match.groups()
+    if name == 'upper':
+        return f"{code}.upper()"
+    if name == 'lower':
+        return f"{code}.lower()"
+    if name == 'join':
+        constants.append(', ' if arg is None else arg)
+        return f"_const{len(constants) - 1}.join({code})"
+    raise TemplateError(f"{where}: unknown filter {name!r}")
+
+
+class Template:
+    """A text layout compiled once into a Python function.
+
+    Layouts are plain text with ``{{ path }}`` substitutions (dotted keys
+    into the context, optionally piped through the ``upper``, ``lower`` or
+    ``join:"sep"`` filters) and ``{% for %}`` / ``{% if %}`` blocks. A
+    block tag alone on its line removes that whole line from the output,
+    so layouts read like the text they produce.
+
+    Names listed in ``params`` are passed to ``render`` as keyword
+    arguments instead of being looked up in the context, which saves
+    merging them into a copy of it.
+
+    Compiling turns each run of text between block tags, values included,
+    into one f-string, so rendering makes one ``out.write`` call per run
+    (rather than one list entry per line plus a join) and allocates only
+    those strings. A loop whose body just wraps the item in text, like the
+    resume bullets, becomes a single join over the items.
+    """
+
+    def __init__(self, source, name='<layout>', params=()):
+        self.source = source
+        self.name = name
+        self.params = tuple(params)
+        for param in self.params:
+            if not param.isidentifier() or param in ('ctx', 'out', 'write', 'parts'):
+                raise TemplateError(f"{name}: bad param name {param!r}")
+        # render(context, out, **params) writes the filled layout to the file-like ``out``;
+        # render_text(context, **params) returns it. Both are generated functions.
+        self.render, self.render_text = self._compile()
+
+    @classmethod
+    def from_file(cls, path, params=()):
+        """Load a layout file. A single trailing newline ends the file and is not part of the layout."""
+        with open(path, encoding='utf-8') as f:
+            source = f.read()
+        return cls(source[:-1] if source.endswith('\n') else source, name=path, params=params)
+
+    def _tokens(self):
+        """(kind, text, line) tokens, with standalone block-tag lines removed"""
+        source = self.source
+        pos = 0
+        for match in TAG_RE.finditer(source):
+            start, end = match.span()
+            line = source.count('\n', 0, start) + 1
+            if match.group(2) is not None:
+                line_start = source.rfind('\n', 0, start) + 1
+                line_end = source.find('\n', end)
+                line_end = len(source) if line_end == -1 else line_end + 1
+                if not source[max(line_start, pos):start].strip() and not source[end:line_end].strip():
+                    start, end = max(line_start, pos), line_end
+            if start > pos:
+                yield 'text', source[pos:start], line
+            if match.group(1) is not None:
+                yield 'value', match.group(1).strip(), line
+            else:
+                yield 'block', match.group(2).strip(), line
+            pos = end
+        if pos < len(source):
+            yield 'text', source[pos:], source.count('\n', 0, pos) + 1
+
+    def _compile(self):
+        lines = []      # the shared body of render and render_text, writing through ``write``
+        scopes = []     # open blocks: ('for' | 'if' | 'else', loop details, line)
+        names = {p: p for p in self.params}  # loop variables and params -> local names in the generated code
+        constants = []  # filter arguments, bound as _const<n> globals of the generated code
+        parts = []      # the pending f-string: escaped text and {expression} fields
+
+        def where(line):
+            return f"{self.name}, line {line}"
+
+        def path_code(path, line, get=False):
+            if not PATH_RE.match(path):
+                raise TemplateError(f"{where(line)}: bad name {path!r}")
+            head, *keys = path.split('.')
+            code = names.get(head) or f"ctx[{head!r}]"
+            if get and not keys:
+                return f"ctx.get({head!r})" if head not in names else code
+            for i, key in enumerate(keys):
+                key = int(key) if key.isdigit() else key
+                code += f".get({key!r})" if get and i == len(keys) - 1 else f"[{key!r}]"
+            return code
+
+        def emit(statement):
+            lines.append('    ' * (len(scopes) + 1) + statement)
+
+        def flush():
+            if parts:
+                emit('write(f"' + ''.join(parts) + '")')
+                parts.clear()
+
+        def close_block():
+            if lines[-1].endswith(':'):
+                emit('pass')
+            return scopes.pop()
+
+        for kind, text, line in self._tokens():
+            if scopes and scopes[-1][0] == 'for':
+                scopes[-1][1][5].append((kind, text))  # the loop body, for the join special case
+            if kind == 'text':
+                parts.append(_literal(text))
+                continue
+            if kind == 'value':
+                path, *filters = text.split('|')
+                code = path_code(path.strip(), line)
+                for spec in filters:
+                    code = _filter(code, spec, where(line), constants)
+                parts.append('{' + code + '}')
+                continue
+            flush()
+            words = text.split()
+            if len(words) == 4 and words[0] == 'for' and words[2] == 'in':
+                if not words[1].isidentifier():
+                    raise TemplateError(f"{where(line)}: bad loop variable {words[1]!r}")
+                local = f"v{len(lines)}_{words[1]}"
+                iterable = path_code(words[3], line)
+                start = len(lines)
+                emit(f"for {local} in {iterable}:")
+                scopes.append(('for', (words[1], names.get(words[1]), local, iterable, start, []), line))
+                names[words[1]] = local
+            elif len(words) == 2 and words[0] == 'if':
+                emit(f"if {path_code(words[1], line, get=True)}:")
+                scopes.append(('if', None, line))
+            elif words == ['else'] and scopes and scopes[-1][0] == 'if':
+                close_block()
+                emit('else:')
+                scopes.append(('else', None, line))
+            elif words == ['endfor'] and scopes and scopes[-1][0] == 'for':
+                variable, previous, local, iterable, start, body = close_block()[1]
+                body = body[:-1]  # without this endfor
+                if previous is None:
+                    del names[variable]
+                else:
+                    names[variable] = previous
+                texts = [text for kind, text in body if kind == 'text']
+                if len(body) - len(texts) == 1 and len(texts) <= 2 and ('value', variable) in body:
+                    # A loop that only wraps its item in text is one join over the items
+                    prefix = texts[0] if body[0][0] == 'text' else ''
+                    suffix = texts[-1] if body[-1][0] == 'text' else ''
+                    constants.append(suffix + prefix)
+                    separator = f"_const{len(constants) - 1}"
+                    del lines[start:]
+                    emit(f"{local}s = {iterable}")
+                    emit(f"if {local}s:")
+                    emit("    try:")
+                    emit(f"        {local} = {separator}.join({local}s)")
+                    emit("    except TypeError:  # not all strings")
+                    emit(f"        {local} = {separator}.join(map(str, {local}s))")
+                    emit(f'    write(f"{_literal(prefix)}{{{local}}}{_literal(suffix)}")')
+            elif words == ['endif'] and scopes and scopes[-1][0] in ('if', 'else'):
+                close_block()
+            else:
+                raise TemplateError(f"{where(line)}: unexpected {{% {text} %}}")
+        flush()
+        if scopes:
+            raise TemplateError(f"{where(scopes[-1][2])}: {{% {scopes[-1][0]} %}} is never closed")
+
+        params = ''.join(', ' + p for p in self.params)
+        source = [f"def render(ctx, out{params}):", "    write = out.write", *lines,
+                  f"def render_text(ctx{params}):", "    parts = []", "    write = parts.append", *lines,
+                  "    return ''.join(parts)"]
+        namespace = {f'_const{i}': value for i, value in enumerate(constants)}
+        exec(compile('\n'.join(source), self.name, 'exec'), namespace)
+        return namespace['render'], namespace['render_text']
+
+
+def load_layout(layout, default):
+    """A Template from ``layout`` (a Template, a layout file path, or None for ``default``)
+
+    Layout files get the same params as ``default``.
+    """
+    if layout is None:
+        return default
+    if isinstance(layout, Template):
+        return layout
+    return Template.from_file(layout, params=default.params)
+
+
+RESUME_TEMPLATE = Template(RESUME_LAYOUT, name='<resume layout>')
+COVER_LETTER_TEMPLATE = Template(COVER_LETTER_LAYOUT, name='<cover letter layout>', params=('profile',))
@@ -3,14 +3,17 @@
 
 from flask import Flask, jsonify, request
 from flask_cors import CORS
+import os
 import sys
 import json
+import tempfile
 from datetime import datetime
 
 sys.path.insert(0, '/tmp/job-search-agent/agents')
 
 from job_search import JobSearchAgent
 from resume_generator import ApplicationPackageGenerator
+from package_cache import PackageCache
 from interview_prep import InterviewPrepAgent
 from application_tracker import ApplicationTracker
 from linkedin_agent import LinkedInAgent
@@ -20,6 +23,31 @@ CORS(app)
 
 # Global state
 tracker = ApplicationTracker()
+package_cache = PackageCache(os.environ.get('PACKAGE_CACHE_DIR',
+                                            os.path.join(tempfile.gettempdir(), 'job-search-agent-packages')))
+
+MAX_BATCH_WORKERS = 32
+
+def batch_workers(requested):
+    """Thread count for a batch request: the client's value, capped by the cores and MAX_BATCH_WORKERS
+
+    Returns None (the generator's default) when none was requested; raises
+    ValueError unless it is a positive integer.
+    """
+    if requested is None:
+        return None
+    try:
+        workers = int(requested)
+    except (TypeError, ValueError):
+        workers = 0
+    if workers <= 0:
+        raise ValueError(f"workers must be a positive integer, got {requested!r}")
+    return min(workers, os.cpu_count() or 4, MAX_BATCH_WORKERS)
+
+def track_application(job):
+    """Track the job unless it already is, so regenerating a package adds no duplicate entry"""
+    return tracker.find_application(job['title'], job['company']) or \
+        tracker.add_application(job['title'], job['company'])
 
 @app.route('/api/profile', methods=['GET', 'POST'])
 def profile():
@@ -36,7 +64,7 @@ def search_jobs():
     data = request.json
     agent = JobSearchAgent(data)
     jobs = agent.search_jobs(data['keywords'])
-    filtered = agent.filter_jobs(jobs)
+    filtered = agent.filter_jobs(jobs, limit=data.get('limit'))
     return jsonify(filtered)
 
 @app.route('/api/applications/generate', methods=['POST'])
@@ -45,12 +73,40 @@ def generate_application():
     profile = data['profile']
     job = data['job']
     
-    gen = ApplicationPackageGenerator(profile)
+    gen = ApplicationPackageGenerator(profile, cache=package_cache)
     package = gen.generate_package(job)
-    tracker.add_application(job['title'], job['company'])
+    track_application(job)
     
     return jsonify(package)
 
+@app.route('/api/applications/generate/batch', methods=['POST'])
+def generate_applications():
+    data = request.json
+    try:
+        workers = batch_workers(data.get('workers'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    gen = ApplicationPackageGenerator(data['profile'], cache=package_cache)
+    
+    packages, errors = [], []
+    for result in gen.generate_packages(data['jobs'], workers=workers, executor='thread'):
+        if result.error is not None:
+            errors.append({'index': result.index, 'job': result.job, 'error': str(result.error)})
+            continue
+        packages.append(result.package)
+        track_application(result.job)
+    
+    return jsonify({'packages': packages, 'errors': errors})
+
+@app.route('/api/applications/regenerate', methods=['POST'])
+def regenerate_application():
+    """Update a previously generated package for an edited job; returns it with the changed sections"""
+    data = request.json
+    gen = ApplicationPackageGenerator(data['profile'], cache=package_cache)
+    package, changes = gen.regenerate_package(data['job'], data['package'])
+
+    return jsonify({'package': package, 'changes': changes})
+
 @app.route('/api/applications', methods=['GET'])
 def get_applications():
     return jsonify(tracker.applications)
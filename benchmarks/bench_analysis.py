@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""What the agents read from each posting: a scan per agent vs one shared JobAnalysis
+
+Per posting, the resume generator needs the TECH_KEYWORDS in the
+description, per-job match scoring the required skills in title +
+description, and interview prep its topics. The per-agent path scans the
+text once for each; the shared path runs TECH_KEYWORD_MATCHER once over
+title + description into a JobAnalysis that all three read, and only the
+required skills that are not TECH_KEYWORDS (Kafka here) need another
+scan. Job records carry the analysis in a slot; plain dicts find it again
+by content hash.
+
+The first shared pass saves one automaton scan but pays for the hashing
+and memo bookkeeping, so on these short postings it is no faster than
+scanning per agent (slower for dicts, which are hashed on every lookup).
+What it saves is the repeat work: once analysed, a posting is read again
+without any scan.
+
+Usage: python benchmarks/bench_analysis.py [num_jobs]
+"""
+
+import sys
+
+from common import synthetic_jobs, timed
+
+import job_analysis
+from job_analysis import TECH_KEYWORD_IDS, TECH_KEYWORD_MATCHER, analyze_job
+from job_record import Job
+from keyword_matcher import KeywordMatcher
+
+REQUIRED_SKILLS = ['Python', 'AWS', 'Machine Learning', 'Kafka']
+TOPICS = ('python', 'machine learning', 'ai', 'aws')
+SKILL_MATCHER = KeywordMatcher(REQUIRED_SKILLS)
+# As JobSearchAgent splits them: skills that are TECH_KEYWORDS are read from the analysis
+REQUIRED_TECH_IDS = [TECH_KEYWORD_IDS[s.lower()] for s in REQUIRED_SKILLS if s.lower() in TECH_KEYWORD_IDS]
+OTHER_SKILL_MATCHER = KeywordMatcher([s for s in REQUIRED_SKILLS if s.lower() not in TECH_KEYWORD_IDS])
+TOPIC_MATCHER = KeywordMatcher(TOPICS)
+TOPIC_SET = frozenset(TOPICS)
+
+
+def per_agent(jobs):
+    return [(TECH_KEYWORD_MATCHER.matches(job['description']),
+             len(SKILL_MATCHER.matched_indices(job['title'] + ' ' + job['description'])),
+             TOPIC_MATCHER.found(job['description']))
+            for job in jobs]
+
+
+def shared(jobs):
+    results = []
+    for job in jobs:
+        keywords = list(analyze_job(job).skills)
+        analysis = analyze_job(job)
+        skills = (sum(1 for index in REQUIRED_TECH_IDS if index in analysis.keyword_ids)
+                  + len(OTHER_SKILL_MATCHER.matched_indices(analysis.text)))
+        topics = {skill.lower() for skill in analyze_job(job).skills} & TOPIC_SET
+        results.append((keywords, skills, topics))
+    return results
+
+
+def main(n):
+    jobs = synthetic_jobs(n)
+    print(f"{n:,} postings\n")
+    job_analysis.MAX_ANALYSES = n
+
+    expected = timed('scan per agent', per_agent, jobs)
+    records = [Job(job) for job in jobs]
+    assert timed('shared analysis (Job records)', shared, records) == expected
+    assert timed('  again, analyses attached', shared, records) == expected
+    job_analysis._analyses.clear()
+    assert timed('shared analysis (dicts)', shared, jobs) == expected
+    assert timed('  again, found by content hash', shared, jobs) == expected
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Saving packages: two loose files per package (save_package) vs one zip / tar archive (save_packages)
+
+Loose files are not synced; the archives are synced once on close.
+
+Usage: python benchmarks/bench_archive.py [num_packages]
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+
+from common import PROFILE, synthetic_jobs, timed
+
+from resume_generator import ApplicationPackageGenerator
+
+
+def quiet(fn, *args, **kwargs):
+    """Run fn with the generators' progress output discarded"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return fn(*args, **kwargs)
+
+
+def main(n):
+    generator = ApplicationPackageGenerator(PROFILE)
+    # Distinct titles without '/', which save_package cannot put in a file name
+    jobs = [dict(job, title=f"{job['title'].replace('/', ' ')} {i}") for i, job in enumerate(synthetic_jobs(n))]
+    packages = quiet(lambda: [generator.generate_package(job) for job in jobs])
+    print(f"{n:,} packages\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        loose = os.path.join(tmp, 'loose')
+        os.mkdir(loose)
+        timed('save_package (loose files)', quiet, lambda: [generator.save_package(p, loose) for p in packages])
+        print(f"{'':<40} {len(os.listdir(loose)):10,} files")
+        for name in ('packages.zip', 'packages.tar', 'packages.tar.gz'):
+            path = os.path.join(tmp, name)
+            timed(f'save_packages ({name})', quiet, generator.save_packages, packages, path)
+            print(f"{'':<40} {os.path.getsize(path) / 1024:10,.0f} KiB")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
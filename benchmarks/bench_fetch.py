@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Sequential vs concurrent job-board fetching against local stub servers
+
+The stub servers run in this process, so their JSON encoding competes with
+the client's parsing for the GIL; real boards only add network latency.
+
+Usage: python benchmarks/bench_fetch.py [num_boards] [latency_ms]
+"""
+
+import os
+import statistics
+import sys
+import time
+
+from common import synthetic_jobs
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tests'))
+
+from job_fetcher import AsyncJobFetcher, JobBoardAdapter
+from stub_servers import StubJobBoard
+
+ROUNDS = 5
+
+
+def run(label, adapters, **options):
+    walls = []
+    latencies = []
+    with AsyncJobFetcher(adapters, **options) as fetcher:
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            jobs, errors = fetcher.fetch('Python Engineer Data')
+            walls.append(time.perf_counter() - start)
+            latencies.extend(fetcher.stats['latencies'])
+    cuts = statistics.quantiles(latencies, n=100)
+    print(f"{label:<28} wall {statistics.mean(walls) * 1000:8.1f} ms  "
+          f"{len(jobs) / statistics.mean(walls):9.0f} jobs/s  "
+          f"p50 {cuts[49] * 1000:6.1f}  p95 {cuts[94] * 1000:6.1f}  p99 {cuts[98] * 1000:6.1f} ms")
+
+
+def main(num_boards, latency):
+    boards = [StubJobBoard(synthetic_jobs(2000, seed=i), latency=latency) for i in range(num_boards)]
+    for board in boards:
+        board.__enter__()
+    try:
+        adapters = [JobBoardAdapter(f'board{i}', board.url + '/jobs') for i, board in enumerate(boards)]
+        print(f"{num_boards} boards, {latency * 1000:.0f} ms server latency, {ROUNDS} rounds\n")
+        run('sequential', adapters, max_concurrency=1, per_host_limit=1)
+        run('concurrent', adapters, max_concurrency=16, per_host_limit=4)
+    finally:
+        for board in boards:
+            board.__exit__(None, None, None)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 8,
+         (int(sys.argv[2]) if len(sys.argv) > 2 else 100) / 1000)
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""Memory per posting: plain dicts vs compact Job records
+
+Postings are decoded from JSON lines, as they would be from a dump, so
+repeated strings are distinct objects unless something interns them.
+
+Usage: python benchmarks/bench_job_record.py [num_jobs]
+"""
+
+import json
+import sys
+import tracemalloc
+
+from common import synthetic_jobs, timed
+
+from job_record import Job
+
+
+def measure(label, build, lines):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    records = timed(f'build {label}', build, lines)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    print(f"{'':<40} {used / len(lines):10.0f} bytes/posting")
+    return records
+
+
+def main(n):
+    lines = [json.dumps(job) for job in synthetic_jobs(n)]
+    print(f"{n:,} postings\n")
+    dicts = measure('dicts', lambda ls: [json.loads(line) for line in ls], lines)
+    jobs = measure('Job records', lambda ls: [Job(json.loads(line)) for line in ls], lines)
+    assert jobs[0] == dicts[0]
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Additive vs TF-IDF semantic match scoring
+
+Usage: python benchmarks/bench_matching.py [num_jobs]
+"""
+
+import sys
+
+from common import synthetic_jobs, timed
+
+from batch_scoring import BatchScorer, JobFeatures
+from semantic_matching import SemanticMatcher
+
+PREFERENCES = {
+    'keywords': 'Python Machine Learning Engineer',
+    'required_skills': ['Python', 'AWS', 'Machine Learning', 'Kafka'],
+    'remote_only': True,
+    'preferred_companies': ['Amazon', 'Google']
+}
+QUERY = PREFERENCES['keywords'] + ' ' + ' '.join(PREFERENCES['required_skills'])
+
+
+def main(n):
+    jobs = synthetic_jobs(n)
+    new_jobs = synthetic_jobs(1000, seed=1)
+    for i, job in enumerate(new_jobs):
+        job['url'] += f'?new={i}'
+    print(f"{n:,} postings\n")
+
+    print("additive")
+    features = timed('  build JobFeatures', JobFeatures, jobs)
+    scorer = BatchScorer(PREFERENCES)
+    timed('  score (cold)', scorer.score, features)
+    timed('  score (warm)', scorer.score, features)
+
+    print("semantic")
+    matcher = timed('  fit TF-IDF', SemanticMatcher, jobs)
+    timed('  score (computes row norms)', matcher.scores, QUERY)
+    timed('  score (warm)', matcher.scores, QUERY)
+    timed('  add 1,000 postings', matcher.add_jobs, new_jobs)
+    timed('  score after add', matcher.scores, QUERY)
+    timed('  score (warm)', matcher.scores, QUERY)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Last-48-hours search: scanning the full history vs the PostedIndex window
+
+Postings are spread evenly over the past year, so the window holds ~0.5%.
+
+Usage: python benchmarks/bench_posted.py [num_jobs]
+"""
+
+import contextlib
+import io
+import random
+import sys
+import time
+
+from common import synthetic_jobs, timed
+
+from job_search import JobSearchAgent
+from posted_date import DAY, posted_after
+
+PREFERENCES = {'required_skills': ['Python', 'AWS', 'Docker'], 'min_match_score': 20, 'freshness_weight': 20}
+
+
+def main(n):
+    now = time.time()
+    rng = random.Random(0)
+    jobs = synthetic_jobs(n)
+    for job in jobs:
+        job['posted'] = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(now - rng.uniform(0, 365) * DAY))
+    since = now - 2 * DAY
+    print(f"{n:,} postings over the past year, window: last 48 hours\n")
+
+    full = JobSearchAgent(PREFERENCES, jobs=jobs)
+    full.index
+    windowed = JobSearchAgent(dict(PREFERENCES, posted_within_days=2), jobs=jobs)
+    windowed.index
+    timed('build PostedIndex', windowed.index.posted_ids, since)
+
+    def scan():
+        with contextlib.redirect_stdout(io.StringIO()):
+            found = full.search_jobs('Engineer Developer Scientist')
+            return full.filter_jobs([j for j in found if posted_after(j['posted'], since)])
+
+    def window():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return windowed.filter_jobs(windowed.search_jobs('Engineer Developer Scientist'))
+
+    expected = timed('search + scan posted dates', scan)
+    result = timed('search within PostedIndex window', window)
+    assert sorted(j['url'] for j in result) == sorted(j['url'] for j in expected)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
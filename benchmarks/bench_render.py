@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Package text rendering: the line-list formatters vs compiled layout templates
+
+Each package's resume and cover letter are written to a file (os.devnull,
+so disk speed does not count); timings are the best of 5 runs. Transient
+memory is the traced peak while rendering one package into a sink that
+discards the text, which leaves out the file's own write buffer.
+
+Usage: python benchmarks/bench_render.py [num_packages]
+"""
+
+import contextlib
+import gc
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+from common import PROFILE, synthetic_jobs
+
+from resume_generator import ApplicationPackageGenerator
+
+
+def legacy_resume_text(resume):
+    """The list-building resume formatter the templates replaced"""
+    text = []
+    h = resume['header']
+    text.append(f"{h['name'].upper()}")
+    text.append(f"{h['email']} | {h['phone']} | {h['location']}")
+    if h.get('linkedin'):
+        text.append(f"LinkedIn: {h['linkedin']}")
+    text.append("")
+    text.append("PROFESSIONAL SUMMARY")
+    text.append("-" * 50)
+    text.append(resume['summary'])
+    text.append("")
+    text.append("TECHNICAL SKILLS")
+    text.append("-" * 50)
+    text.append(", ".join(resume['skills']))
+    text.append("")
+    text.append("PROFESSIONAL EXPERIENCE")
+    text.append("-" * 50)
+    for exp in resume['experience']:
+        text.append(f"\n{exp['title']} | {exp['company']}")
+        text.append(exp['duration'])
+        for bullet in exp['bullets']:
+            text.append(f"  • {bullet}")
+    text.append("")
+    text.append("EDUCATION")
+    text.append("-" * 50)
+    for edu in resume['education']:
+        text.append(f"{edu['degree']} - {edu['school']} ({edu['year']})")
+    return "\n".join(text)
+
+
+def legacy_cover_letter_text(profile, letter):
+    """The list-building cover-letter formatter the templates replaced"""
+    text = []
+    text.append(profile['name'])
+    text.append(profile['email'])
+    text.append(profile['phone'])
+    text.append("")
+    text.append(letter['date'])
+    text.append("")
+    text.append(letter['greeting'])
+    text.append("")
+    text.append(letter['opening'])
+    text.append("")
+    for para in letter['body']:
+        text.append(para)
+        text.append("")
+    text.append(letter['closing'])
+    text.append("")
+    text.append("Sincerely,")
+    text.append(letter['signature'])
+    return "\n".join(text)
+
+
+class Discard:
+    def write(self, text):
+        return len(text)
+
+
+def best_of(renderers, *args, runs=5):
+    """Print each renderer's best wall time, alternating between them so machine noise hits both alike"""
+    best = dict.fromkeys((label for label, _ in renderers), float('inf'))
+    for _ in range(runs):
+        for label, render in renderers:
+            gc.collect()
+            start = time.perf_counter()
+            render(*args)
+            best[label] = min(best[label], time.perf_counter() - start)
+    for label, seconds in best.items():
+        print(f"{'write (' + label + ')':<40} {seconds * 1000:10.1f} ms")
+
+
+def main(n):
+    generator = ApplicationPackageGenerator(PROFILE)
+    with contextlib.redirect_stdout(io.StringIO()):
+        packages = [generator.generate_package(job) for job in synthetic_jobs(n)]
+    print(f"{n:,} packages\n")
+
+    def legacy(packages, out):
+        for package in packages:
+            out.write(legacy_resume_text(package['resume']))
+            out.write(legacy_cover_letter_text(PROFILE, package['cover_letter']))
+
+    def templates(packages, out):
+        for package in packages:
+            generator.resume_gen.write_resume_text(package['resume'], out)
+            generator.cover_letter_gen.write_cover_letter_text(package['cover_letter'], out)
+
+    for package in packages[:100]:
+        assert generator.resume_gen.format_resume_text(package['resume']) == legacy_resume_text(package['resume'])
+        assert generator.cover_letter_gen.format_cover_letter_text(package['cover_letter']) == \
+            legacy_cover_letter_text(PROFILE, package['cover_letter'])
+
+    renderers = (('line lists + join', legacy), ('compiled templates', templates))
+    with open(os.devnull, 'w') as out:
+        best_of(renderers, packages, out)
+
+    # The legacy path holds every line plus the joined copy at once
+    print()
+    for label, render in renderers:
+        render(packages[:1], Discard())  # warm up
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        render(packages[1:2], Discard())
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+        tracemalloc.stop()
+        print(f"{'peak bytes/package (' + label + ')':<40} {peak:10,}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
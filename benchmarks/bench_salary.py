@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""Salary range filtering: re-parsing strings per job vs the sorted SalaryIndex
+
+Usage: python benchmarks/bench_salary.py [num_jobs]
+"""
+
+import sys
+
+from common import synthetic_jobs, timed
+
+from salary import SalaryIndex, salary_in_range
+
+
+def main(n):
+    jobs = synthetic_jobs(n)
+    print(f"{n:,} postings, yearly range $150k-$170k\n")
+
+    expected = timed('scan with salary_in_range', lambda: [
+        i for i, job in enumerate(jobs) if salary_in_range(job['salary'], 150000, 170000)])
+
+    index = SalaryIndex()
+    timed('build SalaryIndex', lambda: [index.add(i, job['salary']) for i, job in enumerate(jobs)])
+    timed('first query (sorts once)', index.range_ids, 150000, 170000)
+    ids = timed('range_ids', index.range_ids, 150000, 170000)
+    assert ids.tolist() == expected
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""Per-job vs batch match scoring
+
+Usage: python benchmarks/bench_scoring.py [num_jobs]
+"""
+
+import sys
+
+from common import synthetic_jobs, timed
+
+from batch_scoring import BatchScorer, JobFeatures
+from job_search import JobSearchAgent
+
+PREFERENCES = {
+    'required_skills': ['Python', 'AI', 'Machine Learning', 'AWS'],
+    'remote_only': True,
+    'min_match_score': 40,
+    'preferred_companies': ['Amazon', 'Google', 'Microsoft']
+}
+
+
+def main(n):
+    jobs = synthetic_jobs(n)
+    agent = JobSearchAgent(PREFERENCES, jobs=[])
+    print(f"Scoring {n:,} postings\n")
+
+    expected = timed('per-job _calculate_match_score', lambda: [agent._calculate_match_score(j) for j in jobs])
+    features = timed('build JobFeatures (once per corpus)', JobFeatures, jobs)
+    scorer = BatchScorer(PREFERENCES)
+    timed('BatchScorer.score (cold skill columns)', scorer.score, features)
+    scores = timed('BatchScorer.score (warm)', scorer.score, features)
+
+    assert scores.tolist() == expected
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Query throughput of sharded multi-process search vs one agent
+
+Each shard count runs the same query mix. Shards only run in parallel on
+separate cores, so compare the shard counts against the core count printed
+in the header: on a single core, more shards add process overhead rather
+than throughput.
+
+Usage: python benchmarks/bench_sharded.py [num_jobs] [max_shards]
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+from common import synthetic_jobs
+
+from job_search import JobSearchAgent
+from sharded_search import ShardedJobSearch
+
+PREFERENCES = {'required_skills': ['Python', 'AWS', 'Docker', 'Kubernetes'], 'remote_only': True,
+               'min_match_score': 40}
+QUERIES = ['Python Engineer', 'Data Scientist', 'Backend Developer', 'Machine Learning', 'DevOps Architect'] * 4
+LIMIT = 50
+
+
+def report(label, elapsed):
+    print(f"{label:<28} {elapsed * 1000:10.1f} ms  {len(QUERIES) / elapsed:8.1f} queries/s")
+
+
+def main(num_jobs, max_shards):
+    jobs = synthetic_jobs(num_jobs)
+    print(f"{num_jobs} jobs, {len(QUERIES)} queries, top {LIMIT}, {os.cpu_count()} cores\n")
+
+    agent = JobSearchAgent(PREFERENCES, jobs=jobs)
+    with contextlib.redirect_stdout(io.StringIO()):
+        agent.index
+        start = time.perf_counter()
+        for query in QUERIES:
+            agent.filter_jobs(agent.search_jobs(query), limit=LIMIT)
+    report('single agent', time.perf_counter() - start)
+
+    shards = 1
+    while shards <= max_shards:
+        with tempfile.TemporaryDirectory() as tmp, \
+                ShardedJobSearch.from_jobs(PREFERENCES, jobs, tmp, num_shards=shards) as sharded:
+            sharded.shard_sizes()  # wait for the workers to load
+            start = time.perf_counter()
+            for query in QUERIES:
+                sharded.search_jobs(query, limit=LIMIT)
+            report(f'{shards} shard(s)', time.perf_counter() - start)
+        shards *= 2
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1))
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""JobStore ingest and search latency
+
+Usage: python benchmarks/bench_store.py [num_jobs] [db_path]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from common import synthetic_jobs, timed
+
+from job_store import JobStore
+
+QUERIES = [
+    (['Kafka'], 'Seattle'),
+    (['Spark', 'Kafka'], 'Remote'),
+    (['Architect'], 'New York'),
+]
+
+
+def main(n, path):
+    store = JobStore(path)
+    if len(store) < n:
+        timed(f'ingest {n:,} postings', store.add_jobs, synthetic_jobs(n))
+    store.close()
+
+    store = timed('open existing store', JobStore, path)
+    print(f"\n{len(store):,} rows, top-50 per query\n")
+    for keywords, location in QUERIES:
+        start = time.perf_counter()
+        for _ in range(20):
+            rows = store.search(keywords, location=location, limit=50)
+        ms = (time.perf_counter() - start) / 20 * 1000
+        print(f"{' '.join(keywords) + ' @ ' + location:<40} {ms:10.2f} ms  ({len(rows)} rows)")
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    path = sys.argv[2] if len(sys.argv) > 2 else os.path.join(tempfile.gettempdir(), f'bench_jobs_{n}.db')
+    main(n, path)
@@ -57,12 +57,14 @@ class JobSearchOrchestrator:
         self.resume_gen = ApplicationPackageGenerator(self.profile)
         
         applications = []
-        for job in filtered[:3]:  # Top 3 jobs
-            package = self.resume_gen.generate_package(job)
-            applications.append(package)
+        for result in self.resume_gen.generate_packages(filtered[:3], executor='thread'):  # Top 3 jobs
+            if result.error is not None:
+                print(f"⚠️  Could not generate package for {result.job.get('company')}: {result.error}")
+                continue
+            applications.append(result.package)
             
             # Track application
-            self.tracker.add_application(job['title'], job['company'])
+            self.tracker.add_application(result.job['title'], result.job['company'])
         
         print(f"✓ Generated {len(applications)} application packages")
         
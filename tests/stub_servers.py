@@ -0,0 +1,121 @@
+"""Local stub HTTP servers for exercising network code offline"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+class StubServer:
+    """Base for stub servers: runs a ThreadingHTTPServer on a free local port in a background thread.
+
+    ``latency`` (seconds) delays every response and ``fail_first`` answers
+    that many requests with ``fail_status`` before behaving normally. Use it
+    as a context manager.
+    """
+
+    def __init__(self, latency=0.0, fail_first=0, fail_status=503):
+        self.latency = latency
+        self.fail_first = fail_first
+        self.fail_status = fail_status
+        self.requests = []
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                server._dispatch(self, 'GET')
+
+            def do_POST(self):
+                server._dispatch(self, 'POST')
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _dispatch(self, handler, method):
+        length = int(handler.headers.get('Content-Length') or 0)
+        body = handler.rfile.read(length) if length else b''
+        with self._lock:
+            self.requests.append((method, handler.path, dict(handler.headers), body))
+            failing = len(self.requests) <= self.fail_first
+        if self.latency:
+            time.sleep(self.latency)
+        if failing:
+            self._send(handler, self.fail_status, b'{"error": "stub failure"}')
+            return
+        status, payload, content_type = self.respond(method, handler.path, handler.headers, body)
+        self._send(handler, status, payload, content_type)
+
+    @staticmethod
+    def _send(handler, status, payload, content_type='application/json'):
+        handler.send_response(status)
+        handler.send_header('Content-Type', content_type)
+        handler.send_header('Content-Length', str(len(payload)))
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+    def respond(self, method, path, headers, body):
+        raise NotImplementedError
+
+
+class StubJobBoard(StubServer):
+    """Job board answering GET /jobs?q=... with the postings whose title contains any query word"""
+
+    def __init__(self, jobs, response_format='jsonl', **kwargs):
+        super().__init__(**kwargs)
+        self.jobs = jobs
+        self.response_format = response_format
+
+    def respond(self, method, path, headers, body):
+        query = parse_qs(urlsplit(path).query).get('q', [''])[0].lower().split()
+        jobs = [job for job in self.jobs if any(word in job['title'].lower() for word in query)]
+        if self.response_format == 'json':
+            return 200, json.dumps(jobs).encode('utf-8'), 'application/json'
+        payload = ''.join(json.dumps(job) + '\n' for job in jobs).encode('utf-8')
+        return 200, payload, 'application/x-ndjson'
+
+
+class StubATS(StubServer):
+    """Applicant tracking system answering POST /applications.
+
+    Applications are deduplicated on the Idempotency-Key header: a repeated
+    key gets the original application back with status 200 instead of 201.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.applications = {}  # idempotency key -> application
+
+    def respond(self, method, path, headers, body):
+        if method != 'POST' or urlsplit(path).path != '/applications':
+            return 404, b'{"error": "not found"}', 'application/json'
+        key = headers.get('Idempotency-Key')
+        if not key:
+            return 400, b'{"error": "missing Idempotency-Key"}', 'application/json'
+        with self._lock:
+            status = 200 if key in self.applications else 201
+            application = self.applications.setdefault(key, {
+                'id': len(self.applications) + 1,
+                'status': 'Applied',
+                **json.loads(body or b'{}')
+            })
+        return status, json.dumps(application).encode('utf-8'), 'application/json'
@@ -3,11 +3,43 @@
 
 import sys
 import os
+import gzip
+import tarfile
+import zipfile
+import io
+import json
+import tempfile
+import time
+
+import requests
+
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agents'))
 
+import job_search
 from job_search import JobSearchAgent
-from resume_generator import ApplicationPackageGenerator
+from resume_generator import ApplicationPackageGenerator, ResumeGenerator, TECH_KEYWORDS, compile_profile
 from application_tracker import ApplicationTracker
+from job_index import JobIndex
+from batch_scoring import BatchScorer, JobFeatures
+from job_sources import SAMPLE_JOBS, open_source
+from job_store import JobStore
+from job_record import Job
+from job_analysis import analyze_job, memoized_analysis
+from interview_prep import InterviewPrepAgent
+from keyword_matcher import KeywordMatcher
+from linkedin_agent import LinkedInAgent
+from dedup import NearDuplicateDetector
+from job_history import JobHistory
+from salary import SalaryIndex, parse_salary
+from posted_date import DAY, parse_posted
+from locations import GeoGridIndex, normalize_location, within_distance
+from job_fetcher import AsyncJobFetcher, JobBoardAdapter, iter_json_array
+from apply_executor import BatchApplyExecutor, DryRunATSAdapter, HttpATSAdapter, TokenBucket, idempotency_key, retry_after
+from sharded_search import ShardedJobSearch, shard_of
+from package_cache import PackageCache
+from templates import Template, TemplateError
+from package_archive import read_manifest
+from stub_servers import StubATS, StubJobBoard
 
 def test_job_search_agent():
     """Test job search functionality"""
@@ -54,11 +86,806 @@ def test_application_tracker():
     assert tracker.applications[0]['job_title'] == 'Python Engineer'
     print("✓ Application tracker test passed")
 
+def test_job_index_matches_substring_scan():
+    """Test inverted index returns the same jobs as a linear substring scan"""
+    jobs = JobSearchAgent({})._get_sample_jobs()
+    index = JobIndex(jobs[:4])
+    index.add_jobs(jobs[4:])
+    for keywords in ['Python AI Engineer', 'ML', 'node.js', 'scal', 'nothing-here']:
+        expected = [j for j in jobs if any(k.lower() in j['title'].lower() or k.lower() in j['description'].lower()
+                                           for k in keywords.split())]
+        assert index.search(keywords.split()) == expected
+    # Word mode ignores partial-word hits ('ML' inside 'HTML' etc.)
+    assert [j['company'] for j in index.search(['scal'], mode='word')] == []
+    assert len(index.search(['python', 'aws'], match='all')) == 2
+    print("✓ Job index test passed")
+
+def test_batch_scorer_matches_per_job_score():
+    """Test vectorized scores and filter order match the per-job rules"""
+    preferences = {
+        'required_skills': ['Python', 'AI', 'Machine Learning', 'AWS', 'python'],
+        'remote_only': True,
+        'min_match_score': 40,
+        'preferred_companies': ['Amazon', 'Google']
+    }
+    agent = JobSearchAgent(preferences)
+    jobs = agent._get_sample_jobs() + [{'title': 'Dev', 'company': 'X', 'salary': 'Not specified'}]
+    features = JobFeatures(jobs)
+    scores = BatchScorer(preferences).score(features)
+    assert scores.tolist() == [agent._calculate_match_score(j) for j in jobs]
+
+    expected = sorted([j for j in jobs if agent._calculate_match_score(j) >= 40],
+                      key=agent._calculate_match_score, reverse=True)
+    assert [j['url'] for j in agent.filter_jobs(jobs)] == [j['url'] for j in expected]
+    print("✓ Batch scorer test passed")
+
+def test_filter_jobs_top_k_streaming():
+    """Test top-K filtering over a generator matches the full sort, ties included"""
+    preferences = {'required_skills': ['Python', 'AWS'], 'remote_only': True, 'min_match_score': 40}
+    agent = JobSearchAgent(preferences)
+    jobs = agent._get_sample_jobs() * 3
+    agent.SCORE_CHUNK_SIZE = 5
+    full = [j['url'] for j in agent.filter_jobs(list(jobs))]
+    for k in (1, 4, 10, 100):
+        top = agent.filter_jobs((job for job in jobs), limit=k)
+        assert [j['url'] for j in top] == full[:k]
+    assert agent.filter_jobs(iter(jobs), limit=0) == []
+    print("✓ Top-K filter test passed")
+
+def test_streaming_job_sources():
+    """Test JSONL, gzip and directory sources feed a streaming search pipeline"""
+    preferences = {'required_skills': ['Python'], 'remote_only': True, 'min_match_score': 40}
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(os.path.join(tmp, 'a.jsonl'), 'w') as f:
+            f.writelines(json.dumps(job) + '\n' for job in SAMPLE_JOBS[:5])
+        with gzip.open(os.path.join(tmp, 'b.jsonl.gz'), 'wt') as f:
+            f.writelines(json.dumps(job) + '\n\n' for job in SAMPLE_JOBS[5:])
+        assert list(open_source(tmp)) == SAMPLE_JOBS
+
+        agent = JobSearchAgent(preferences, sources=[open_source(tmp)])
+        streamed = agent.search_jobs('Python Engineer', stream=True)
+        assert not isinstance(streamed, list)
+        top = agent.filter_jobs(streamed, limit=2)
+        indexed = JobSearchAgent(preferences)
+        expected = indexed.filter_jobs(indexed.search_jobs('Python Engineer'))[:2]
+        assert [j['url'] for j in top] == [j['url'] for j in expected]
+    print("✓ Job sources test passed")
+
+def test_job_store_search_pushdown():
+    """Test the SQLite FTS5 store persists postings and filters in SQL"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'jobs.db')
+        store = JobStore(path)
+        store.add_jobs(SAMPLE_JOBS)
+        store.add_jobs(SAMPLE_JOBS[:1])  # re-ingest updates in place
+        store.close()
+
+        store = JobStore(path)
+        assert len(store) == len(SAMPLE_JOBS)
+        agent = JobSearchAgent({'min_match_score': 0}, store=store)
+        jobs = agent.search_jobs('Django React', location='remote')
+        assert [j['company'] for j in jobs] == ['TechCorp']
+        assert len(agent.search_jobs('Django React', location='')) == 2
+        assert store.search(['aws'], location='New York')[0]['company'] == 'CloudTech'
+        assert store.search(['"unbalanced'], limit=1) == []
+        store.close()
+    print("✓ Job store test passed")
+
+def test_job_store_matches_index():
+    """Test the store and the in-memory index give the same search results"""
+    places = ['Remote', 'New York, NY', 'San Francisco, CA', 'Hybrid (SF)', 'Palo Alto, CA', 'Nowhere Town']
+    jobs = [dict(job, url=f"{job['url']}/{i}", location=places[i % len(places)], posted=f'{i % 5} days ago')
+            for i, job in enumerate(SAMPLE_JOBS * 3)]
+    store = JobStore()
+    store.add_jobs(jobs)
+
+    def both(query, preferences=None, **kwargs):
+        indexed = JobSearchAgent(dict(preferences or {}), jobs=jobs).search_jobs(query, **kwargs)
+        stored = JobSearchAgent(dict(preferences or {}), store=store).search_jobs(query, **kwargs)
+        assert [j['url'] for j in stored] == [j['url'] for j in indexed], (query, preferences, kwargs)
+        return stored
+
+    assert {j['location'] for j in both('AWS')} > {'Remote'}  # no location filter unless one is given
+    assert both('scal') and both('go') and not both('Kubernetes', keyword_mode='word')
+    assert {j['location'] for j in both('Engineer Scientist Developer', location='SF')} == \
+        {'San Francisco, CA', 'Hybrid (SF)'}
+    assert {j['location'] for j in both('Engineer Scientist Developer', location='remote')} == {'Remote'}
+    assert both('Engineer Scientist Developer', location='town')
+    assert len(both('Engineer Scientist Developer', limit=4)) == 4
+    assert both('Engineer Scientist Developer', {'location': 'San Francisco, CA', 'max_distance_km': 50})
+    # Relative dates are resolved when the query runs, not when the posting was stored
+    assert both('Engineer Scientist Developer', {'posted_within_days': 2.5})
+    print("✓ Job store/index parity test passed")
+
+def test_job_record_dict_view():
+    """Test compact Job records behave like posting dicts"""
+    raw = json.loads(json.dumps(SAMPLE_JOBS[0]))
+    job = Job(raw)
+    assert job == SAMPLE_JOBS[0] and dict(job) == SAMPLE_JOBS[0]
+    assert job['company'] is Job(json.loads(json.dumps(SAMPLE_JOBS[0])))['company']
+    assert 'match_score' not in job and job.get('match_score', 0) == 0
+    job['match_score'] = 80
+    job['sources'] = ['LinkedIn']
+    assert list(job)[-2:] == ['match_score', 'sources']
+    assert not hasattr(job, '__dict__')
+
+    agent = JobSearchAgent({'required_skills': ['Python'], 'min_match_score': 0})
+    jobs = agent.filter_jobs(agent.search_jobs('Python'), dedupe=True)
+    assert all(type(j) is dict for j in jobs) and json.dumps(jobs)
+    # Scores and duplicate lists are written into the per-call copies, not the indexed records
+    assert all(isinstance(j, Job) and 'match_score' not in j and 'sources' not in j for j in agent.index.jobs)
+    jobs[0]['title'] = 'Edited'
+    assert agent.search_jobs('Python')[0]['title'] != 'Edited'
+    generator = ApplicationPackageGenerator({'name': 'T', 'email': 'e', 'phone': 'p', 'location': 'l',
+                                             'skills': ['Python'], 'experience': [], 'education': []})
+    assert generator.generate_package(jobs[0])['resume']['match_score'] > 0
+    print("✓ Job record test passed")
+
+def test_keyword_matcher_substring_semantics():
+    """Test the Aho-Corasick matcher agrees with substring checks and reports positions"""
+    keywords = ['AI', 'ai', 'Machine Learning', 'learn', 'Node.js', 'he', 'she', 'hers', '']
+    matcher = KeywordMatcher(keywords)
+    for text in ['Maintain ML systems', 'ushers in machine learning', 'NODE.JS and React', '']:
+        assert matcher.matches(text) == [k for k in keywords if k.lower() in text.lower()]
+    assert [(s, e, k) for s, e, k in matcher.find_all('ushers') if k] == [(1, 4, 'she'), (2, 4, 'he'), (2, 6, 'hers')]
+    assert KeywordMatcher(['AI'], ignore_case=False).matches('maintain') == []
+
+    agent = LinkedInAgent({'skills': ['Python', 'Team Leadership', 'Docker', 'python']})
+    assert agent._optimize_skills() == {'Technical': ['Python'], 'Leadership': ['Team Leadership'],
+                                        'Tools': ['Docker', 'python']}
+    print("✓ Keyword matcher test passed")
+
+def test_semantic_scoring_mode():
+    """Test TF-IDF ranking is selectable and updates incrementally"""
+    preferences = {'keywords': 'NLP transformers', 'required_skills': ['Python'], 'scoring': 'semantic',
+                   'min_match_score': 30}
+    agent = JobSearchAgent(preferences)
+    ranked = agent.filter_jobs(agent.search_jobs('Python'))
+    assert ranked[0]['title'] == 'AI Engineer - NLP'
+    assert all(0 < j['match_score'] <= 100 for j in ranked)
+
+    fitted = len(agent.semantic)
+    agent.add_jobs([{'title': 'NLP Scientist', 'company': 'Lab', 'description': 'NLP with transformers',
+                     'url': 'https://lab.example/nlp'}])
+    assert len(agent.semantic) == fitted + 1
+    assert agent.filter_jobs(agent.search_jobs('NLP'), limit=1)[0]['company'] == 'Lab'
+    additive = agent.filter_jobs(agent.search_jobs('NLP'), scoring='additive')
+    assert [(j['company'], j['match_score']) for j in additive] == [('Amazon', 30)]
+
+    # Postings outside the corpus are scored with its IDF but never added to it
+    matcher, query = agent.semantic, agent._semantic_query()
+    fitted = len(matcher)
+    copies = [{k: v for k, v in job.items() if k != 'url'} for job in agent.index.jobs[:2]]
+    assert matcher.key(copies[0]) != matcher.key(copies[1])
+    assert matcher.scores_for(copies, query).round(9).tolist() == matcher.scores(query)[:2].round(9).tolist()
+    assert matcher.scores_for([{'title': 'Chef', 'description': 'Cooking'}], query).tolist() == [0]
+    assert len(matcher) == fitted
+    print("✓ Semantic scoring test passed")
+
+def test_near_duplicate_postings_collapsed():
+    """Test reposts across boards collapse into one job with provenance"""
+    repost = dict(SAMPLE_JOBS[0], source='Indeed', url='https://indeed.com/viewjob?jk=1',
+                  description=SAMPLE_JOBS[0]['description'] + '.')
+    jobs = [dict(job) for job in SAMPLE_JOBS] + [repost]
+    detector = NearDuplicateDetector()
+    unique = list(detector.deduplicate(jobs))
+    assert len(unique) == len(SAMPLE_JOBS) and detector.duplicates == 1
+    assert [s['source'] for s in unique[0]['sources']] == ['LinkedIn', 'Indeed']
+
+    agent = JobSearchAgent({'required_skills': ['Python', 'AWS'], 'min_match_score': 40, 'dedupe': True})
+    filtered = agent.filter_jobs(iter(jobs), limit=3)
+    assert [j['url'] for j in filtered].count(SAMPLE_JOBS[0]['url']) == 1
+    assert len(filtered[0]['sources']) == 2
+    print("✓ Dedup test passed")
+
+def test_incremental_rescoring_on_preference_change():
+    """Test preference tweaks recompute only the affected score components"""
+    preferences = {'required_skills': ['Python'], 'remote_only': False, 'min_match_score': 30}
+    agent = JobSearchAgent(preferences)
+    jobs = agent._get_sample_jobs()
+    agent.filter_jobs(jobs)
+    scorer = agent._last_scorer
+
+    ranked = agent.update_preferences(required_skills=['Python', 'AWS'], remote_only=True)
+    assert sorted(scorer.recomputed) == [('remote',), ('skill', 'aws', 1)]
+    expected = sorted([j for j in jobs if agent._calculate_match_score(j) >= 30],
+                      key=agent._calculate_match_score, reverse=True)
+    assert [j['url'] for j in ranked] == [j['url'] for j in expected]
+    assert all(j['match_score'] == agent._calculate_match_score(j) for j in ranked)
+
+    agent.update_preferences(remote_only=False)
+    assert scorer.recomputed == [] and ('remote',) not in scorer.components
+    
+    # Deduplicated and generator inputs: the scored postings are kept, not the spent input
+    repost = dict(SAMPLE_JOBS[0], source='Indeed', url='https://indeed.com/viewjob?jk=1',
+                  description=SAMPLE_JOBS[0]['description'] + '.')
+    for dedupe, make_input in ((True, lambda: [dict(job) for job in SAMPLE_JOBS] + [repost]),
+                               (False, lambda: (dict(job) for job in SAMPLE_JOBS))):
+        agent = JobSearchAgent({'required_skills': ['Python'], 'min_match_score': 20})
+        first = agent.filter_jobs(make_input(), dedupe=dedupe)
+        scorer = agent._last_scorer
+        ranked = agent.update_preferences(required_skills=['Python', 'AWS'])
+        assert agent._last_scorer is scorer and scorer.recomputed == [('skill', 'aws', 1)]
+        scored = scorer.features.jobs
+        assert len(scored) == len(SAMPLE_JOBS) and first
+        assert len(ranked) == sum(agent._calculate_match_score(j) >= 20 for j in scored) >= len(first)
+        assert [j['url'] for j in ranked] == [j['url'] for j in sorted(
+            ranked, key=agent._calculate_match_score, reverse=True)]
+        assert all(j['match_score'] == agent._calculate_match_score(j) for j in ranked)
+    
+    # filter_jobs rescans the postings, so in-place edits between calls are scored
+    jobs = [dict(job) for job in SAMPLE_JOBS]
+    agent = JobSearchAgent({'required_skills': ['Python'], 'min_match_score': 0})
+    agent.filter_jobs(jobs)
+    for job in jobs:
+        job['title'], job['description'] = 'Engineer', 'Java services.'
+    rescored = agent.filter_jobs(jobs)
+    assert all(j['match_score'] == agent._calculate_match_score(j) for j in rescored)
+    assert not any(j['match_score'] >= 20 + 10 for j in rescored)
+    print("✓ Incremental re-scoring test passed")
+
+def test_bounded_job_history():
+    """Test jobs_found dedupes by URL, evicts LRU/expired entries and keeps counters"""
+    agent = JobSearchAgent({'history_size': 6})
+    for _ in range(3):
+        agent.search_jobs('Python')
+    assert len(agent.jobs_found) == 6 and agent.jobs_found.duplicates == 12
+    assert agent.get_report()['search_summary']['total_found'] == 6
+    agent.search_jobs('DevOps')
+    assert len(agent.jobs_found) == 6 and agent.jobs_found.evicted == 1
+
+    now = [0]
+    history = JobHistory(max_size=None, ttl=10, clock=lambda: now[0])
+    history.extend(SAMPLE_JOBS[:3])
+    now[0] = 5
+    history.add(SAMPLE_JOBS[0])
+    now[0] = 12
+    assert len(history) == 1 and SAMPLE_JOBS[0]['url'] in history
+    assert history.stats() == {'retained': 1, 'total_seen': 4, 'unique_seen': 3, 'duplicates': 1, 'evicted': 2}
+    # An evicted job seen again is re-inserted but not counted as a new one
+    history.add(SAMPLE_JOBS[1])
+    assert SAMPLE_JOBS[1]['url'] in history
+    assert history.stats() == {'retained': 2, 'total_seen': 5, 'unique_seen': 3, 'duplicates': 1, 'evicted': 2}
+    # Distinct jobs are estimated in fixed memory: within a few percent at 50,000
+    history = JobHistory(max_size=100)
+    history.extend({'url': f'https://example.com/{i % 50000}'} for i in range(60000))
+    assert len(history._distinct.registers) == 4096 and abs(history.unique_seen - 50000) < 50000 * 0.05
+    print("✓ Job history test passed")
+
+def test_salary_parsing_and_range_queries():
+    """Test salaries are parsed to numbers and range-filtered in search, scoring and filtering"""
+    assert parse_salary('$150k-$200k') == (150000, 200000, 'USD', 'year')
+    assert parse_salary('£45/hr') == (45, 45, 'GBP', 'hour')
+    assert parse_salary('EUR 4,500 - 5,000 per month') == (4500, 5000, 'EUR', 'month')
+    assert parse_salary('Not specified') is None
+    assert parse_salary('$90k academic appointment') == (90000, 90000, 'USD', 'year')  # not CAD
+    assert parse_salary('CAD90k - 100k') == (90000, 100000, 'CAD', 'year')
+    # Only the salary amount or range is read, not numbers in trailing benefits text
+    assert parse_salary('$150k-$200k + 15% bonus') == (150000, 200000, 'USD', 'year')
+    assert parse_salary('$120,000 with 401k match') == (120000, 120000, 'USD', 'year')
+    assert parse_salary('$90k-$110k, 4 weeks PTO') == (90000, 110000, 'USD', 'year')
+    assert parse_salary('401k match, $95,000 base') == (95000, 95000, 'USD', 'year')
+    assert parse_salary('$100-120k') == (100000, 120000, 'USD', 'year')
+    assert parse_salary('120000 to 150000, 20 days PTO') == (120000, 150000, 'USD', 'year')
+
+    index = SalaryIndex()
+    for doc_id, salary in enumerate(['$100k-$120k', 'Not specified', '$150k-$200k', '$62/hr']):
+        index.add(doc_id, salary)
+    assert index.range_ids(min_salary=125000).tolist() == [2, 3]
+    assert index.range_ids(min_salary=110000, max_salary=130000).tolist() == [0, 3]
+
+    preferences = {'required_skills': ['Python'], 'min_match_score': 20, 'min_salary': 175000}
+    agent = JobSearchAgent(preferences)
+    found = agent.search_jobs('Python')
+    assert {j['company'] for j in found} == {'Amazon Web Services', 'Google', 'Microsoft', 'DataCo', 'Amazon'}
+    # Without numpy (no sorted salary index) every keyword hit is checked instead, with the same result
+    numpy = job_search.np
+    job_search.np = None
+    try:
+        assert JobSearchAgent(preferences).search_jobs('Python') == found
+    finally:
+        job_search.np = numpy
+    jobs = agent._get_sample_jobs()
+    batch = agent.filter_jobs(jobs)
+    streamed = agent.filter_jobs(iter(jobs), limit=10)
+    assert [j['url'] for j in batch] == [j['url'] for j in streamed]
+    assert all(j['match_score'] == agent._calculate_match_score(j) for j in batch)
+    assert 'TechCorp' not in {j['company'] for j in batch}
+    print("✓ Salary index test passed")
+
+def test_concurrent_job_fetching():
+    """Test boards are fetched concurrently with retries and streaming JSON parsing"""
+    text = json.dumps(SAMPLE_JOBS[:3])
+    assert list(iter_json_array(text[i:i + 7] for i in range(0, len(text), 7))) == SAMPLE_JOBS[:3]
+    for broken in (text[:-1], text[:len(text) // 2], text[:-1] + ', {"title": x}]', ''):
+        try:
+            list(iter_json_array([broken]))
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"accepted a broken array: {broken[-20:]!r}")
+
+    with StubJobBoard(SAMPLE_JOBS[:4], latency=0.2) as board_a, \
+            StubJobBoard(SAMPLE_JOBS[4:], response_format='json', latency=0.2, fail_first=1) as board_b, \
+            StubJobBoard([], fail_first=10, fail_status=404) as board_c:
+        adapters = [JobBoardAdapter('A', board_a.url + '/jobs'),
+                    JobBoardAdapter('B', board_b.url + '/jobs', response_format='json'),
+                    JobBoardAdapter('C', board_c.url + '/jobs')]
+        agent = JobSearchAgent({'required_skills': ['Python'], 'min_match_score': 20}, jobs=[])
+        with AsyncJobFetcher(adapters, retries=2, backoff=0.01) as fetcher:
+            start = time.perf_counter()
+            jobs = agent.fetch_jobs(fetcher, 'Python Engineer')
+            assert time.perf_counter() - start < 0.55  # sequential would take >= 0.6s
+            assert fetcher.stats['retries'] == 1 and fetcher.stats['failures'] == 1
+        assert len(board_c.requests) == 1  # 404 is not retried
+    assert {j['source'] for j in jobs} == {'LinkedIn', 'Amazon Jobs', 'Indeed'}
+    assert len(agent.search_jobs('Python')) == 4
+    print("✓ Job fetcher test passed")
+
+def test_rate_limited_batch_apply():
+    """Test auto_apply submits through the executor once per posting, within the per-domain rate"""
+    now = [0.0]
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=lambda: now[0],
+                         sleep=lambda s: now.__setitem__(0, now[0] + s))
+    for _ in range(6):
+        bucket.acquire()
+    assert now[0] == 2.0  # burst of 2, then 2 tokens per second
+
+    jobs = [dict(job, url=f"https://{'a' if i % 2 else 'b'}.example.com/jobs/{i}", match_score=50)
+            for i, job in enumerate(SAMPLE_JOBS * 2)]
+    agent = JobSearchAgent({'required_skills': ['Python']}, jobs=[])
+    with StubATS(latency=0.01, fail_first=1) as ats:
+        executor = BatchApplyExecutor(HttpATSAdapter(ats.url), workers=4, max_in_flight=4,
+                                      rate_per_domain=20.0, burst=1, backoff=0.01)
+        start = time.perf_counter()
+        agent.auto_apply(jobs, max_applications=len(jobs), executor=executor)
+        assert time.perf_counter() - start >= 0.2  # 6 postings per domain at 20/s after a burst of 1
+        agent.auto_apply(jobs, max_applications=len(jobs))  # already applied: nothing is resubmitted
+        assert len(ats.requests) == len(jobs) + 1  # one retry of the failed first request
+        assert len(ats.applications) == len(jobs)
+    assert len(agent.applied_jobs) == len(jobs)
+    assert {a['idempotency_key'] for a in agent.applied_jobs} == {idempotency_key(j) for j in jobs}
+    report = executor.report
+    assert report['skipped'] == len(jobs) and report['submitted'] == 0
+    print("✓ Batch apply test passed")
+
+def test_apply_retry_backoff_and_duplicate_urls():
+    """Test retryable HTTP errors back off (honoring Retry-After) and a duplicated URL is applied to once"""
+    def http_error(status, retry_after_header=None):
+        response = requests.Response()
+        response.status_code = status
+        if retry_after_header is not None:
+            response.headers['Retry-After'] = retry_after_header
+        return requests.HTTPError(response=response)
+    
+    class FlakyATS(DryRunATSAdapter):
+        def __init__(self, errors):
+            super().__init__()
+            self.errors = list(errors)
+        
+        def submit(self, job, key, applicant):
+            if self.errors:
+                raise self.errors.pop(0)
+            return super().submit(job, key, applicant)
+    
+    waits = []
+    executor = BatchApplyExecutor(FlakyATS([http_error(429, '3'), http_error(503)]), rate_per_domain=1000.0,
+                                  backoff=0.5, sleep=waits.append)
+    (_, record, error), = executor.run([dict(SAMPLE_JOBS[0])])
+    assert error is None and record['status'] == 'Applied'
+    assert waits == [3.0, 1.0]  # Retry-After, then backoff * 2 ** attempt
+    assert retry_after(http_error(503, 'Wed, 21 Oct 2015 07:28:00 GMT').response) == 0.0
+    assert retry_after(http_error(503).response) is None
+    
+    adapter = DryRunATSAdapter()
+    executor = BatchApplyExecutor(adapter, workers=4, rate_per_domain=1000.0)
+    jobs = [dict(SAMPLE_JOBS[0]), dict(SAMPLE_JOBS[1]), dict(SAMPLE_JOBS[0], title='Reposted')]
+    results = executor.run(jobs)
+    assert sorted(adapter.submissions) == sorted({idempotency_key(job) for job in jobs})
+    assert len(results) == 2 and executor.report['skipped'] == 1
+    print("✓ Apply backoff and duplicate URL test passed")
+
+def test_sharded_search_matches_single_agent():
+    """Test sharded multi-process search merges to the same results as one agent"""
+    jobs = [dict(job, url=f"{job['url']}/{i}") for i in range(10) for job in SAMPLE_JOBS]
+    preferences = {'required_skills': ['Python', 'AWS', 'machine learning'], 'remote_only': True,
+                   'min_match_score': 20}
+    single = JobSearchAgent(preferences, jobs=jobs)
+    expected = single.filter_jobs(single.search_jobs('Engineer Scientist'))
+
+    with tempfile.TemporaryDirectory() as tmp, \
+            ShardedJobSearch.from_jobs(preferences, jobs, tmp, num_shards=3) as sharded:
+        assert sum(sharded.shard_sizes()) == len(jobs)
+        assert len({shard_of(job, 3) for job in jobs}) == 3
+        merged = sharded.search_jobs('Engineer Scientist', limit=None)
+        assert [j['match_score'] for j in merged] == [j['match_score'] for j in expected]
+        assert sorted(j['url'] for j in merged) == sorted(j['url'] for j in expected)
+        top = sharded.search_jobs('Engineer Scientist', limit=5)
+        assert [j['match_score'] for j in top] == [j['match_score'] for j in expected[:5]]
+
+        sharded.update_preferences(remote_only=False)
+        single.update_preferences(remote_only=False)
+        assert [j['match_score'] for j in sharded.search_jobs('Engineer Scientist', limit=None)] == \
+            [j['match_score'] for j in single.filter_jobs(single.search_jobs('Engineer Scientist'))]
+    print("✓ Sharded search test passed")
+
+def test_posted_window_and_freshness():
+    """Test the posted-date window filter and that the freshness term matches across paths"""
+    now = time.time()
+    assert parse_posted('3 days ago', now) == now - 3 * DAY
+    assert parse_posted('2024-01-15') == parse_posted('2024-01-15T00:00:00Z')
+    assert parse_posted('Not specified') is None
+
+    ages = [0.1, 0.5, 1.5, 3, 10, 40, None]
+    jobs = [dict(job, url=f"{job['url']}/{i}",
+                 posted=time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(now - ages[i % len(ages)] * DAY))
+                 if ages[i % len(ages)] is not None else 'Not specified')
+            for i, job in enumerate(SAMPLE_JOBS * 3)]
+    preferences = {'required_skills': ['Python'], 'min_match_score': 20, 'posted_within_days': 2,
+                   'freshness_weight': 30, 'freshness_half_life_days': 1}
+    agent = JobSearchAgent(preferences, jobs=jobs)
+    found = agent.search_jobs('Engineer Scientist Developer', location='')
+    assert found and all(now - parse_posted(j['posted']) <= 2 * DAY for j in found)
+
+    batch = agent.filter_jobs(found)
+    top = agent.filter_jobs(found, limit=len(found))
+    assert [(j['url'], j['match_score']) for j in top] == [(j['url'], j['match_score']) for j in batch]
+    assert all(j['match_score'] == agent._calculate_match_score(j) for j in batch)
+    assert batch[0]['match_score'] == 20 + 10 + round(30 * 0.5 ** 0.1)  # skill + salary + newest posting
+
+    # Relative dates are resolved against the scorer's reference time, not the wall clock
+    relative = [dict(job, posted=f'{i} days ago') for i, job in enumerate(SAMPLE_JOBS[:4])]
+    then = now - 30 * DAY
+    expected = [agent._calculate_match_score(job, then) for job in relative]
+    assert BatchScorer(preferences, then).score(relative).tolist() == expected
+    assert [score for _, score in agent._score_chunks(relative, then)] == expected
+
+    store = JobStore()
+    store.add_jobs(jobs)
+    stored = JobSearchAgent(preferences, store=store).search_jobs('Engineer Scientist Developer', location='')
+    assert sorted(j['url'] for j in stored) == sorted(j['url'] for j in found)
+    print("✓ Posted-date window test passed")
+
+def test_location_normalization_and_distance_filter():
+    """Test location normalization and that grid-index distance queries match a full scan"""
+    hybrid = normalize_location('Hybrid (SF)')
+    assert (hybrid.place_id, hybrid.remote, hybrid.hybrid) == ('us-ca-san-francisco', False, True)
+    assert normalize_location('San Francisco, CA').place_id == 'us-ca-san-francisco'
+    assert normalize_location('Remote - US') == (None, None, None, True, False)
+
+    places = ['San Francisco, CA', 'Hybrid (SF)', 'Palo Alto, CA', 'Seattle, WA', 'New York, NY',
+              'Remote', 'Remote - US', 'London, UK', 'Nowhere Town', 'Vancouver, BC']
+    jobs = [dict(job, url=f"{job['url']}/{i}", location=places[i % len(places)])
+            for i, job in enumerate(SAMPLE_JOBS * 4)]
+    origin = normalize_location('San Francisco, CA')
+    grid = GeoGridIndex()
+    for i, job in enumerate(jobs):
+        grid.add(i, job['location'])
+    for km in (10, 100, 1500, 20000):
+        assert grid.within_ids(origin.lat, origin.lon, km) == \
+            [i for i, job in enumerate(jobs) if within_distance(job['location'], origin, km, include_remote=False)]
+
+    preferences = {'required_skills': ['Python'], 'remote_only': True, 'min_match_score': 10,
+                   'location': 'San Francisco, CA', 'max_distance_km': 100}
+    agent = JobSearchAgent(preferences, jobs=jobs)
+    found = agent.search_jobs('Engineer Scientist Developer', location='')
+    assert {j['location'] for j in found} == {'San Francisco, CA', 'Hybrid (SF)', 'Palo Alto, CA', 'Remote',
+                                              'Remote - US'}
+    batch = agent.filter_jobs(jobs)
+    top = agent.filter_jobs(jobs, limit=len(jobs))
+    assert [(j['url'], j['match_score']) for j in top] == [(j['url'], j['match_score']) for j in batch]
+    assert all(j['match_score'] == agent._calculate_match_score(j) for j in batch)
+    assert {j['location'] for j in batch} <= {j['location'] for j in found}
+
+    agent.preferences['include_remote'] = False
+    assert {j['location'] for j in agent.search_jobs('Engineer Scientist Developer', location='')} == \
+        {'San Francisco, CA', 'Hybrid (SF)', 'Palo Alto, CA'}
+    print("✓ Location normalization test passed")
+
+def test_generate_packages_batch():
+    """Test batch package generation matches per-job output and reports failures in place"""
+    profile = {
+        'name': 'Test User', 'email': 'test@example.com', 'phone': '555-1234', 'location': 'Test City',
+        'skills': ['Python', 'AWS', 'Docker'], 'years_experience': 5, 'education': [],
+        'experience': [{'title': 'Engineer', 'company': 'Old Corp', 'duration': '2020 - Present',
+                        'bullets': ['Built Python services on AWS.', 'Ran Docker fleets.']}]
+    }
+    jobs = [dict(job) for job in SAMPLE_JOBS] + [{'title': 'No Company', 'description': ''}]
+    generator = ApplicationPackageGenerator(profile)
+    expected = [generator.generate_package(job) for job in SAMPLE_JOBS]
+
+    for executor in ('thread', 'process'):
+        results = list(generator.generate_packages(jobs, workers=2, executor=executor))
+        assert [r.index for r in results] == list(range(len(jobs)))
+        assert all(r.job is job for r, job in zip(results, jobs))
+        assert isinstance(results[-1].error, KeyError) and results[-1].package is None
+        for result, package in zip(results, expected):
+            assert result.error is None
+            assert (result.package['resume'], result.package['cover_letter']) == \
+                (package['resume'], package['cover_letter'])
+
+    unordered = list(generator.generate_packages(jobs, workers=3, ordered=False, executor='thread'))
+    assert sorted(r.index for r in unordered) == list(range(len(jobs)))
+    print("✓ Batch package generation test passed")
+
+def test_compiled_profile_reused_and_invalidated():
+    """Test the compiled profile is shared across jobs and rebuilt when the profile changes"""
+    profile = {
+        'name': 'Test User', 'email': 'test@example.com', 'phone': '555-1234', 'location': 'Test City',
+        'skills': ['Python', 'AWS'], 'years_experience': 5, 'education': [],
+        'experience': [{'title': 'Engineer', 'company': 'Old Corp', 'duration': '2020 - Present',
+                        'bullets': ['Ran Docker fleets.', 'Built Python services on AWS.']}]
+    }
+    generator = ApplicationPackageGenerator(profile)
+    generator.generate_package(SAMPLE_JOBS[0])
+    compiled = generator.resume_gen.compiled
+    generator.generate_package(SAMPLE_JOBS[1])
+    assert generator.resume_gen.compiled is compiled is generator.cover_letter_gen.compiled
+    assert compile_profile(dict(profile)) is compiled  # equal contents share one compiled version
+
+    profile['skills'].append('Docker')
+    profile['experience'][0]['bullets'][0] = 'Ran Docker and Kubernetes fleets.'
+    second = generator.generate_package(SAMPLE_JOBS[0])
+    assert generator.resume_gen.compiled is not compiled
+    assert compiled.skills == ['Python', 'AWS']  # the old version kept its own copy
+    assert second['resume']['skills'][:3] == ['Python', 'AWS', 'Docker']
+    assert 'Ran Docker and Kubernetes fleets.' in second['resume']['experience'][0]['bullets']
+    print("✓ Compiled profile test passed")
+
+def test_batch_resumes_match_per_job():
+    """Test matrix-ranked batch resumes equal per-job resumes, including bullet ties"""
+    profile = {
+        'name': 'Test User', 'email': 'test@example.com', 'phone': '555-1234', 'location': 'Test City',
+        'skills': ['Python', 'AWS', 'Docker', 'SQL'], 'years_experience': 5, 'education': [],
+        'experience': [
+            {'title': 'Engineer', 'company': 'Old Corp', 'duration': '2020 - Present',
+             'bullets': ['Ran Docker fleets', 'Wrote SQL reports', 'Built Python services on AWS',
+                         'Shipped Python and Docker tooling', 'Tuned SQL on AWS', 'Mentored interns']},
+            {'title': 'Intern', 'company': 'Tiny Co', 'duration': '2019', 'bullets': []}
+        ]
+    }
+    jobs = [dict(job) for job in SAMPLE_JOBS]
+    jobs += [{'title': f'Role {i}', 'company': 'Acme', 'description': ' '.join(TECH_KEYWORDS[i:i + 4])}
+             for i in range(0, len(TECH_KEYWORDS), 3)]
+    jobs.append({'title': 'No keywords', 'company': 'Acme', 'description': 'Gardening'})
+    generator = ResumeGenerator(profile)
+    assert generator.generate_resumes(jobs) == [generator.generate_resume(job) for job in jobs]
+    print("✓ Batch resume test passed")
+
+def test_package_cache_hits_and_eviction():
+    """Test repeated packages come from the cache, survive a restart on disk and are evicted by size"""
+    profile = {
+        'name': 'Test User', 'email': 'test@example.com', 'phone': '555-1234', 'location': 'Test City',
+        'skills': ['Python', 'AWS'], 'years_experience': 5, 'education': [],
+        'experience': [{'title': 'Engineer', 'company': 'Old Corp', 'duration': '2020 - Present',
+                        'bullets': ['Built Python services on AWS.']}]
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = PackageCache(tmp)
+        generator = ApplicationPackageGenerator(profile, cache=cache)
+        first = generator.generate_package(SAMPLE_JOBS[0])
+        first['resume']['skills'].append('Mutated')  # callers own their copy
+        again = generator.generate_package(dict(SAMPLE_JOBS[0], location='Elsewhere'))
+        assert cache.hits == 1 and cache.misses == 1
+        assert again['resume']['skills'] == ['Python', 'AWS']
+        assert again['generated_at'] == first['generated_at']
+        assert again['job']['location'] == 'Elsewhere'
+
+        # Same contents in a fresh process: served from disk
+        cold = ApplicationPackageGenerator(dict(profile), cache=PackageCache(tmp))
+        assert cold.generate_package(SAMPLE_JOBS[0])['cover_letter'] == again['cover_letter']
+        assert cold.cache.disk_hits == 1
+
+        # A changed profile or job description is a different package
+        profile['skills'].append('Docker')
+        generator.generate_package(SAMPLE_JOBS[0])
+        generator.generate_package(dict(SAMPLE_JOBS[0], description='Go and Rust'))
+        assert cache.misses == 3
+
+        results = list(generator.generate_packages(SAMPLE_JOBS[:3], workers=2))
+        assert [r.index for r in results] == [0, 1, 2] and all(r.error is None for r in results)
+        assert cache.hits == 2  # the batch reused the package for SAMPLE_JOBS[0]
+
+        small = PackageCache(tmp, max_items=1, max_disk_bytes=1)
+        small.put('a', first)
+        small.put('b', first)
+        assert small.stats()['disk_entries'] == 1 and small.stats()['memory_entries'] == 1
+        assert small.get('a') is None and small.get('b')['resume'] == first['resume']
+
+    tracker = ApplicationTracker()
+    tracker.add_application('Engineer', 'Acme')
+    assert tracker.find_application('Engineer', 'Acme')['id'] == 1
+    assert tracker.find_application('Engineer', 'Other') is None
+    print("✓ Package cache test passed")
+
+def test_layout_templates():
+    """Test compiled layouts render the resume text and honour custom layout files"""
+    profile = {
+        'name': 'Test User', 'email': 'test@example.com', 'phone': '555-1234', 'location': 'Test City',
+        'linkedin': 'linkedin.com/in/test', 'skills': ['Python', 'AWS'], 'years_experience': 5,
+        'education': [{'degree': 'BS', 'school': 'State', 'year': '2015'}],
+        'experience': [{'title': 'Engineer', 'company': 'Old Corp', 'duration': '2020 - Present',
+                        'bullets': ['Built Python services on AWS.', 'Cut costs 40%.']}]
+    }
+    generator = ApplicationPackageGenerator(profile)
+    package = generator.generate_package(SAMPLE_JOBS[0])
+    text = generator.resume_gen.format_resume_text(package['resume'])
+    assert text.startswith("TEST USER\ntest@example.com | 555-1234 | Test City\nLinkedIn: linkedin.com/in/test\n\n")
+    assert "\n\nEngineer | Old Corp\n2020 - Present\n  • Built Python services on AWS.\n  • Cut costs 40%.\n\n" in text
+    assert text.endswith("EDUCATION\n" + "-" * 50 + "\nBS - State (2015)")
+    out = io.StringIO()
+    generator.resume_gen.write_resume_text(package['resume'], out)
+    assert out.getvalue() == text
+
+    letter = generator.cover_letter_gen.format_cover_letter_text(package['cover_letter'])
+    assert letter.startswith("Test User\ntest@example.com\n555-1234\n\n")
+    assert letter.endswith("\n\nSincerely,\nTest User")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        layout = os.path.join(tmp, 'short.txt')
+        with open(layout, 'w') as f:
+            f.write("{{ header.name }}: {{ skills|join:\" / \" }}{% if missing %}!{% else %}.{% endif %}\n")
+        custom = ApplicationPackageGenerator(profile, resume_layout=layout)
+        assert custom.resume_gen.format_resume_text(package['resume']) == "Test User: Python / AWS."
+
+    template = Template("{% for n in nums %}{{ n }},{% endfor %}")
+    assert template.render_text({'nums': [1, 2]}) == "1,2," and template.render_text({'nums': []}) == ""
+    for bad in ("{% for x in xs %}", "{{ name|shout }}", "{% endif %}"):
+        try:
+            Template(bad)
+            assert False, bad
+        except TemplateError:
+            pass
+    print("✓ Layout templates test passed")
+
+def test_save_packages_archive():
+    """Test many packages stream into one zip or tar archive with a manifest and unique names"""
+    profile = {
+        'name': 'Test User', 'email': 'test@example.com', 'phone': '555-1234', 'location': 'Test City',
+        'skills': ['Python', 'AWS'], 'years_experience': 5, 'education': [],
+        'experience': [{'title': 'Engineer', 'company': 'Old Corp', 'duration': '2020 - Present',
+                        'bullets': ['Built Python services on AWS.']}]
+    }
+    generator = ApplicationPackageGenerator(profile)
+    jobs = SAMPLE_JOBS[:3] + [dict(SAMPLE_JOBS[0], url='https://example.com/other')]  # a title collision
+    packages = [generator.generate_package(job) for job in jobs]
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ('packages.zip', 'packages.tar.gz'):
+            path = os.path.join(tmp, name)
+            assert generator.save_packages(iter(packages), path) == len(packages)
+            manifest = read_manifest(path)
+            assert [entry['url'] for entry in manifest] == [job['url'] for job in jobs]
+            assert len({entry['directory'] for entry in manifest}) == len(jobs)
+            first = manifest[0]['directory']
+            if name.endswith('.zip'):
+                with zipfile.ZipFile(path) as archive:
+                    resume = archive.read(first + '/resume.txt').decode('utf-8')
+                    letter = archive.read(first + '/cover_letter.txt').decode('utf-8')
+            else:
+                with tarfile.open(path) as archive:
+                    resume = archive.extractfile(first + '/resume.txt').read().decode('utf-8')
+                    letter = archive.extractfile(first + '/cover_letter.txt').read().decode('utf-8')
+            assert resume == generator.resume_gen.format_resume_text(packages[0]['resume'])
+            assert letter == generator.cover_letter_gen.format_cover_letter_text(packages[0]['cover_letter'])
+        try:
+            generator.save_packages(packages, os.path.join(tmp, 'packages.rar'))
+            assert False
+        except ValueError:
+            pass
+    print("✓ Package archive test passed")
+
+def test_regenerate_package_rebuilds_changed_sections():
+    """Test regenerating after a job edit rebuilds only sections whose inputs changed, matching a fresh package"""
+    profile = {
+        'name': 'Test User', 'email': 'test@example.com', 'phone': '555-1234', 'location': 'Test City',
+        'skills': ['Python', 'AWS', 'Docker'], 'years_experience': 5, 'education': [],
+        'experience': [{'title': 'Engineer', 'company': 'Old Corp', 'duration': '2020 - Present',
+                        'bullets': ['Built Python services on AWS.', 'Shipped Docker images.']}]
+    }
+    generator = ApplicationPackageGenerator(profile)
+    job = {'title': 'Backend Engineer', 'company': 'Acme', 'description': 'Python and AWS services.'}
+    previous = generator.generate_package(job)
+    
+    # Reworded, same technologies: nothing to rebuild
+    reworded = dict(job, description='We build AWS services in Python.')
+    package, changes = generator.regenerate_package(reworded, previous)
+    assert changes == {'resume': {}, 'cover_letter': {}}
+    assert package['resume'] == previous['resume'] and package['job'] is reworded
+    
+    # A new technology: only keyword-dependent resume sections change
+    edited = dict(job, description='Python, AWS and Kubernetes services.')
+    package, changes = generator.regenerate_package(edited, previous)
+    fresh = generator.generate_package(edited)
+    assert package['resume'] == fresh['resume'] and package['cover_letter'] == fresh['cover_letter']
+    assert set(changes['resume']) <= {'summary', 'skills', 'experience', 'match_score'}
+    assert changes['resume']['match_score'] == {'before': previous['resume']['match_score'],
+                                                'after': fresh['resume']['match_score']}
+    assert changes['cover_letter'] == {}
+    
+    # Another company and an old letter date touch the cover letter, not the resume
+    previous['cover_letter']['date'] = 'January 01, 2020'
+    moved = dict(job, company='Globex')
+    package, changes = generator.regenerate_package(moved, previous)
+    assert changes['resume'] == {}
+    assert set(changes['cover_letter']) == {'date', 'greeting', 'opening', 'body', 'closing'}
+    assert package['cover_letter'] == generator.generate_package(moved)['cover_letter']
+    
+    # A profile edit rebuilds everything it feeds
+    profile['skills'].append('Kubernetes')
+    package, changes = generator.regenerate_package(job, previous)
+    assert 'skills' in changes['resume'] and package['resume']['skills'][-1] == 'Kubernetes'
+    assert package['profile_fingerprint'] != previous['profile_fingerprint']
+    print("✓ Incremental package regeneration test passed")
+
+def test_job_analysis_shared_across_agents():
+    """Test a posting is parsed once into a JobAnalysis that every agent reads"""
+    posting = {'title': 'Senior Staff ML Engineer', 'company': 'Acme', 'location': 'Remote - US',
+               'description': 'Machine learning with Python on AWS. Kubernetes a plus.',
+               'salary': '$150k-$180k', 'url': 'https://example.com/analysis'}
+    job = Job(posting)
+    analysis = analyze_job(job)
+    assert job.analysis is analysis and 'analysis' not in job and 'analysis' not in dict(job)
+    assert analysis.skills == ('Python', 'AWS', 'Machine Learning', 'Kubernetes') and analysis.remote
+    assert analysis.text.startswith('senior staff ml engineer machine learning')
+    
+    # Every agent reuses the attached analysis instead of scanning the text again
+    agent = JobSearchAgent({'required_skills': ['Python', 'AWS', 'Engineer'], 'remote_only': True})
+    assert agent._calculate_match_score(job) == 20 * 3 + 30 + 10
+    profile = {
+        'name': 'Test User', 'email': 'test@example.com', 'phone': '555-1234', 'location': 'Test City',
+        'skills': ['Python', 'AWS'], 'years_experience': 5, 'education': [], 'experience': []
+    }
+    resume = ResumeGenerator(profile).generate_resume(job)
+    assert 'specializing in Python, AWS, Machine Learning.' in resume['summary']
+    assert resume['match_score'] == 50
+    questions = InterviewPrepAgent(profile, job)._generate_technical_questions()
+    assert any('GIL' in q['question'] for q in questions) and any('S3' in q['question'] for q in questions)
+    assert analyze_job(job) is analysis
+    
+    # Plain dicts are left untouched and share the analysis memoized by content hash
+    copy = dict(posting)
+    assert analyze_job(copy) is analysis and copy == posting
+    package = ApplicationPackageGenerator(profile).generate_package(copy)
+    assert package['job'] == posting and json.dumps(package)
+    # Edits get a fresh one
+    job['description'] = 'Java services.'
+    assert job.analysis is None and analyze_job(job).skills == ('Java',)
+    assert analyze_job(dict(posting, description='Java services.')) is job.analysis
+    assert memoized_analysis(dict(posting, title='Go Engineer')) is None
+    print("✓ Shared job analysis test passed")
+
 if __name__ == '__main__':
     try:
         test_job_search_agent()
         test_resume_generator()
         test_application_tracker()
+        test_job_index_matches_substring_scan()
+        test_batch_scorer_matches_per_job_score()
+        test_filter_jobs_top_k_streaming()
+        test_streaming_job_sources()
+        test_job_store_search_pushdown()
+        test_job_store_matches_index()
+        test_job_record_dict_view()
+        test_keyword_matcher_substring_semantics()
+        test_semantic_scoring_mode()
+        test_near_duplicate_postings_collapsed()
+        test_incremental_rescoring_on_preference_change()
+        test_bounded_job_history()
+        test_salary_parsing_and_range_queries()
+        test_concurrent_job_fetching()
+        test_rate_limited_batch_apply()
+        test_apply_retry_backoff_and_duplicate_urls()
+        test_sharded_search_matches_single_agent()
+        test_posted_window_and_freshness()
+        test_location_normalization_and_distance_filter()
+        test_generate_packages_batch()
+        test_compiled_profile_reused_and_invalidated()
+        test_batch_resumes_match_per_job()
+        test_package_cache_hits_and_eviction()
+        test_layout_templates()
+        test_save_packages_archive()
+        test_regenerate_package_rebuilds_changed_sections()
+        test_job_analysis_shared_across_agents()
         print("\n🎉 All tests passed!")
     except Exception as e:
         print(f"❌ Test failed: {e}")